@@ -0,0 +1,333 @@
+bl_info = {
+    "name": "AutoLMbyAman",
+    "author": "Aman",
+    "version": (2, 3),
+    "blender": (4, 0, 0),
+    "location": "View3D > Sidebar > AutoLMbyAman (N Panel)",
+    "description": "Create and manage dot labels with animation data export (Blender 4.0+) - Version 2.3",
+    "category": "Add-ons",
+    "support": "COMMUNITY",
+    "doc_url": "https://github.com/Amank12721/AutoLM_aman_2_0/releases",
+    "tracker_url": "https://github.com/Amank12721/AutoLM_aman_2_0/issues",
+    "update_url": "https://raw.githubusercontent.com/Amank12721/AutoLM_aman_2_0/main/version.json"
+}
+
+# Heavy modules (numpy, the HTML report, the update checker, the spelling
+# suggester) are imported on first use so that enabling the addon stays fast.
+import sys
+
+import bpy
+
+from .label_store import (
+    LabelDataItem,
+    LabelTranslation,
+    _detach_copied_refs_later,
+    _migrate_after_register,
+    _on_depsgraph_update_label_store,
+    _on_load_post_label_store,
+    _on_undo_redo_label_store,
+)
+from .label_overlay import (
+    _on_depsgraph_update_label_overlay,
+    _update_show_label_overlay,
+    disable_label_overlay,
+    draw_label_overlay,
+)
+from .labels import (
+    _on_depsgraph_update_label_index,
+    _on_load_post_label_index,
+    _on_load_post_label_preview,
+    _update_label_visibility_preview,
+    disable_label_visibility_preview,
+)
+from .operators import (
+    DOT_OT_add_timeline_markers,
+    DOT_OT_add_word_to_dictionary,
+    DOT_OT_create_label,
+    DOT_OT_edit_properties,
+    DOT_OT_edit_translation,
+    DOT_OT_export_data,
+    DOT_OT_export_glb,
+    DOT_OT_find_overlapping_labels,
+    DOT_OT_jump_to_label,
+    DOT_OT_quick_create_label,
+    DOT_OT_renumber_labels,
+    DOT_OT_select_nearest_label,
+    DOT_OT_select_pair,
+    DOT_OT_shift_animation,
+    DOT_OT_sync_markers_to_data,
+    DOT_OT_toggle_performance_monitor,
+    DOT_OT_toggle_trace_recording,
+    DOT_OT_use_last_marker_range,
+    DOT_OT_validate_labels,
+    DOT_OT_viewport_benchmark,
+)
+from .pairing import (
+    _on_depsgraph_update_pairing,
+    _on_load_post_pairing,
+    subscribe_rename_notifications,
+    unsubscribe_rename_notifications,
+)
+from .panels import DOT_PT_label_panel, _refresh_scene_summary
+from .preferences import AUTOLM_OT_check_for_updates, AutoLMbyAmanPreferences
+from .profiling import (
+    _on_load_post_performance,
+    _refresh_overlay_snapshot,
+    _update_show_performance_stats,
+    draw_performance_stats,
+)
+from .spatial import _on_depsgraph_update_spatial, _on_load_post_spatial
+
+# List to hold drawing handlers
+_draw_handlers = []
+
+def register():
+    # Scene-level label data store, referenced by the dot and label objects
+    bpy.utils.register_class(LabelTranslation)
+    bpy.utils.register_class(LabelDataItem)
+    bpy.types.Scene.label_data_store = bpy.props.CollectionProperty(type=LabelDataItem)
+
+    # Add performance monitoring properties
+    bpy.types.Scene.label_visibility_preview = bpy.props.BoolProperty(
+        name="Preview Label Timing",
+        description="Show dots and labels only during their animation range while scrubbing or playing",
+        default=False,
+        update=_update_label_visibility_preview
+    )
+    bpy.types.Scene.report_mode = bpy.props.EnumProperty(
+        name="Report Mode",
+        description="How the HTML report of the label data export is written",
+        items=[
+            ('FULL', "Single File", "Write every label into one self-contained HTML file"),
+            ('PAGED', "Paged", "Write a small HTML page plus a compact data file, shown as a searchable, "
+                               "paginated table; for scenes with many thousands of objects"),
+        ],
+        default='FULL'
+    )
+    bpy.types.Scene.label_json_format = bpy.props.EnumProperty(
+        name="Label File Format",
+        description="Layout of the exported label JSON file",
+        items=[
+            ('PRETTY', "Indented JSON", "JSON array indented for reading"),
+            ('COMPACT', "Compact JSON", "JSON array without whitespace"),
+            ('NDJSON', "NDJSON", "One compact JSON label per line (.ndjson), for streaming ingestion"),
+        ],
+        default='PRETTY'
+    )
+    bpy.types.Scene.label_json_compression = bpy.props.EnumProperty(
+        name="Label File Compression",
+        description="Compress the exported label file",
+        items=[
+            ('NONE', "None", "Write the file uncompressed"),
+            ('GZIP', "gzip", "Compress with gzip (.gz)"),
+            ('ZSTD', "zstd", "Compress with zstd (.zst); needs Python 3.14+ or the zstandard package, "
+                             "falls back to gzip otherwise"),
+        ],
+        default='NONE'
+    )
+    bpy.types.Scene.label_languages = bpy.props.StringProperty(
+        name="Export Languages",
+        description="Comma separated language codes written to the label file, e.g. en, de, fr. "
+                    "Labels without a translation for a language leave it out",
+        default="en"
+    )
+    bpy.types.Scene.label_overlap_radius = bpy.props.FloatProperty(
+        name="Overlap Radius",
+        description="Dots closer than this are reported as overlapping labels",
+        default=0.05,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+    bpy.types.Scene.show_label_overlay = bpy.props.BoolProperty(
+        name="Label Overlay",
+        description="Draw label names and descriptions in the viewport, hiding labels that would overlap "
+                    "or are out of view, instead of showing every object name",
+        default=False,
+        update=_update_show_label_overlay
+    )
+    bpy.types.Scene.label_overlay_budget = bpy.props.FloatProperty(
+        name="Overlay Budget (ms)",
+        description="Time the label overlay may take per redraw; fewer labels are drawn when it runs over",
+        default=2.0,
+        min=0.1,
+        max=50.0
+    )
+    bpy.types.Scene.report_minify = bpy.props.BoolProperty(
+        name="Minify HTML Report",
+        description="Strip indentation and line breaks from the exported HTML report",
+        default=False
+    )
+    bpy.types.Scene.show_performance_stats = bpy.props.BoolProperty(
+        name="Show Performance Stats",
+        description="Display performance monitoring statistics",
+        default=False,
+        update=_update_show_performance_stats
+    )
+    
+    bpy.utils.register_class(AutoLMbyAmanPreferences)
+    bpy.utils.register_class(DOT_OT_create_label)
+    bpy.utils.register_class(DOT_OT_export_data)
+    bpy.utils.register_class(DOT_OT_export_glb)
+    bpy.utils.register_class(DOT_OT_edit_properties)
+    bpy.utils.register_class(DOT_OT_edit_translation)
+    bpy.utils.register_class(DOT_OT_select_pair)
+    bpy.utils.register_class(DOT_OT_jump_to_label)
+    bpy.utils.register_class(DOT_OT_validate_labels)
+    bpy.utils.register_class(DOT_OT_renumber_labels)
+    bpy.utils.register_class(DOT_OT_select_nearest_label)
+    bpy.utils.register_class(DOT_OT_find_overlapping_labels)
+    bpy.utils.register_class(DOT_OT_shift_animation)
+    bpy.utils.register_class(DOT_OT_add_timeline_markers)
+    bpy.utils.register_class(DOT_OT_sync_markers_to_data)
+    bpy.utils.register_class(DOT_OT_quick_create_label)
+    bpy.utils.register_class(DOT_OT_use_last_marker_range)
+    bpy.utils.register_class(DOT_OT_add_word_to_dictionary)
+    bpy.utils.register_class(AUTOLM_OT_check_for_updates)
+    bpy.utils.register_class(DOT_OT_toggle_performance_monitor)
+    bpy.utils.register_class(DOT_OT_toggle_trace_recording)
+    bpy.utils.register_class(DOT_OT_viewport_benchmark)
+    bpy.utils.register_class(DOT_PT_label_panel)
+    
+    # Keep the label interval index in sync with scene edits
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update_label_index)
+    # Shift+D copies of dots and labels get label data of their own
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update_label_store)
+    bpy.app.handlers.load_post.append(_on_load_post_label_store)
+    bpy.app.handlers.undo_post.append(_on_undo_redo_label_store)
+    bpy.app.handlers.redo_post.append(_on_undo_redo_label_store)
+    bpy.app.handlers.load_post.append(_on_load_post_label_index)
+    # Keep the dot/label pairing index in sync with renames, additions and deletions
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update_pairing)
+    bpy.app.handlers.load_post.append(_on_load_post_pairing)
+    subscribe_rename_notifications()
+    # Rebuild the dot KD-tree only after dots move
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update_spatial)
+    bpy.app.handlers.load_post.append(_on_load_post_spatial)
+    # Drop labels the user hides from the overlay
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update_label_overlay)
+    bpy.app.handlers.load_post.append(_on_load_post_label_preview)
+    bpy.app.handlers.load_post.append(_on_load_post_performance)
+
+    # Move label data saved by older versions into the store once bpy.data is available
+    bpy.app.timers.register(_migrate_after_register, first_interval=0.0)
+
+    # Label overlay first, so the performance stats draw on top of it
+    _draw_handlers.append(bpy.types.SpaceView3D.draw_handler_add(
+        draw_label_overlay, (), 'WINDOW', 'POST_PIXEL'))
+    # Add performance monitoring draw handler
+    _draw_handlers.append(bpy.types.SpaceView3D.draw_handler_add(
+        draw_performance_stats, (), 'WINDOW', 'POST_PIXEL'))
+
+    # Register the keyboard shortcuts
+    wm = bpy.context.window_manager
+    km = wm.keyconfigs.addon.keymaps.new(name='Object Mode', space_type='EMPTY')
+    
+    # Quick create label shortcut (Ctrl+Shift+Q)
+    kmi = km.keymap_items.new('dot.quick_create_label', 'Q', 'PRESS', ctrl=True, shift=True)
+    
+    # Toggle performance monitor shortcut (Ctrl+Shift+P)
+    kmi = km.keymap_items.new('dot.toggle_performance_monitor', 'P', 'PRESS', ctrl=True, shift=True)
+
+def unregister():
+    # Remove drawing handlers
+    for handler in _draw_handlers:
+        bpy.types.SpaceView3D.draw_handler_remove(handler, 'WINDOW')
+    _draw_handlers.clear()
+
+    if _on_depsgraph_update_label_index in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update_label_index)
+    if _on_depsgraph_update_label_store in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update_label_store)
+    if _on_load_post_label_store in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post_label_store)
+    if _on_undo_redo_label_store in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(_on_undo_redo_label_store)
+    if _on_undo_redo_label_store in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.remove(_on_undo_redo_label_store)
+    if _on_load_post_label_index in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post_label_index)
+    if _on_depsgraph_update_pairing in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update_pairing)
+    if _on_load_post_pairing in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post_pairing)
+    unsubscribe_rename_notifications()
+    if _on_depsgraph_update_spatial in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update_spatial)
+    if _on_load_post_spatial in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post_spatial)
+    if _on_depsgraph_update_label_overlay in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update_label_overlay)
+    if _on_load_post_label_preview in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post_label_preview)
+    if _on_load_post_performance in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post_performance)
+    if bpy.app.timers.is_registered(_refresh_overlay_snapshot):
+        bpy.app.timers.unregister(_refresh_overlay_snapshot)
+    if bpy.app.timers.is_registered(_migrate_after_register):
+        bpy.app.timers.unregister(_migrate_after_register)
+    if bpy.app.timers.is_registered(_detach_copied_refs_later):
+        bpy.app.timers.unregister(_detach_copied_refs_later)
+    if bpy.app.timers.is_registered(_refresh_scene_summary):
+        bpy.app.timers.unregister(_refresh_scene_summary)
+    # Modules loaded on first use install their own handlers and timers
+    keyframes = sys.modules.get(__package__ + ".keyframes")
+    if keyframes:
+        keyframes.remove_handlers()
+    updater = sys.modules.get(__package__ + ".updater")
+    if updater and bpy.app.timers.is_registered(updater._poll_update_check):
+        bpy.app.timers.unregister(updater._poll_update_check)
+    translations = sys.modules.get(__package__ + ".translations")
+    if translations:
+        translations.close_translation_memory()
+    disable_label_visibility_preview()
+    disable_label_overlay()
+    
+    # Remove performance monitoring properties
+    del bpy.types.Scene.show_performance_stats
+    del bpy.types.Scene.label_visibility_preview
+    del bpy.types.Scene.report_minify
+    del bpy.types.Scene.report_mode
+    del bpy.types.Scene.label_json_format
+    del bpy.types.Scene.label_json_compression
+    del bpy.types.Scene.label_languages
+    del bpy.types.Scene.label_overlap_radius
+    del bpy.types.Scene.show_label_overlay
+    del bpy.types.Scene.label_overlay_budget
+    
+    bpy.utils.unregister_class(DOT_OT_create_label)
+    bpy.utils.unregister_class(DOT_OT_export_data)
+    bpy.utils.unregister_class(DOT_OT_export_glb)
+    bpy.utils.unregister_class(DOT_OT_edit_properties)
+    bpy.utils.unregister_class(DOT_OT_edit_translation)
+    bpy.utils.unregister_class(DOT_OT_select_pair)
+    bpy.utils.unregister_class(DOT_OT_jump_to_label)
+    bpy.utils.unregister_class(DOT_OT_validate_labels)
+    bpy.utils.unregister_class(DOT_OT_renumber_labels)
+    bpy.utils.unregister_class(DOT_OT_select_nearest_label)
+    bpy.utils.unregister_class(DOT_OT_find_overlapping_labels)
+    bpy.utils.unregister_class(DOT_OT_shift_animation)
+    bpy.utils.unregister_class(DOT_OT_add_timeline_markers)
+    bpy.utils.unregister_class(DOT_OT_sync_markers_to_data)
+    bpy.utils.unregister_class(DOT_OT_quick_create_label)
+    bpy.utils.unregister_class(DOT_OT_use_last_marker_range)
+    bpy.utils.unregister_class(DOT_OT_add_word_to_dictionary)
+    bpy.utils.unregister_class(AUTOLM_OT_check_for_updates)
+    bpy.utils.unregister_class(DOT_OT_toggle_performance_monitor)
+    bpy.utils.unregister_class(DOT_OT_toggle_trace_recording)
+    bpy.utils.unregister_class(DOT_OT_viewport_benchmark)
+    bpy.utils.unregister_class(DOT_PT_label_panel)
+    # The store stays in saved files; only the property definition goes away
+    del bpy.types.Scene.label_data_store
+    bpy.utils.unregister_class(LabelDataItem)
+    bpy.utils.unregister_class(LabelTranslation)
+
+    # Remove the keyboard shortcuts
+    wm = bpy.context.window_manager
+    km = wm.keyconfigs.addon.keymaps.get('Object Mode')
+    if km:
+        for kmi in km.keymap_items:
+            if kmi.idname in ['dot.quick_create_label', 'dot.toggle_performance_monitor']:
+                km.keymap_items.remove(kmi)
+
+if __name__ == "__main__":
+    register()
\ No newline at end of file
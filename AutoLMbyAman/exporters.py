@@ -0,0 +1,400 @@
+"""Label data export, loaded the first time the export operator runs."""
+
+import json
+import os
+from datetime import datetime
+from urllib.parse import quote
+
+import bpy
+
+from . import bl_info
+from .keyframes import analyze_action, get_action_keyframes
+from .label_json import iter_label_entries, label_json_path, open_label_json, write_label_entries
+from .label_store import get_label_data
+from .labels import build_label_interval_index
+from .pairing import get_label_pair_index
+from .profiling import profiler
+from .report import escape_all, get_report_templates
+from .spatial import get_label_spatial_index
+from .suggester import get_description_suggester
+from .translations import parse_languages, resolve_label_translations
+
+def _collect_label_rows(label_groups):
+    """Return one (NNN number, label name, mesh name, description, animdata, dot name, dot keyframes) row per group.
+
+    The label fields are None when the group has no label object, the dot
+    fields when it has no dot; dot keyframes is a list of frames or None.
+    """
+    rows = []
+    for num in sorted(label_groups.keys()):
+        group = label_groups[num]
+        dot_obj = group.get("dot")
+        label_obj = group.get("label")
+
+        label_fields = (None, None, None, None)
+        if label_obj:
+            label_mesh_data_name = label_obj.data.name if label_obj.data else "No Mesh Data"
+            description = "No description"
+            animdata = "No animation data"
+            if group.get("data") is not None:
+                description = group["data"].get("description", "No description")
+                animdata = group["data"].get("animdata", "No animation data")
+            label_fields = (label_obj.name, label_mesh_data_name, description, animdata)
+
+        dot_fields = (None, None)
+        if dot_obj:
+            keyframes = None
+            if dot_obj.animation_data and dot_obj.animation_data.action:
+                frames = get_action_keyframes(dot_obj.animation_data.action).get_frames("scale")
+                if len(frames):
+                    keyframes = frames.tolist()
+            dot_fields = (dot_obj.name, keyframes)
+
+        rows.append((f"{num:03d}",) + label_fields + dot_fields)
+    return rows
+
+def _render_label_groups(templates, rows):
+    """Render the Labels tab; the per-group text and fragments are freed on return."""
+    # Escape the text of every group in one pass
+    texts = []
+    for _, label_name, mesh_name, description, animdata, dot_name, keyframes in rows:
+        if label_name is not None:
+            texts += (label_name, mesh_name, description, animdata)
+        if dot_name is not None:
+            texts.append(dot_name)
+    escaped = iter(escape_all(texts))
+
+    # Render each group from its precompiled fragments and join once
+    label_group_parts = []
+    for num, label_name, _, _, _, dot_name, keyframes in rows:
+        items = ""
+        if label_name is not None:
+            items += templates.label_item.render(
+                name=next(escaped), mesh_name=next(escaped), description=next(escaped), animdata=next(escaped))
+        if dot_name is not None:
+            animation_info = f"Keyframes at frames: {keyframes}" if keyframes else "No animation"
+            items += templates.dot_item.render(name=next(escaped), animation=animation_info)
+        label_group_parts.append(templates.label_group.render(number=num, items=items))
+    return "".join(label_group_parts)
+
+def _render_animation_details(templates, animation_details):
+    """Render one animation item per (object name, action name, other users, ActionAnalysis)."""
+    animation_parts = []
+    animation_texts = iter(escape_all(
+        text for name, action_name, _, analysis in animation_details
+        for text in (name, action_name, ", ".join(analysis.data_paths))))
+    for _, _, other_users, analysis in animation_details:
+        first_frame, last_frame, duration = analysis.frame_range
+        animation_parts.append(templates.animation_item.render(
+            name=next(animation_texts),
+            action=next(animation_texts),
+            sharing=f" (shared with {other_users} other objects)" if other_users else "",
+            data_paths=next(animation_texts),
+            duration=duration,
+            first_frame=first_frame,
+            last_frame=last_frame,
+            keyframes=analysis.keyframe_text,
+        ))
+    return "\n".join(animation_parts)
+
+def export_label_data(operator, context):
+    """Write <blend>_dot_labels.html and <blend>_dot_labels.json for the current file."""
+    try:
+        description_suggester = get_description_suggester()
+        with profiler.span('description_training'):
+            # First, collect all descriptions for training
+            print("\n--- Starting description collection for training ---")
+            for obj in bpy.data.objects:
+                if obj.name.startswith("label-") or obj.name.startswith("dot-"):
+                    # Check the label data in the scene store
+                    data = get_label_data(obj)
+                    if data is not None:
+                        description = data.get("description", "")
+                        if description:
+                            print(f"Found description in {obj.name}: {description}")
+                            description_suggester.add_description(description)
+
+                    # Also check for any other custom properties that might contain descriptions
+                    for prop in obj.keys():
+                        if prop != "dot_label_data" and isinstance(obj[prop], (str, dict)):
+                            if isinstance(obj[prop], str):
+                                print(f"Found string property in {obj.name}.{prop}: {obj[prop]}")
+                                description_suggester.add_description(obj[prop])
+                            elif isinstance(obj[prop], dict):
+                                for key, value in obj[prop].items():
+                                    if isinstance(value, str):
+                                        print(f"Found string in {obj.name}.{prop}.{key}: {value}")
+                                        description_suggester.add_description(value)
+
+            # Save the updated dictionary
+            description_suggester.save_data()
+            print("--- Finished description collection and training ---\n")
+
+        # Get current timestamp
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        with profiler.span('scene_scan'):
+            # Group objects by their number
+            label_groups = {}
+            total_triangles = 0
+            object_names = []
+            material_names = []
+
+            # Animation data collection
+            animated_objects = []
+            animation_details = []
+            # action pointer -> (action, names of objects using it)
+            action_users = {}
+
+            # The same pairs the panel and Validate Labels report; duplicates are left out
+            pair_index = get_label_pair_index()
+            for num in pair_index.numbers():
+                dot_obj, label_obj = pair_index.pair(num)
+                # Read the label data once for the report and the JSON file
+                label_groups[num] = {"dot": dot_obj, "label": label_obj,
+                                     "data": get_label_data(label_obj) if label_obj else None}
+
+            for obj in bpy.data.objects:
+                # Collect metadata
+                if obj.type == 'MESH':
+                    total_triangles += sum(len(p.vertices) - 2 for p in obj.data.polygons)
+                    object_names.append(obj.name)
+                    for material_slot in obj.material_slots:
+                        if material_slot.material:
+                            material_names.append(material_slot.material.name)
+
+                # Collect animation data
+                if obj.animation_data and obj.animation_data.action:
+                    animated_objects.append(obj)
+                    action = obj.animation_data.action
+                    action_users.setdefault(action.as_pointer(), (action, []))[1].append(obj.name)
+
+            # Analyze each action once, however many objects share it
+            total_actions = len(action_users)
+            shared_actions = []
+            for action, user_names in action_users.values():
+                if len(user_names) > 1:
+                    shared_actions.append((action.name, len(user_names), ", ".join(user_names)))
+            for obj in animated_objects:
+                action = obj.animation_data.action
+                analysis = analyze_action(action)
+                if analysis.frame_range:
+                    other_users = len(action_users[action.as_pointer()][1]) - 1
+                    animation_details.append((obj.name, action.name, other_users, analysis))
+
+        with profiler.span('html_generation'):
+            # Get the blend file path
+            blend_file_path = bpy.data.filepath
+            if not blend_file_path:
+                operator.report({'ERROR'}, "Please save your blend file first")
+                return {'CANCELLED'}
+
+            # Get GLB file size if it exists
+            glb_path = os.path.splitext(blend_file_path)[0] + ".glb"
+            glb_size_mb = 0
+            if os.path.exists(glb_path):
+                glb_size_mb = os.path.getsize(glb_path) / (1024 * 1024)  # Convert to MB
+
+            # Determine status classes and messages
+            triangle_status = "OK" if total_triangles < 100000 else "HIGH"
+            triangle_status_class = "status-ok" if total_triangles < 100000 else "status-warning"
+
+            naming_status = "OK" if all(name.startswith(("dot-", "label-", "mesh-")) for name in object_names) else "Needs Review"
+            naming_status_class = "status-ok" if naming_status == "OK" else "status-warning"
+
+            material_naming_status = "OK" if all(name.startswith("mat-") for name in material_names) else "Needs Review"
+            material_naming_status_class = "status-ok" if material_naming_status == "OK" else "status-warning"
+
+            # Add GLB size status
+            glb_size_status = "OK" if glb_size_mb <= 20 else "LARGE"
+            glb_size_status_class = "status-ok" if glb_size_mb <= 20 else "status-warning"
+
+            # Report labels whose animation ranges overlap or cannot be parsed, as (css class, text)
+            label_index, invalid_ranges = build_label_interval_index()
+            overlapping_pairs = label_index.overlapping_pairs()
+            timing_items = []
+            for name, animdata in invalid_ranges:
+                timing_items.append(("status-error", f'{name}: invalid animation data "{animdata}"'))
+            for first, second, overlap_start, overlap_end in overlapping_pairs[:100]:
+                timing_items.append(("", f"{first.key} ({first.start}-{first.end}) overlaps {second.key} "
+                                         f"({second.start}-{second.end}) on frames {overlap_start}-{overlap_end}"))
+            if len(overlapping_pairs) > 100:
+                timing_items.append(("", f"... and {len(overlapping_pairs) - 100} more overlaps"))
+            if invalid_ranges:
+                timing_status = f"{len(invalid_ranges)} invalid, {len(overlapping_pairs)} overlapping pairs"
+                timing_status_class = "status-error"
+            elif overlapping_pairs:
+                timing_status = f"{len(overlapping_pairs)} overlapping pairs across {len(label_index)} labels"
+                timing_status_class = "status-warning"
+            else:
+                timing_status = f"OK ({len(label_index)} labels, no overlaps)"
+                timing_status_class = "status-ok"
+
+            # Get scene frame range
+            scene = context.scene
+            scene_frame_start = scene.frame_start
+            scene_frame_end = scene.frame_end
+
+            # Report dots placed on top of each other, grouped into clusters
+            spatial_index = get_label_spatial_index()
+            overlap_radius = scene.label_overlap_radius
+            clusters = spatial_index.clusters(overlap_radius)
+            placement_items = []
+            for numbers in clusters[:100]:
+                names = [(label_obj or dot_obj).name for dot_obj, label_obj in map(pair_index.pair, numbers)]
+                placement_items.append(("", f"{len(names)} labels within {overlap_radius:g}: {', '.join(names)}"))
+            if len(clusters) > 100:
+                placement_items.append(("", f"... and {len(clusters) - 100} more clusters"))
+            if clusters:
+                placement_status = (f"{sum(len(numbers) for numbers in clusters)} labels in {len(clusters)} "
+                                    f"overlapping clusters across {len(spatial_index)} dots")
+                placement_status_class = "status-warning"
+            else:
+                placement_status = f"OK ({len(spatial_index)} dots, none within {overlap_radius:g} of each other)"
+                placement_status_class = "status-ok"
+
+            summary = {
+                "total_triangles": total_triangles,
+                "object_count": len(object_names),
+                "material_count": len(set(material_names)),
+                "triangle_status": triangle_status,
+                "triangle_status_class": triangle_status_class,
+                "naming_status": naming_status,
+                "naming_status_class": naming_status_class,
+                "material_naming_status": material_naming_status,
+                "material_naming_status_class": material_naming_status_class,
+                "glb_size": round(glb_size_mb, 2),
+                "glb_size_status": glb_size_status,
+                "glb_size_status_class": glb_size_status_class,
+                "animated_objects_count": len(animated_objects),
+                "total_actions": total_actions,
+                "scene_frame_start": scene_frame_start,
+                "scene_frame_end": scene_frame_end,
+                "timing_status": timing_status,
+                "timing_status_class": timing_status_class,
+                "placement_status": placement_status,
+                "placement_status_class": placement_status_class,
+            }
+            header = {
+                "script_name": bl_info["name"],
+                "script_version": ".".join(str(v) for v in bl_info["version"]),
+                "script_author": bl_info["author"],
+                "timestamp": timestamp,
+            }
+            header = dict(zip(header, escape_all(header.values())))
+            label_rows = _collect_label_rows(label_groups)
+            templates = get_report_templates(scene.report_minify)
+            base_path = os.path.splitext(blend_file_path)[0]
+            data_path = None
+
+            if scene.report_mode == 'PAGED':
+                # Small static page; the rows go to a side file rendered on demand in the browser
+                data_path = base_path + "_dot_labels_data.js"
+                data_name = os.path.basename(data_path)
+                html = templates.paged_page.render(
+                    data_file=escape_all([data_name])[0],
+                    data_src=escape_all([quote(data_name)])[0],
+                    **header
+                )
+                report_data = {
+                    "summary": summary,
+                    "labels": label_rows,
+                    "objects": sorted(object_names),
+                    "materials": sorted(set(material_names)),
+                    "shared_actions": shared_actions,
+                    "animation": [
+                        (name, action_name, other_users, list(analysis.data_paths)) + analysis.frame_range
+                        + (analysis.keyframe_text,)
+                        for name, action_name, other_users, analysis in animation_details
+                    ],
+                    "timing_items": timing_items,
+                    "placement_items": placement_items,
+                }
+            else:
+                label_groups_html = _render_label_groups(templates, label_rows)
+                # The rendered groups replace the rows; drop them before the page is assembled
+                label_rows = None
+
+                animation_details_html = _render_animation_details(templates, animation_details)
+
+                if shared_actions:
+                    shared_texts = iter(escape_all(text for name, _, users in shared_actions for text in (name, users)))
+                    shared_actions_html = "<ul>" + "".join(
+                        f"<li>{next(shared_texts)}: used by {count} objects ({next(shared_texts)})</li>"
+                        for _, count, _ in shared_actions) + "</ul>"
+                else:
+                    shared_actions_html = "<p>No actions are shared between objects.</p>"
+
+                # Format the object and material lists
+                object_list = "\n".join([f"<li>{name}</li>" for name in escape_all(sorted(object_names))])
+                material_list = "\n".join([f"<li>{name}</li>" for name in escape_all(sorted(set(material_names)))])
+
+                timing_texts = escape_all(text for _, text in timing_items)
+                timing_report = "".join(
+                    f'<li class="{css_class}">{text}</li>' if css_class else f"<li>{text}</li>"
+                    for (css_class, _), text in zip(timing_items, timing_texts))
+                timing_report = f"<ul>{timing_report}</ul>" if timing_report else ""
+                placement_texts = escape_all(text for _, text in placement_items)
+                placement_report = "".join(f"<li>{text}</li>" for text in placement_texts)
+                placement_report = f"<ul>{placement_report}</ul>" if placement_report else ""
+
+                # Format the HTML with all the data
+                html = templates.page.render(
+                    label_groups=label_groups_html,
+                    object_list=object_list,
+                    material_list=material_list,
+                    timing_report=timing_report,
+                    placement_report=placement_report,
+                    animation_details=animation_details_html,
+                    shared_actions=shared_actions_html,
+                    **header,
+                    **summary
+                )
+
+        # Create the HTML file path
+        html_path = base_path + "_dot_labels.html"
+
+        with profiler.span('write_html'):
+            # Write the HTML file
+            with open(html_path, 'w', encoding='utf-8') as f:
+                f.write(html)
+            if data_path:
+                # Compact JSON wrapped in a script, streamed straight to the file
+                with open(data_path, 'w', encoding='utf-8') as f:
+                    f.write("window.AUTOLM_REPORT = ")
+                    json.dump(report_data, f, separators=(",", ":"), ensure_ascii=False)
+                    f.write(";\n")
+
+        with profiler.span('write_json'):
+            # Translations missing on the labels come from the translation memory in one lookup
+            languages = parse_languages(scene.label_languages)
+            memory_translations = resolve_label_translations(label_groups, languages)
+
+            # Stream the label entries straight to the (optionally compressed) file
+            json_format = scene.label_json_format
+            compression = scene.label_json_compression
+            json_path = label_json_path(base_path, json_format, compression)
+            try:
+                f = open_label_json(json_path, compression)
+            except ImportError as e:
+                operator.report({'WARNING'}, f"{e}; writing gzip instead")
+                compression = 'GZIP'
+                json_path = label_json_path(base_path, json_format, compression)
+                f = open_label_json(json_path, compression)
+            with f:
+                write_label_entries(f, iter_label_entries(label_groups, languages, memory_translations), json_format)
+
+        # Duplicate copies are left out of the export and orphans export half a pair
+        validation = pair_index.validate()
+        if validation.duplicates or validation.orphan_dots or validation.orphan_labels:
+            operator.report({'WARNING'}, f"Skipped {len(validation.duplicates)} duplicates; "
+                                         f"{len(validation.orphan_dots) + len(validation.orphan_labels)} dots or labels "
+                                         f"have no partner. Run Validate Labels for details")
+        if data_path:
+            operator.report({'INFO'}, f"Exported dot label data to HTML and JSON: {html_path} (data: {data_path}), {json_path}")
+        else:
+            operator.report({'INFO'}, f"Exported dot label data to HTML and JSON: {html_path}, {json_path}")
+        return {'FINISHED'}
+    except Exception as e:
+        operator.report({'ERROR'}, f"Error exporting data: {str(e)}")
+        return {'CANCELLED'}
@@ -0,0 +1,128 @@
+"""Cached keyframe reads for label timing and the export.
+
+Imports numpy, so it is only loaded once keyframes are actually needed.
+"""
+
+from collections import defaultdict
+
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+
+class ActionKeyframes:
+    """Unique keyframe frames of an action, grouped by fcurve data path."""
+    __slots__ = ("signature", "paths", "frames")
+
+    def __init__(self, signature, paths):
+        self.signature = signature
+        # data_path -> sorted unique int64 frames
+        self.paths = paths
+        if paths:
+            self.frames = np.unique(np.concatenate(list(paths.values())))
+        else:
+            self.frames = np.empty(0, dtype=np.int64)
+
+    def get_frames(self, data_path=None):
+        """Return sorted unique frames, optionally restricted to one data path."""
+        if data_path is None:
+            return self.frames
+        return self.paths.get(data_path, np.empty(0, dtype=np.int64))
+
+def summarize_frames(frames):
+    """Return (first, last, duration) for a sorted frame array, or None if it is empty."""
+    if not len(frames):
+        return None
+    first = int(frames[0])
+    last = int(frames[-1])
+    return first, last, last - first
+
+# Per-action keyframe cache: action pointer -> ActionKeyframes
+_action_keyframe_cache = {}
+# Per-action change counters, bumped whenever the depsgraph reports the action as updated
+_action_revisions = defaultdict(int)
+
+def _read_fcurve_frames(fc):
+    count = len(fc.keyframe_points)
+    co = np.empty(count * 2, dtype=np.float32)
+    fc.keyframe_points.foreach_get("co", co)
+    # int() truncates toward zero, which matches int(key.co.x)
+    return co[0::2].astype(np.int64)
+
+def get_action_keyframes(action):
+    """Return the cached ActionKeyframes for an action, re-reading it only after it changed."""
+    ensure_handlers()
+    key = action.as_pointer()
+    fcurves = action.fcurves
+    signature = (_action_revisions[key], len(fcurves), sum(len(fc.keyframe_points) for fc in fcurves))
+    cached = _action_keyframe_cache.get(key)
+    if cached is not None and cached.signature == signature:
+        return cached
+
+    per_path = {}
+    for fc in fcurves:
+        arrays = per_path.setdefault(fc.data_path, [])
+        if len(fc.keyframe_points):
+            arrays.append(_read_fcurve_frames(fc))
+    paths = {
+        data_path: np.unique(np.concatenate(arrays)) if arrays else np.empty(0, dtype=np.int64)
+        for data_path, arrays in per_path.items()
+    }
+    cached = ActionKeyframes(signature, paths)
+    _action_keyframe_cache[key] = cached
+    return cached
+
+class ActionAnalysis:
+    """Per-action animation summary shared by every object that uses the action."""
+    __slots__ = ("keyframes", "data_paths", "frame_range", "keyframe_text")
+
+    def __init__(self, keyframes):
+        self.keyframes = keyframes
+        self.data_paths = tuple(keyframes.paths)
+        self.frame_range = summarize_frames(keyframes.frames)
+        self.keyframe_text = ", ".join(map(str, keyframes.frames.tolist()))
+
+# Action pointer -> ActionAnalysis, valid while its ActionKeyframes is still the cached one
+_action_analysis_cache = {}
+
+def analyze_action(action):
+    """Return the memoized ActionAnalysis for an action."""
+    keyframes = get_action_keyframes(action)
+    analysis = _action_analysis_cache.get(action.as_pointer())
+    if analysis is None or analysis.keyframes is not keyframes:
+        analysis = ActionAnalysis(keyframes)
+        _action_analysis_cache[action.as_pointer()] = analysis
+    return analysis
+
+@persistent
+def _on_depsgraph_update_keyframes(scene, depsgraph):
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Action):
+            _action_revisions[update.id.original.as_pointer()] += 1
+
+@persistent
+def _on_load_post_keyframes(*args):
+    # Pointers are not stable across file loads
+    _action_keyframe_cache.clear()
+    _action_analysis_cache.clear()
+    _action_revisions.clear()
+
+_handlers_installed = False
+
+def ensure_handlers():
+    """Install the cache handlers the first time keyframes are read after the addon was enabled."""
+    global _handlers_installed
+    if _handlers_installed:
+        return
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update_keyframes)
+    bpy.app.handlers.load_post.append(_on_load_post_keyframes)
+    _handlers_installed = True
+
+def remove_handlers():
+    """Remove the cache handlers and drop the caches, which are not kept current without them."""
+    global _handlers_installed
+    if _on_depsgraph_update_keyframes in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update_keyframes)
+    if _on_load_post_keyframes in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post_keyframes)
+    _on_load_post_keyframes()
+    _handlers_installed = False
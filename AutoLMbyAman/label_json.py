@@ -0,0 +1,136 @@
+"""Streaming writer for the <blend>_dot_labels.json label file.
+
+Entries are produced one label at a time and written as they come, so the
+export never holds the whole label list in memory.
+"""
+
+import gzip
+import json
+
+from .translations import SOURCE_LANGUAGE, get_label_translations
+
+# File extension per label file format and per compression
+JSON_EXTENSIONS = {
+    'PRETTY': ".json",
+    'COMPACT': ".json",
+    'NDJSON': ".ndjson",
+}
+COMPRESSION_EXTENSIONS = {
+    'NONE': "",
+    'GZIP': ".gz",
+    'ZSTD': ".zst",
+}
+
+# Animation range used when a label has no parsable animdata
+DEFAULT_FIRST_FRAME = 32
+DEFAULT_SECOND_FRAME = 160
+
+def iter_label_entries(label_groups, languages=(SOURCE_LANGUAGE,), memory_translations=None):
+    """Yield one label entry dict per numbered group whose label has label data.
+
+    label_groups maps numbers to {"dot", "label", "data"}, data being the
+    label's get_label_data().
+
+    The "text" list holds the description in each of languages that has a
+    translation, taken from the label first and memory_translations
+    ({(description, language): text}) second.
+    """
+    memory_translations = memory_translations or {}
+    for num in sorted(label_groups.keys()):
+        group = label_groups[num]
+        data = group.get("data")
+        if not group.get("label") or data is None:
+            continue
+        description = data.get("description", "")
+        animdata = data.get("animdata", "")
+
+        # Parse animation data
+        first_value = DEFAULT_FIRST_FRAME
+        second_value = DEFAULT_SECOND_FRAME
+        if animdata:
+            parts = animdata.split("-")
+            if len(parts) == 2:
+                try:
+                    first_value = int(parts[0])
+                    second_value = int(parts[1])
+                except ValueError:
+                    pass
+
+        translations = get_label_translations(data)
+        texts = []
+        for language in languages:
+            if language == SOURCE_LANGUAGE:
+                text = description
+            else:
+                text = translations.get(language) or memory_translations.get((description, language))
+                if text is None:
+                    continue
+            texts.append({
+                "text": text,
+                "lang": language
+            })
+
+        yield {
+            "text": texts,
+            "isAnimation": True,
+            "animation": {
+                "frame": {
+                    "first_value": first_value,
+                    "second_value": second_value
+                }
+            }
+        }
+
+def label_json_path(base_path, json_format, compression):
+    """Return the label file path for a format and compression, e.g. <base>_dot_labels.ndjson.gz."""
+    return base_path + "_dot_labels" + JSON_EXTENSIONS[json_format] + COMPRESSION_EXTENSIONS[compression]
+
+def open_label_json(path, compression):
+    """Open a text file for writing, compressed as requested.
+
+    zstd needs Python 3.14's compression.zstd or the zstandard package;
+    ImportError is raised when neither is available.
+    """
+    if compression == 'GZIP':
+        return gzip.open(path, 'wt', encoding='utf-8')
+    if compression == 'ZSTD':
+        try:
+            from compression import zstd
+        except ImportError:
+            try:
+                import zstandard as zstd
+            except ImportError:
+                raise ImportError("zstd compression needs Python 3.14+ or the 'zstandard' package") from None
+        return zstd.open(path, 'wt', encoding='utf-8')
+    return open(path, 'w', encoding='utf-8')
+
+def write_label_entries(f, entries, json_format='PRETTY'):
+    """Stream entries to f and return how many were written.
+
+    PRETTY matches json.dump(list, indent=4), COMPACT is a single-line array
+    and NDJSON writes one compact entry per line.
+    """
+    count = 0
+    if json_format == 'NDJSON':
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+        return count
+
+    if json_format == 'COMPACT':
+        separator = ","
+        for entry in entries:
+            f.write(separator if count else "[")
+            f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+            count += 1
+        f.write("]" if count else "[]")
+        return count
+
+    separator = ",\n    "
+    for entry in entries:
+        f.write(separator if count else "[\n    ")
+        f.write(json.dumps(entry, ensure_ascii=False, indent=4).replace("\n", "\n    "))
+        count += 1
+    f.write("\n]" if count else "[]")
+    return count
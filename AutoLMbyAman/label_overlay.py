@@ -0,0 +1,223 @@
+"""Viewport overlay drawing label names and descriptions with culling and decluttering.
+
+Replaces the per-object name display, which draws every name even when
+thousands pile up on screen. Positions are projected in one numpy batch,
+labels outside the view or hidden (by the user or the visibility preview)
+are culled and a screen-space grid keeps one label per cell, nearest
+first. Descriptions are drawn only for labels that have their cell, and
+every cell their text runs into, to themselves. The number of labels
+drawn adapts to stay within a frame-time budget.
+"""
+
+import time
+
+import blf
+import bpy
+from bpy.app.handlers import persistent
+
+from .label_store import get_label_data_by_number
+from .labels import get_label_data_revision, get_label_visibility_revision
+from .pairing import get_label_pair_index
+from .profiling import profiler
+from .spatial import get_label_spatial_index
+
+class LabelOverlay:
+    """Projected label layout, cached until the view or the labels change."""
+
+    FONT_SIZE = 12
+    # Screen grid for decluttering, in pixels: about ten characters by one line
+    CELL_WIDTH = 80
+    CELL_HEIGHT = 18
+    TEXT_OFFSET = 6
+    # Never drop below this many labels when trimming to the budget
+    MIN_LABELS = 25
+
+    def __init__(self):
+        self._source_key = None
+        self._positions = None
+        self._short_texts = []
+        self._long_texts = []
+        self._long_widths = []
+        self._visibility_key = None
+        self._shown = None
+        self._layout_key = None
+        self.layout = []
+        self.max_labels = None
+        self.last_draw_ms = 0.0
+
+    def _refresh_source(self):
+        """Gather world positions and texts of every pair; only when pairs, positions or label data changed."""
+        spatial_index = get_label_spatial_index()
+        key = (spatial_index.revision, get_label_data_revision())
+        if key == self._source_key:
+            return
+        import numpy as np
+
+        pair_index = get_label_pair_index()
+        short_texts = []
+        long_texts = []
+        for number in spatial_index.numbers:
+            dot_obj, label_obj = pair_index.pair(number)
+            name = (label_obj or dot_obj).name
+            data = get_label_data_by_number(number)
+            description = data.get("description", "") if data else ""
+            short_texts.append(name)
+            long_texts.append(f"{name}: {description}" if description else name)
+        blf.size(0, self.FONT_SIZE)
+        self._long_widths = [blf.dimensions(0, text)[0] for text in long_texts]
+        positions = np.ones((len(spatial_index.positions), 4))
+        if spatial_index.positions:
+            positions[:, :3] = spatial_index.positions
+        self._positions = positions
+        self._short_texts = short_texts
+        self._long_texts = long_texts
+        self._source_key = key
+        self._visibility_key = None
+        self._layout_key = None
+
+    def _refresh_visibility(self):
+        """Flag the labels whose object is visible; only when the source or any visibility changed."""
+        key = (self._source_key, get_label_visibility_revision())
+        if key == self._visibility_key:
+            return
+        import numpy as np
+
+        objects = bpy.data.objects
+        shown = np.zeros(len(self._short_texts), dtype=bool)
+        # The short text is the name of the object the label stands for
+        for position, name in enumerate(self._short_texts):
+            obj = objects.get(name)
+            shown[position] = obj is not None and obj.visible_get()
+        self._shown = shown
+        self._visibility_key = key
+        self._layout_key = None
+
+    def update_layout(self, region, rv3d):
+        """Project, cull and declutter the labels for this view; reuse the last layout if nothing moved."""
+        import numpy as np
+
+        self._refresh_source()
+        self._refresh_visibility()
+        matrix = np.array(rv3d.perspective_matrix, dtype=float)
+        width = region.width
+        height = region.height
+        key = (self._visibility_key, width, height, matrix.tobytes())
+        if key == self._layout_key:
+            return self.layout
+
+        # Same projection as view3d_utils.location_3d_to_region_2d, for all labels at once
+        clip = self._positions @ matrix.T
+        depth = clip[:, 3]
+        in_front = depth > 1e-6
+        safe_depth = np.where(in_front, depth, 1.0)
+        x = (1.0 + clip[:, 0] / safe_depth) * 0.5 * width
+        y = (1.0 + clip[:, 1] / safe_depth) * 0.5 * height
+        visible = np.flatnonzero(self._shown & in_front & (x >= 0) & (x < width) & (y >= 0) & (y < height))
+
+        # Nearest label wins its grid cell
+        order = visible[np.argsort(depth[visible], kind="stable")]
+        columns = int(width // self.CELL_WIDTH) + 2
+        cells = (y[order] // self.CELL_HEIGHT).astype(np.int64) * columns + (x[order] // self.CELL_WIDTH).astype(np.int64)
+        occupied, first, crowd = np.unique(cells, return_index=True, return_counts=True)
+        winners = order[first]
+        by_depth = np.argsort(depth[winners], kind="stable")
+
+        occupied_cells = set(occupied.tolist())
+        # Cells already covered by a nearer label's description
+        reserved = set()
+        layout = []
+        for position in by_depth.tolist():
+            label = int(winners[position])
+            label_x = float(x[label])
+            text = self._short_texts[label]
+            if crowd[position] > 1:
+                text = f"{text} (+{int(crowd[position]) - 1})"
+            else:
+                # Room for a description: nobody else in any cell its text runs into, up to the row's end
+                cell = int(occupied[position])
+                row_start = cell - cell % columns
+                end_column = int((label_x + self.TEXT_OFFSET + self._long_widths[label]) // self.CELL_WIDTH)
+                covered = range(cell + 1, row_start + min(end_column, columns - 1) + 1)
+                if not any(other in occupied_cells or other in reserved for other in covered):
+                    reserved.update(covered)
+                    text = self._long_texts[label]
+            layout.append((label_x + self.TEXT_OFFSET, float(y[label]), text))
+        self.layout = layout
+        self._layout_key = key
+        return layout
+
+    def draw(self, region, rv3d, budget_ms):
+        start = time.perf_counter()
+        layout = self.update_layout(region, rv3d)
+        if self.max_labels is not None:
+            layout = layout[:self.max_labels]
+        font_id = 0
+        blf.size(font_id, self.FONT_SIZE)
+        blf.color(font_id, 1.0, 1.0, 1.0, 1.0)
+        for x, y, text in layout:
+            blf.position(font_id, x, y, 0)
+            blf.draw(font_id, text)
+        self.last_draw_ms = (time.perf_counter() - start) * 1000.0
+        self._adapt(len(layout), budget_ms)
+
+    def _adapt(self, drawn, budget_ms):
+        """Shrink the label cap when a frame ran over budget, grow it back while there is headroom."""
+        if self.last_draw_ms > budget_ms and drawn > self.MIN_LABELS:
+            self.max_labels = max(self.MIN_LABELS, int(drawn * budget_ms / self.last_draw_ms * 0.9))
+        elif self.max_labels is not None and drawn >= self.max_labels and self.last_draw_ms < budget_ms * 0.5:
+            self.max_labels = int(self.max_labels * 1.25) + 1
+            if self.max_labels >= len(self.layout):
+                self.max_labels = None
+
+    def invalidate(self):
+        self._source_key = None
+        self._visibility_key = None
+        self._layout_key = None
+
+    def invalidate_visibility(self):
+        self._visibility_key = None
+
+label_overlay = LabelOverlay()
+
+def draw_label_overlay():
+    context = bpy.context
+    scene = context.scene
+    if not scene or not scene.show_label_overlay:
+        return
+    region = context.region
+    rv3d = context.region_data
+    if region is None or rv3d is None:
+        return
+    with profiler.span('label_overlay'):
+        label_overlay.draw(region, rv3d, scene.label_overlay_budget)
+
+@persistent
+def _on_depsgraph_update_label_overlay(scene, depsgraph):
+    # Hiding objects (H, the eye icon, hide_viewport) updates the scene or the objects without a transform
+    if not scene.show_label_overlay:
+        return
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Scene) or (
+                isinstance(update.id, bpy.types.Object) and not update.is_updated_transform):
+            label_overlay.invalidate_visibility()
+            return
+
+def _set_label_name_display(show):
+    pair_index = get_label_pair_index()
+    for number in pair_index.numbers():
+        for obj in pair_index.pair(number):
+            if obj is not None:
+                obj.show_name = show
+
+def _update_show_label_overlay(self, context):
+    # The overlay replaces Blender's own name display; create_label_pair follows the setting for new labels
+    _set_label_name_display(not self.show_label_overlay)
+    label_overlay.invalidate()
+    if context.area:
+        context.area.tag_redraw()
+
+def disable_label_overlay():
+    """Hand the name display back to the objects, e.g. when the addon is disabled."""
+    scene = bpy.context.scene
+    if scene and scene.show_label_overlay:
+        _set_label_name_display(True)
@@ -0,0 +1,375 @@
+"""Scene-level store for label data.
+
+Every label group keeps its description, animation data and translations
+once, in Scene.label_data_store, keyed by group number. Objects (and so
+group numbers) are shared by all scenes of a file, so there is a single
+store, on one scene (see get_label_store_scene). The dot-NNN and
+label-NNN objects only carry that number in their dot_label_ref property.
+Files written by older versions kept a full dot_label_data copy on both
+objects; those are moved into the store on load.
+"""
+
+from contextlib import contextmanager
+
+import bpy
+from bpy.app.handlers import persistent
+
+# Custom property holding the group number on dot and label objects
+LABEL_REF_KEY = "dot_label_ref"
+# Per-object copy used before the store, and in the GLB extras
+LEGACY_DATA_KEY = "dot_label_data"
+
+def label_pair_number(name):
+    """Return the number of a dot-NNN/label-NNN object name as a string, or None."""
+    if name.startswith(("dot-", "label-")):
+        num = name.rpartition("-")[2]
+        if num.isdigit():
+            return num
+    return None
+
+def label_number(obj):
+    """Return obj's group number: from its name when it is dot-NNN/label-NNN, else from its reference; or None.
+
+    The name wins over the reference: an object duplicated and renamed
+    still carries the reference of the object it was copied from.
+    """
+    name_number = label_pair_number(obj.name)
+    if name_number is not None:
+        return int(name_number)
+    return obj.get(LABEL_REF_KEY)
+
+class LabelTranslation(bpy.types.PropertyGroup):
+    language: bpy.props.StringProperty(name="Language")
+    text: bpy.props.StringProperty(name="Translation")
+
+class LabelDataItem(bpy.types.PropertyGroup):
+    number: bpy.props.IntProperty(name="Group Number")
+    description: bpy.props.StringProperty(name="Description")
+    animdata: bpy.props.StringProperty(name="Animation Data")
+    translations: bpy.props.CollectionProperty(type=LabelTranslation)
+
+class LabelStoreIndex:
+    """Cached {group number: position} over the scene's label data store.
+
+    Positions are checked on every lookup and the index is rebuilt when one
+    is wrong or the number of items changed. A miss cannot be checked that
+    way, so undo, redo and file load invalidate the index as well.
+    """
+
+    def __init__(self):
+        self.scene_pointer = None
+        self.positions = {}
+
+    def _rebuild(self, scene, store):
+        self.scene_pointer = scene.as_pointer()
+        self.positions = {item.number: position for position, item in enumerate(store)}
+
+    def find(self, scene, number):
+        """Return the store item for number, or None."""
+        store = scene.label_data_store
+        if self.scene_pointer != scene.as_pointer():
+            self._rebuild(scene, store)
+        position = self.positions.get(number)
+        if position is not None and position < len(store) and store[position].number == number:
+            return store[position]
+        if position is None and len(self.positions) == len(store):
+            return None
+        self._rebuild(scene, store)
+        position = self.positions.get(number)
+        return store[position] if position is not None else None
+
+    def add(self, scene, number):
+        store = scene.label_data_store
+        item = store.add()
+        item.number = number
+        if self.scene_pointer == scene.as_pointer():
+            self.positions[number] = len(store) - 1
+        return item
+
+    def invalidate(self):
+        self.scene_pointer = None
+        self.positions = {}
+
+label_store_index = LabelStoreIndex()
+
+def get_label_store_scene(scene=None):
+    """Return the scene holding the file's label data store.
+
+    That is the scene with a non-empty store, or scene (the context scene
+    by default) while no scene has one yet. Files from older versions can
+    have several until merge_label_stores runs on load; scene, then the
+    first in order, is used meanwhile.
+    """
+    scene = scene or bpy.context.scene
+    if len(scene.label_data_store):
+        return scene
+    for candidate in bpy.data.scenes:
+        if len(candidate.label_data_store):
+            return candidate
+    return scene
+
+def merge_label_stores(scene=None):
+    """Move entries stored on other scenes (by older versions) into the store scene; return how many moved.
+
+    When two scenes hold the same number, the store scene's entry is kept.
+    """
+    owner = get_label_store_scene(scene)
+    numbers = {item.number for item in owner.label_data_store}
+    moved = 0
+    for other in bpy.data.scenes:
+        if other == owner or not len(other.label_data_store):
+            continue
+        for item in other.label_data_store:
+            if item.number not in numbers:
+                set_label_data([], item_to_dict(item), number=item.number, scene=owner)
+                numbers.add(item.number)
+                moved += 1
+        other.label_data_store.clear()
+    return moved
+
+def item_to_dict(item):
+    data = {"description": item.description, "animdata": item.animdata}
+    if len(item.translations):
+        data["translations"] = {translation.language: translation.text for translation in item.translations}
+    return data
+
+def get_label_data(obj, scene=None):
+    """Return obj's label data as {"description", "animdata"[, "translations"]}, or None if it has none."""
+    scene = get_label_store_scene(scene)
+    number = label_number(obj)
+    if number is not None:
+        item = label_store_index.find(scene, number)
+        ref = obj.get(LABEL_REF_KEY)
+        if item is None and ref is not None and ref != number:
+            # Renamed, or copied from another label: its data until the first edit makes it its own
+            item = label_store_index.find(scene, ref)
+        if item is not None:
+            return item_to_dict(item)
+    # Objects not migrated yet, e.g. appended from an older file
+    if LEGACY_DATA_KEY in obj:
+        return dict(obj[LEGACY_DATA_KEY])
+    return None
+
+def get_label_data_by_number(number, scene=None):
+    """Return the label data stored for a group number, or None."""
+    item = label_store_index.find(get_label_store_scene(scene), int(number))
+    return item_to_dict(item) if item is not None else None
+
+def set_label_data(objects, data, number=None, scene=None):
+    """Store data for the group of objects (a dot and/or its label) and point them at it.
+
+    The group number comes from the objects' names or references (see
+    label_number) unless given. Keys missing from data keep their stored
+    value; a new entry for an object that referred to another group starts
+    as a copy of that group's data. Objects without a group number (custom
+    names) keep a full copy in dot_label_data instead; None is returned
+    then, the store item otherwise.
+    """
+    scene = get_label_store_scene(scene)
+    objects = [obj for obj in objects if obj is not None]
+    if number is None:
+        for obj in objects:
+            number = label_number(obj)
+            if number is not None:
+                break
+        if number is None:
+            for obj in objects:
+                legacy = dict(obj[LEGACY_DATA_KEY]) if LEGACY_DATA_KEY in obj else {}
+                legacy.update(data)
+                obj[LEGACY_DATA_KEY] = legacy
+            _label_data_changed()
+            return None
+    number = int(number)
+
+    item = label_store_index.find(scene, number)
+    if item is None:
+        # Never write into the entry of the group the objects used to refer to; copy it
+        for obj in objects:
+            ref = obj.get(LABEL_REF_KEY)
+            source = label_store_index.find(scene, ref) if ref is not None and ref != number else None
+            if source is not None:
+                data = dict(item_to_dict(source), **data)
+                break
+        item = label_store_index.add(scene, number)
+    if "description" in data:
+        item.description = data["description"]
+    if "animdata" in data:
+        item.animdata = data["animdata"]
+    if "translations" in data:
+        item.translations.clear()
+        for language, text in data["translations"].items():
+            translation = item.translations.add()
+            translation.language = language
+            translation.text = text
+    for obj in objects:
+        obj[LABEL_REF_KEY] = number
+        if LEGACY_DATA_KEY in obj:
+            del obj[LEGACY_DATA_KEY]
+    _label_data_changed()
+    return item
+
+# Bumped on every write to the store; the label interval index and the caches keyed on it compare against it
+_store_revision = 0
+
+def _label_data_changed():
+    global _store_revision
+    _store_revision += 1
+
+def get_label_store_revision():
+    return _store_revision
+
+def label_number_in_use(number, exclude=(), scene=None):
+    """Return whether number has a store entry that an object other than those in exclude refers to."""
+    scene = get_label_store_scene(scene)
+    if label_store_index.find(scene, number) is None:
+        return False
+    return any(obj.get(LABEL_REF_KEY) == number and label_number(obj) == number
+               for obj in bpy.data.objects if obj not in exclude)
+
+def next_free_label_number(scene=None):
+    """Return a group number no object name, reference or store entry uses yet."""
+    scene = get_label_store_scene(scene)
+    numbers = {item.number for item in scene.label_data_store}
+    for obj in bpy.data.objects:
+        name_number = label_pair_number(obj.name)
+        if name_number is not None:
+            numbers.add(int(name_number))
+        ref = obj.get(LABEL_REF_KEY)
+        if ref is not None:
+            numbers.add(ref)
+    return max(numbers, default=0) + 1
+
+def detach_copied_refs(scene=None):
+    """Give objects that share another group's entry without its name (Shift+D copies) an entry of their own.
+
+    A copied dot and label (dot-003.001, label-003.001) get the same new
+    number, holding a copy of the original's data. Returns the number of
+    objects changed.
+    """
+    scene = get_label_store_scene(scene)
+    owned = set()
+    copies = []
+    for obj in bpy.data.objects:
+        ref = obj.get(LABEL_REF_KEY)
+        if ref is None:
+            continue
+        name_number = label_pair_number(obj.name)
+        if name_number is None:
+            copies.append((obj, ref))
+        elif int(name_number) == ref:
+            owned.add(ref)
+    copies = [(obj, ref) for obj, ref in copies if ref in owned]
+    if not copies:
+        return 0
+    new_numbers = {}
+    for obj, ref in copies:
+        # dot-003.001 and label-003.001 were copied together
+        key = (ref, obj.name.rpartition(".")[2] if "." in obj.name else obj.name)
+        if key not in new_numbers:
+            new_numbers[key] = next_free_label_number(scene)
+            source = label_store_index.find(scene, ref)
+            set_label_data([], item_to_dict(source) if source is not None else {}, number=new_numbers[key], scene=scene)
+        obj[LABEL_REF_KEY] = new_numbers[key]
+    return len(copies)
+
+def migrate_label_data(scene=None):
+    """Move per-object dot_label_data into the scene store; return the number of groups migrated.
+
+    When a dot and its label disagree, the label wins: it is what the
+    exporters read.
+    """
+    scene = get_label_store_scene(scene)
+    groups = {}
+    for obj in bpy.data.objects:
+        if LEGACY_DATA_KEY not in obj:
+            continue
+        number = label_pair_number(obj.name)
+        if number is None:
+            continue
+        group = groups.setdefault(int(number), [None, []])
+        if obj.name.startswith("label-") or group[0] is None:
+            group[0] = dict(obj[LEGACY_DATA_KEY])
+        group[1].append(obj)
+    for number, (data, objects) in groups.items():
+        set_label_data(objects, data, number=number, scene=scene)
+    return len(groups)
+
+def prune_label_store(scene=None):
+    """Remove store entries no object refers to; return how many were removed."""
+    scene = get_label_store_scene(scene)
+    referenced = {obj.get(LABEL_REF_KEY) for obj in bpy.data.objects}
+    store = scene.label_data_store
+    removed = 0
+    # Back to front so the remaining positions stay valid
+    for position in range(len(store) - 1, -1, -1):
+        if store[position].number not in referenced:
+            store.remove(position)
+            removed += 1
+    if removed:
+        label_store_index.invalidate()
+    return removed
+
+@contextmanager
+def materialized_label_data(scene=None):
+    """Temporarily write dot_label_data back onto the objects, e.g. for the GLB extras."""
+    scene = get_label_store_scene(scene)
+    restored = []
+    try:
+        for obj in bpy.data.objects:
+            number = obj.get(LABEL_REF_KEY)
+            if number is None:
+                continue
+            item = label_store_index.find(scene, number)
+            if item is None:
+                continue
+            restored.append((obj, number))
+            del obj[LABEL_REF_KEY]
+            obj[LEGACY_DATA_KEY] = item_to_dict(item)
+        yield
+    finally:
+        for obj, number in restored:
+            if LEGACY_DATA_KEY in obj:
+                del obj[LEGACY_DATA_KEY]
+            obj[LABEL_REF_KEY] = number
+
+def _migrate_after_register():
+    # bpy.data is not accessible while the addon registers, so migrate from a timer
+    if bpy.context.scene:
+        merge_label_stores(bpy.context.scene)
+        migrate_label_data(bpy.context.scene)
+    return None
+
+def _detach_copied_refs_later():
+    # Writing ID properties from the depsgraph handler would trigger another depsgraph update
+    if bpy.context.scene:
+        detach_copied_refs(bpy.context.scene)
+    return None
+
+# Object count at the last depsgraph update; copies only need checking when it grows
+_object_count = -1
+
+@persistent
+def _on_depsgraph_update_label_store(scene, depsgraph):
+    global _object_count
+    count = len(bpy.data.objects)
+    if count > _object_count >= 0 and not bpy.app.timers.is_registered(_detach_copied_refs_later):
+        bpy.app.timers.register(_detach_copied_refs_later, first_interval=0.0)
+    _object_count = count
+
+@persistent
+def _on_undo_redo_label_store(*args):
+    # Undo can change which numbers the store holds without changing its length
+    label_store_index.invalidate()
+    _label_data_changed()
+
+@persistent
+def _on_load_post_label_store(*args):
+    global _object_count
+    label_store_index.invalidate()
+    _object_count = len(bpy.data.objects)
+    scene = bpy.context.scene
+    if scene:
+        merge_label_stores(scene)
+        migrate_label_data(scene)
+        detach_copied_refs(scene)
+        prune_label_store(scene)
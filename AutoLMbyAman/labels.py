@@ -0,0 +1,524 @@
+"""Label/dot naming helpers, label timing index and the label timing preview."""
+
+import bisect
+import heapq
+import re
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .label_store import (
+    get_label_data,
+    label_number_in_use,
+    get_label_store_revision,
+    label_pair_number,
+    next_free_label_number,
+    set_label_data,
+)
+
+def create_transparent_material(name):
+    # Check if the material already exists
+    if name in bpy.data.materials:
+        return bpy.data.materials[name]
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    
+    # Get the Principled BSDF node
+    bsdf = mat.node_tree.nodes.get("Principled BSDF")
+    if bsdf:
+        # Set only the essential properties for transparency
+        bsdf.inputs["Alpha"].default_value = 0.0
+        bsdf.inputs["Base Color"].default_value = (1.0, 1.0, 1.0, 1.0)
+    
+    # Enable transparency in material settings
+    mat.blend_method = 'BLEND'
+    mat.use_backface_culling = False
+    
+    return mat
+
+def get_next_label_number():
+    max_num = 0
+    for obj in bpy.data.objects:
+        if obj.name.startswith("dot-") or obj.name.startswith("label-"):
+            try:
+                num = int(obj.name.split("-")[-1])
+                max_num = max(max_num, num)
+            except ValueError:
+                continue
+    return max_num + 1
+
+def create_label_meshes(label_mesh_name="", dot_mesh_name=""):
+    """Create the template label cube and dot icosphere meshes, both using the shared transparent material.
+
+    Returns (label mesh, dot mesh, ids to remove); copy the templates for
+    each new pair and batch-remove the ids once the pairs exist.
+    """
+    transparent_mat = create_transparent_material("mat-labelmat")
+
+    bpy.ops.mesh.primitive_cube_add(size=0.01)
+    base_cube = bpy.context.object
+    base_cube.data.name = label_mesh_name or "Cube.label.mesh"
+    label_mesh = base_cube.data
+    label_mesh.materials.append(transparent_mat)
+
+    # Icosphere rather than a cone: the fewest triangles
+    bpy.ops.mesh.primitive_ico_sphere_add(radius=0.01, subdivisions=1)
+    base_sphere = bpy.context.object
+    base_sphere.data.name = dot_mesh_name or "Icosphere.dot.mesh"
+    dot_mesh = base_sphere.data
+    dot_mesh.materials.append(transparent_mat)
+
+    return label_mesh, dot_mesh, [base_cube, base_sphere, label_mesh, dot_mesh]
+
+def create_label_pair(collection, label_name, dot_name, label_mesh, dot_mesh, location, rotation, label_data=None):
+    """Create a label cube and its dot sphere from copies of the template meshes and link them to collection."""
+    label_obj = bpy.data.objects.new(label_name, label_mesh.copy())
+    label_obj.location = location
+    label_obj.rotation_euler = rotation
+    label_obj.scale = (0.01, 0.01, 0.01)
+    collection.objects.link(label_obj)
+    # Make label object visible in viewport
+    label_obj.display_type = 'WIRE'
+    label_obj.show_all_edges = True
+    label_obj.show_wire = True
+    # Show object name in viewport, unless the label overlay draws the names instead
+    show_name = not bpy.context.scene.show_label_overlay
+    label_obj.show_name = show_name
+
+    dot_obj = bpy.data.objects.new(dot_name, dot_mesh.copy())
+    dot_obj.location = location
+    dot_obj.rotation_euler = rotation
+    dot_obj.scale = (0.01, 0.01, 0.01)
+    collection.objects.link(dot_obj)
+    dot_obj.show_name = show_name
+
+    num = label_pair_number(label_name) or label_pair_number(dot_name)
+    if num is not None:
+        num = int(num)
+        # A taken name gets a .001 suffix, and a stored number another object still refers to belongs to
+        # another pair: move both objects to a number of their own rather than share its label data
+        if (label_obj.name != label_name or dot_obj.name != dot_name
+                or label_number_in_use(num, exclude=(label_obj, dot_obj))):
+            num = next_free_label_number()
+            if label_pair_number(label_name) is not None:
+                label_obj.name = f"label-{num:03d}"
+            if label_pair_number(dot_name) is not None:
+                dot_obj.name = f"dot-{num:03d}"
+
+    # Store description once in the scene's label data store, referenced by both objects
+    if label_data:
+        if num is not None:
+            # A reused group number must not inherit the translations of a deleted label
+            set_label_data((label_obj, dot_obj), dict(label_data, translations={}), number=num)
+        else:
+            set_label_data((label_obj, dot_obj), label_data)
+    return label_obj, dot_obj
+
+def get_keyframe_data(obj):
+    """Get keyframe data from object's scale animation"""
+    if not obj or not obj.animation_data or not obj.animation_data.action:
+        return None
+    
+    from .keyframes import get_action_keyframes, summarize_frames
+
+    keyframes = get_action_keyframes(obj.animation_data.action).get_frames("scale")
+    frame_range = summarize_frames(keyframes)
+    if frame_range:
+        return f"{frame_range[0]}-{frame_range[1]}"
+    return None
+
+def get_marker_animation_data(context):
+    """Get animation data from timeline markers"""
+    scene = context.scene
+    current_frame = scene.frame_current
+
+    # Only consider ranges that are close to the current frame (within 100 frames)
+    index = build_marker_interval_index(scene)
+    ranges = []
+    for interval in index.overlap(current_frame - 100, current_frame + 100):
+        start_name, end_name = interval.payload
+        ranges.append({
+            'start_frame': interval.start,
+            'end_frame': interval.end,
+            'start_name': start_name,
+            'end_name': end_name,
+            'range': f"{interval.start}-{interval.end}"
+        })
+
+    return ranges
+
+def get_last_marker_range(context):
+    """Return the range between the last two timeline markers as a string 'start-end', or None if not enough markers."""
+    scene = context.scene
+    markers = sorted(scene.timeline_markers, key=lambda m: m.frame)
+    if len(markers) >= 2:
+        start = markers[-2].frame
+        end = markers[-1].frame
+        return f"{start}-{end}", markers[-2].name, markers[-1].name
+    return None, None, None
+
+_ANIMDATA_PATTERN = re.compile(r"^\s*(-?\d+)\s*-\s*(-?\d+)\s*$")
+
+def parse_animdata(animdata):
+    """Parse a 'start-end' animdata string into a (start, end) tuple, or None."""
+    if not animdata:
+        return None
+    match = _ANIMDATA_PATTERN.match(animdata)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+class LabelInterval:
+    """A closed frame range [start, end] belonging to a label."""
+    __slots__ = ("start", "end", "key", "payload")
+
+    def __init__(self, start, end, key, payload=None):
+        self.start = start
+        self.end = end
+        self.key = key
+        self.payload = payload
+
+    def __repr__(self):
+        return f"LabelInterval({self.key!r}, {self.start}-{self.end})"
+
+class LabelIntervalIndex:
+    """Static interval tree over label frame ranges.
+
+    Intervals are sorted by start and the tree is implicit in that array: the
+    node for a slice is its middle element and ``_max_end`` holds the largest
+    end frame of each node's subtree, so stab and overlap queries only descend
+    into subtrees that can contain a hit.
+    """
+
+    def __init__(self, intervals=()):
+        self.intervals = sorted(intervals, key=lambda iv: (iv.start, iv.end))
+        self._starts = [iv.start for iv in self.intervals]
+        self._by_end = sorted(self.intervals, key=lambda iv: iv.end)
+        self._ends = [iv.end for iv in self._by_end]
+        self._max_end = [0] * len(self.intervals)
+        if self.intervals:
+            self._build(0, len(self.intervals))
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def _build(self, lo, hi):
+        mid = (lo + hi) // 2
+        max_end = self.intervals[mid].end
+        if lo < mid:
+            max_end = max(max_end, self._build(lo, mid))
+        if mid + 1 < hi:
+            max_end = max(max_end, self._build(mid + 1, hi))
+        self._max_end[mid] = max_end
+        return max_end
+
+    def _query(self, lo, hi, start, end, result):
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        if self._max_end[mid] < start:
+            return
+        self._query(lo, mid, start, end, result)
+        interval = self.intervals[mid]
+        if interval.start > end:
+            return
+        if interval.end >= start:
+            result.append(interval)
+        self._query(mid + 1, hi, start, end, result)
+
+    def overlap(self, start, end):
+        """Return intervals sharing at least one frame with [start, end], ordered by start."""
+        result = []
+        self._query(0, len(self.intervals), start, end, result)
+        return result
+
+    def stab(self, frame):
+        """Return intervals active at the given frame."""
+        return self.overlap(frame, frame)
+
+    def nearest(self, frame):
+        """Return (interval, distance) for the range closest to frame, or (None, None) if empty.
+
+        Ranges containing the frame have distance 0.
+        """
+        if not self.intervals:
+            return None, None
+        active = self.stab(frame)
+        if active:
+            return active[0], 0
+        best, best_distance = None, None
+        # Closest range ending before the frame
+        i = bisect.bisect_left(self._ends, frame)
+        if i > 0:
+            best = self._by_end[i - 1]
+            best_distance = frame - best.end
+        # Closest range starting after the frame
+        j = bisect.bisect_right(self._starts, frame)
+        if j < len(self.intervals):
+            candidate = self.intervals[j]
+            if best is None or candidate.start - frame < best_distance:
+                best = candidate
+                best_distance = candidate.start - frame
+        return best, best_distance
+
+    def overlapping_pairs(self):
+        """Return (a, b, overlap_start, overlap_end) for every pair of overlapping ranges.
+
+        Sweeps the intervals in start order keeping a heap of ranges that are
+        still open, so the cost is O(n log n + pairs).
+        """
+        pairs = []
+        active = []
+        for order, interval in enumerate(self.intervals):
+            while active and active[0][0] < interval.start:
+                heapq.heappop(active)
+            for _, _, other in active:
+                pairs.append((other, interval, interval.start, min(other.end, interval.end)))
+            heapq.heappush(active, (interval.end, order, interval))
+        return pairs
+
+def build_label_interval_index(objects=None):
+    """Build an interval index from the animdata stored on label objects.
+
+    Returns the index and a list of (object name, animdata) for ranges that
+    could not be indexed because they are malformed or end before they start.
+    """
+    if objects is None:
+        objects = bpy.data.objects
+    intervals = []
+    invalid = []
+    for obj in objects:
+        if not obj.name.startswith("label-"):
+            continue
+        data = get_label_data(obj)
+        if data is None:
+            continue
+        animdata = data.get("animdata", "")
+        if not animdata:
+            continue
+        frame_range = parse_animdata(animdata)
+        if frame_range is None or frame_range[1] < frame_range[0]:
+            invalid.append((obj.name, animdata))
+            continue
+        description = data.get("description", "")
+        intervals.append(LabelInterval(frame_range[0], frame_range[1], obj.name, description))
+    return LabelIntervalIndex(intervals), invalid
+
+def build_marker_interval_index(scene):
+    """Build an interval index from the _start/_end timeline markers linked to labels."""
+    markers = {}
+    for marker in scene.timeline_markers:
+        if "dot_label_name" not in marker:
+            continue
+        if marker.name.endswith("_start"):
+            markers.setdefault(marker["dot_label_name"], [None, None])[0] = marker
+        elif marker.name.endswith("_end"):
+            markers.setdefault(marker["dot_label_name"], [None, None])[1] = marker
+
+    intervals = []
+    for label_name, (start_marker, end_marker) in markers.items():
+        if start_marker and end_marker:
+            start, end = sorted((start_marker.frame, end_marker.frame))
+            intervals.append(LabelInterval(start, end, label_name, (start_marker.name, end_marker.name)))
+    return LabelIntervalIndex(intervals)
+
+# Cached label interval index, rebuilt lazily after label data changes
+_label_interval_index = None
+_label_interval_invalid = []
+_label_index_object_count = -1
+_label_index_store_revision = -1
+# Label object names the index was built from
+_label_index_names = frozenset()
+# Bumped on every invalidation, so other caches built from label data can tell they are stale
+_label_data_revision = 0
+
+def get_label_interval_index():
+    """Return the cached label interval index, rebuilding it if it was invalidated."""
+    global _label_interval_index, _label_interval_invalid, _label_index_object_count, _label_index_names
+    global _label_index_store_revision
+    if _label_interval_index is None or _label_index_store_revision != get_label_store_revision():
+        _label_interval_index, _label_interval_invalid = build_label_interval_index()
+        _label_index_object_count = len(bpy.data.objects)
+        _label_index_store_revision = get_label_store_revision()
+        _label_index_names = frozenset(name for name in bpy.data.objects.keys() if name.startswith("label-"))
+    return _label_interval_index
+
+def peek_label_interval_index():
+    """Return the cached label interval index, or None while it needs a rebuild; never builds it."""
+    if _label_interval_index is None or _label_index_store_revision != get_label_store_revision():
+        return None
+    return _label_interval_index
+
+def invalidate_label_interval_index():
+    global _label_interval_index, _label_data_revision
+    _label_interval_index = None
+    _label_data_revision += 1
+
+def get_label_data_revision():
+    """Return a counter that changes whenever label data may have changed."""
+    # Both counts only grow, so their sum changes whenever either does
+    return _label_data_revision + get_label_store_revision()
+
+@persistent
+def _on_depsgraph_update_label_index(scene, depsgraph):
+    # Label data edits bump the store revision the index is checked against; only objects coming,
+    # going or being renamed into a label name change it behind its back
+    if _label_interval_index is None:
+        return
+    if len(bpy.data.objects) != _label_index_object_count:
+        invalidate_label_interval_index()
+        return
+    for update in depsgraph.updates:
+        if (isinstance(update.id, bpy.types.Object) and update.id.name.startswith("label-")
+                and update.id.name not in _label_index_names):
+            invalidate_label_interval_index()
+            return
+
+@persistent
+def _on_load_post_label_index(*args):
+    invalidate_label_interval_index()
+
+class LabelVisibilitySchedule:
+    """Precomputed show/hide events for previewing label timing during playback.
+
+    Every label range [start, end] becomes a show event at ``start`` and a hide
+    event at ``end + 1`` for the label and its paired dot. Events are sorted by
+    frame, so moving to a new frame is a binary search plus replaying (or
+    rewinding) only the events crossed, and only objects whose visibility
+    actually changes are touched.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        events = []
+        for interval in index.intervals:
+            names = (interval.key, "dot-" + interval.key[len("label-"):])
+            events.append((interval.start, True, names))
+            events.append((interval.end + 1, False, names))
+        # Hide before show on the same frame so back-to-back ranges stay visible
+        events.sort(key=lambda event: (event[0], event[1]))
+        self._events = events
+        self._event_frames = [event[0] for event in events]
+        self._position = 0
+        self.visible = {}
+
+    def reset(self, frame):
+        """Compute the full visibility state at frame and return it as {name: visible}."""
+        self._position = bisect.bisect_right(self._event_frames, frame)
+        self.visible = {}
+        for _, _, names in self._events:
+            for name in names:
+                self.visible[name] = False
+        for interval in self.index.stab(frame):
+            for name in (interval.key, "dot-" + interval.key[len("label-"):]):
+                self.visible[name] = True
+        return dict(self.visible)
+
+    def seek(self, frame):
+        """Move the schedule to frame and return {name: visible} for objects that changed."""
+        new_position = bisect.bisect_right(self._event_frames, frame)
+        target = {}
+        if new_position > self._position:
+            for _, show, names in self._events[self._position:new_position]:
+                for name in names:
+                    target[name] = show
+        elif new_position < self._position:
+            for _, show, names in reversed(self._events[new_position:self._position]):
+                for name in names:
+                    target[name] = not show
+        self._position = new_position
+
+        changes = {}
+        for name, show in target.items():
+            if self.visible.get(name) != show:
+                self.visible[name] = show
+                changes[name] = show
+        return changes
+
+_label_visibility_schedule = None
+_label_preview_original_hidden = {}
+# Bumped whenever the preview shows or hides objects; the label overlay compares against it
+_label_visibility_revision = 0
+
+def get_label_visibility_revision():
+    return _label_visibility_revision
+
+def _apply_label_visibility(changes):
+    global _label_visibility_revision
+    if changes:
+        _label_visibility_revision += 1
+    for name, show in changes.items():
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            continue
+        if name not in _label_preview_original_hidden:
+            _label_preview_original_hidden[name] = obj.hide_get()
+        try:
+            obj.hide_set(not show)
+        except RuntimeError:
+            # Object is not in the active view layer
+            continue
+
+def _sync_label_visibility_preview(scene):
+    """Bring label visibility in line with the scene's current frame."""
+    global _label_visibility_schedule
+    index = get_label_interval_index()
+    previous = _label_visibility_schedule
+    if previous is None or previous.index is not index:
+        # Label data changed: rebuild, but only touch objects whose state differs
+        _label_visibility_schedule = LabelVisibilitySchedule(index)
+        state = _label_visibility_schedule.reset(scene.frame_current)
+        known = previous.visible if previous is not None else {}
+        changes = {name: show for name, show in state.items() if known.get(name) != show}
+        if previous is not None:
+            # Labels that lost their range go back to how they were before the preview
+            for name in known:
+                if name not in state and name in _label_preview_original_hidden:
+                    changes[name] = not _label_preview_original_hidden[name]
+        _apply_label_visibility(changes)
+        return
+    _apply_label_visibility(_label_visibility_schedule.seek(scene.frame_current))
+
+def _on_frame_change_label_preview(scene, depsgraph=None):
+    _sync_label_visibility_preview(scene)
+
+def _restore_label_visibility():
+    global _label_visibility_schedule, _label_visibility_revision
+    _label_visibility_revision += 1
+    for name, hidden in _label_preview_original_hidden.items():
+        obj = bpy.data.objects.get(name)
+        if obj is not None:
+            try:
+                obj.hide_set(hidden)
+            except RuntimeError:
+                pass
+    _label_preview_original_hidden.clear()
+    _label_visibility_schedule = None
+
+def enable_label_visibility_preview(scene):
+    if _on_frame_change_label_preview not in bpy.app.handlers.frame_change_post:
+        bpy.app.handlers.frame_change_post.append(_on_frame_change_label_preview)
+    _sync_label_visibility_preview(scene)
+
+def disable_label_visibility_preview():
+    if _on_frame_change_label_preview in bpy.app.handlers.frame_change_post:
+        bpy.app.handlers.frame_change_post.remove(_on_frame_change_label_preview)
+    _restore_label_visibility()
+
+def _update_label_visibility_preview(self, context):
+    if self.label_visibility_preview:
+        enable_label_visibility_preview(self)
+    else:
+        disable_label_visibility_preview()
+
+@persistent
+def _on_load_post_label_preview(*args):
+    global _label_visibility_schedule
+    # Hidden states saved in the file are whatever the preview left behind
+    _label_preview_original_hidden.clear()
+    _label_visibility_schedule = None
+    if _on_frame_change_label_preview in bpy.app.handlers.frame_change_post:
+        bpy.app.handlers.frame_change_post.remove(_on_frame_change_label_preview)
+    scene = bpy.context.scene
+    if scene and scene.label_visibility_preview:
+        enable_label_visibility_preview(scene)
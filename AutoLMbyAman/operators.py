@@ -0,0 +1,1173 @@
+import math
+import os
+import re
+import tempfile
+import time
+
+import bpy
+from mathutils import Quaternion
+
+from .label_store import get_label_data, label_number, materialized_label_data, set_label_data
+from .labels import (
+    create_label_meshes,
+    create_label_pair,
+    get_last_marker_range,
+    get_next_label_number,
+    invalidate_label_interval_index,
+    label_pair_number,
+)
+from .pairing import get_label_pair_index, renumber_label_pairs
+from .profiling import frame_time_monitor, profiled_execute, profiler, update_profiler_enabled
+from .spatial import get_label_spatial_index
+
+def _is_dot_or_label(obj):
+    return obj.name.startswith("dot-") or obj.name.startswith("label-")
+
+def _complete_description(self, context, edit_text):
+    """Search callback of the description fields: the typed text with known words and phrases completed."""
+    from .suggester import get_description_suggester
+
+    return get_description_suggester().complete_description(edit_text)
+
+class DOT_OT_create_label(bpy.types.Operator):
+    bl_idname = "dot.create_label"
+    bl_label = "Create New Label"
+    bl_description = "Creates a new dot label at 3D cursor or replaces each selected object"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Add properties for user input
+    label_object_name: bpy.props.StringProperty(
+        name="Label Object Name",
+        default="",
+        description="Name for the label object (e.g., label-001)"
+    )
+    label_mesh_name: bpy.props.StringProperty(
+        name="Label Mesh Name",
+        default="",
+        description="Name for the label mesh data (e.g., Cube.label)"
+    )
+    dot_object_name: bpy.props.StringProperty(
+        name="Dot Object Name",
+        default="",
+        description="Name for the dot object (e.g., dot-001)"
+    )
+    dot_mesh_name: bpy.props.StringProperty(
+        name="Dot Mesh Name",
+        default="",
+        description="Name for the dot mesh data (e.g., Sphere.dot)"
+    )
+    description: bpy.props.StringProperty(
+        name="Description",
+        default="",
+        description="Description for this label (will be stored in GLB)",
+        search=_complete_description,
+        search_options={'SUGGESTION'}
+    )
+    animdata: bpy.props.StringProperty(
+        name="Animation Data",
+        default="",
+        description="Additional animation data description (will be stored in GLB)"
+    )
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    @profiled_execute
+    def execute(self, context):
+        try:
+            label_data = None
+            if self.description or self.animdata:
+                label_data = {
+                    "description": self.description,
+                    "animdata": self.animdata
+                }
+
+            # Every selected object is replaced by a label; with none selected, one is made at the 3D cursor
+            sources = list(context.selected_objects)
+            if sources:
+                placements = [(obj.location.copy(), obj.rotation_euler.copy()) for obj in sources]
+            else:
+                placements = [(context.scene.cursor.location.copy(), (0, 0, 0))]
+
+            # Take numbers from dot.XX names; the rest count up from the next free number, computed once
+            matches = [re.search(r"dot\.(\d+)", obj.name) for obj in sources] or [None]
+            next_number = max([get_next_label_number()] + [int(match.group(1)) + 1 for match in matches if match])
+            names = []
+            for match in matches:
+                if match:
+                    num = match.group(1).zfill(3)
+                else:
+                    num = str(next_number).zfill(3)
+                    next_number += 1
+                names.append((f"label-{num}", f"dot-{num}"))
+            # Explicit names only make sense for a single label
+            if len(names) == 1:
+                label_obj_name, dot_obj_name = names[0]
+                names[0] = (self.label_object_name or label_obj_name, self.dot_object_name or dot_obj_name)
+
+            label_mesh, dot_mesh, to_remove = create_label_meshes(self.label_mesh_name, self.dot_mesh_name)
+            for (label_obj_name, dot_obj_name), (loc, rot) in zip(names, placements):
+                create_label_pair(context.collection, label_obj_name, dot_obj_name, label_mesh, dot_mesh,
+                                  loc, rot, label_data)
+
+            # Remove the originals and the template meshes in one go
+            bpy.data.batch_remove(sources + to_remove)
+
+            invalidate_label_interval_index()
+            if len(names) > 1:
+                self.report({'INFO'}, f"Created {len(names)} labels")
+            return {'FINISHED'}
+        except Exception as e:
+            self.report({'ERROR'}, f"Error creating label: {str(e)}")
+            return {'CANCELLED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "label_object_name")
+        layout.prop(self, "label_mesh_name")
+        layout.prop(self, "dot_object_name")
+        layout.prop(self, "dot_mesh_name")
+        layout.prop(self, "description")
+        layout.prop(self, "animdata")
+
+class DOT_OT_edit_properties(bpy.types.Operator):
+    bl_idname = "dot.edit_properties"
+    bl_label = "Edit Properties"
+    bl_description = "Edit properties of the selected dot/label objects, keeping each dot and its label in sync"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    description: bpy.props.StringProperty(
+        name="Description",
+        default="",
+        description="Description for this label",
+        search=_complete_description,
+        search_options={'SUGGESTION'}
+    )
+    animdata: bpy.props.StringProperty(
+        name="Animation Data",
+        default="",
+        description="Additional animation data description"
+    )
+    mesh_name: bpy.props.StringProperty(
+        name="Mesh Name",
+        default="",
+        description="Name for the mesh data"
+    )
+    all_selected: bpy.props.BoolProperty(
+        name="All Selected Labels",
+        default=False,
+        description="Edit every selected dot/label and its pair instead of only the active object"
+    )
+    set_description: bpy.props.BoolProperty(
+        name="Set Description",
+        default=False,
+        description="Replace the description of every selected label"
+    )
+    set_animdata: bpy.props.BoolProperty(
+        name="Set Animation Data",
+        default=False,
+        description="Replace the animation data of every selected label"
+    )
+    find: bpy.props.StringProperty(
+        name="Find",
+        default="",
+        description="Text to replace in the descriptions"
+    )
+    replace: bpy.props.StringProperty(
+        name="Replace",
+        default="",
+        description="Replacement text; with regular expressions, \\1 refers to a group"
+    )
+    use_regex: bpy.props.BoolProperty(
+        name="Regular Expression",
+        default=False,
+        description="Treat Find as a regular expression"
+    )
+
+    def invoke(self, context, event):
+        obj = context.active_object
+        if obj:
+            data = get_label_data(obj)
+            if data is not None:
+                self.description = data.get("description", "")
+                self.animdata = data.get("animdata", "")
+            if obj.data:
+                self.mesh_name = obj.data.name
+        selected_labels = [o for o in context.selected_objects if _is_dot_or_label(o)]
+        self.all_selected = len(selected_labels) > 1
+        return context.window_manager.invoke_props_dialog(self)
+
+    def _edited(self, data, pattern):
+        """Return data with the dialog's changes applied, keeping any stored translations."""
+        data = data or {}
+        data.setdefault("description", "")
+        data.setdefault("animdata", "")
+        if not self.all_selected or self.set_description:
+            data["description"] = self.description
+        if not self.all_selected or self.set_animdata:
+            data["animdata"] = self.animdata
+        if pattern is not None:
+            if self.use_regex:
+                data["description"] = pattern.sub(self.replace, data["description"])
+            else:
+                replace = self.replace
+                data["description"] = pattern.sub(lambda match: replace, data["description"])
+        return data
+
+    @profiled_execute
+    def execute(self, context):
+        obj = context.active_object
+        if self.all_selected:
+            targets = [o for o in context.selected_objects if _is_dot_or_label(o)]
+            if not targets:
+                self.report({'ERROR'}, "No dot or label objects selected")
+                return {'CANCELLED'}
+        else:
+            if not obj:
+                self.report({'ERROR'}, "No active object selected")
+                return {'CANCELLED'}
+            if not _is_dot_or_label(obj):
+                self.report({'ERROR'}, "Selected object is not a dot or label")
+                return {'CANCELLED'}
+            targets = [obj]
+
+        pattern = None
+        if self.find:
+            try:
+                pattern = re.compile(self.find if self.use_regex else re.escape(self.find))
+            except re.error as e:
+                self.report({'ERROR'}, f"Invalid find/replace pattern: {str(e)}")
+                return {'CANCELLED'}
+
+        try:
+            # Resolve every numbered target to its dot/label pair once, so each pair is edited once
+            pair_index = get_label_pair_index()
+            numbers = list(dict.fromkeys(int(label_pair_number(target.name)) for target in targets
+                                         if label_pair_number(target.name) is not None))
+            changed = 0
+            for num in numbers:
+                dot_obj, label_obj = pair_index.pair(num)
+                # The label holds the exported data; fall back to the dot for unpaired dots
+                data = (get_label_data(label_obj) if label_obj else None) or (get_label_data(dot_obj) if dot_obj else None)
+                # One store entry shared by the dot and its label
+                set_label_data((label_obj, dot_obj), self._edited(data, pattern), number=num)
+                changed += 1
+            # Names without a plain number (label-001.001, dot-a) are edited on their own
+            for target in targets:
+                if label_pair_number(target.name) is None:
+                    set_label_data([target], self._edited(get_label_data(target), pattern))
+                    changed += 1
+        except Exception as e:
+            # Pairs before the failing one were already updated
+            invalidate_label_interval_index()
+            self.report({'ERROR'}, f"Error editing properties: {str(e)}")
+            return {'CANCELLED'}
+
+        # Update mesh name if provided
+        if not self.all_selected and self.mesh_name and obj.data:
+            obj.data.name = self.mesh_name
+
+        invalidate_label_interval_index()
+        if self.all_selected:
+            self.report({'INFO'}, f"Updated {changed} labels")
+        return {'FINISHED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "all_selected")
+        if self.all_selected:
+            row = layout.row()
+            row.prop(self, "set_description")
+            row = row.row()
+            row.enabled = self.set_description
+            row.prop(self, "description", text="")
+            row = layout.row()
+            row.prop(self, "set_animdata")
+            row = row.row()
+            row.enabled = self.set_animdata
+            row.prop(self, "animdata", text="")
+        else:
+            layout.prop(self, "description")
+            layout.prop(self, "animdata")
+            layout.prop(self, "mesh_name")
+        box = layout.box()
+        box.label(text="Find and Replace in Descriptions")
+        box.prop(self, "find")
+        box.prop(self, "replace")
+        box.prop(self, "use_regex")
+
+class DOT_OT_edit_translation(bpy.types.Operator):
+    bl_idname = "dot.edit_translation"
+    bl_label = "Edit Translation"
+    bl_description = "Edit the description of the selected dot/label object in another language"
+
+    language: bpy.props.StringProperty(
+        name="Language",
+        default="",
+        description="Language code of the translation, e.g. de or pt-BR"
+    )
+    text: bpy.props.StringProperty(
+        name="Translation",
+        default="",
+        description="Translated description; leave empty to remove the translation"
+    )
+
+    def invoke(self, context, event):
+        from .translations import SOURCE_LANGUAGE, get_label_translations, get_translation_memory, parse_languages
+
+        obj = context.active_object
+        data = get_label_data(obj) if obj else None
+        if data is not None:
+            if not self.language or self.language == SOURCE_LANGUAGE:
+                other_languages = [lang for lang in parse_languages(context.scene.label_languages)
+                                   if lang != SOURCE_LANGUAGE]
+                self.language = other_languages[0] if other_languages else ""
+            # Prefill from the label, or from the translation memory for a known description
+            translations = get_label_translations(data)
+            self.text = translations.get(self.language, "")
+            description = data.get("description", "")
+            if not self.text and description and self.language:
+                self.text = get_translation_memory().lookup_many([description], [self.language]).get(
+                    (description, self.language), "")
+        return context.window_manager.invoke_props_dialog(self)
+
+    @profiled_execute
+    def execute(self, context):
+        from .translations import SOURCE_LANGUAGE, get_label_translations, get_translation_memory
+
+        obj = context.active_object
+        data = get_label_data(obj) if obj else None
+        if data is None:
+            self.report({'ERROR'}, "Selected object has no label data")
+            return {'CANCELLED'}
+        language = self.language.strip()
+        if not language:
+            self.report({'ERROR'}, "Please enter a language code")
+            return {'CANCELLED'}
+        if language == SOURCE_LANGUAGE:
+            self.report({'ERROR'}, f"'{SOURCE_LANGUAGE}' is the description itself; use Edit Properties")
+            return {'CANCELLED'}
+
+        try:
+            translations = get_label_translations(data)
+            if self.text:
+                translations[language] = self.text
+            else:
+                translations.pop(language, None)
+            data["translations"] = translations
+            set_label_data([obj], data)
+            invalidate_label_interval_index()
+            # Remember it for every label with the same description, in this file and others
+            description = data.get("description", "")
+            if self.text:
+                get_translation_memory().store_many([(description, language, self.text)])
+            else:
+                # Or forget it, so the next export does not fill it back in from the memory
+                get_translation_memory().forget(description, language)
+        except Exception as e:
+            self.report({'ERROR'}, f"Error saving translation: {str(e)}")
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "language")
+        layout.prop(self, "text")
+
+def _select_objects(context, objects, active):
+    for obj in context.selected_objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    context.view_layer.objects.active = active
+
+class DOT_OT_select_pair(bpy.types.Operator):
+    bl_idname = "dot.select_pair"
+    bl_label = "Select Pair"
+    bl_description = "Selects the dot of the active label, or the label of the active dot"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @profiled_execute
+    def execute(self, context):
+        obj = context.active_object
+        if not obj:
+            self.report({'ERROR'}, "No active object selected")
+            return {'CANCELLED'}
+        partner = get_label_pair_index().partner(obj)
+        if partner is None:
+            self.report({'ERROR'}, f"{obj.name} has no dot/label partner")
+            return {'CANCELLED'}
+        _select_objects(context, [obj, partner], obj)
+        return {'FINISHED'}
+
+class DOT_OT_jump_to_label(bpy.types.Operator):
+    bl_idname = "dot.jump_to_label"
+    bl_label = "Jump to Label"
+    bl_description = "Selects label N and its dot and frames them in the viewport"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    number: bpy.props.IntProperty(
+        name="Label Number",
+        default=1,
+        min=0,
+        description="Number of the label to jump to"
+    )
+
+    def invoke(self, context, event):
+        obj = context.active_object
+        number = get_label_pair_index().number_of(obj) if obj else None
+        if number is not None:
+            self.number = number
+        return context.window_manager.invoke_props_dialog(self)
+
+    @profiled_execute
+    def execute(self, context):
+        dot_obj, label_obj = get_label_pair_index().pair(self.number)
+        if dot_obj is None and label_obj is None:
+            self.report({'ERROR'}, f"No label or dot numbered {self.number}")
+            return {'CANCELLED'}
+        objects = [obj for obj in (label_obj, dot_obj) if obj is not None]
+        _select_objects(context, objects, objects[0])
+        if context.area and context.area.type == 'VIEW_3D':
+            bpy.ops.view3d.view_selected()
+        return {'FINISHED'}
+
+class DOT_OT_validate_labels(bpy.types.Operator):
+    bl_idname = "dot.validate_labels"
+    bl_label = "Validate Labels"
+    bl_description = "Reports dots without labels, labels without dots, duplicate copies and numbering gaps"
+
+    @profiled_execute
+    def execute(self, context):
+        validation = get_label_pair_index().validate()
+        if not validation.problem_count:
+            self.report({'INFO'}, "All dots and labels are paired and numbered without gaps")
+            return {'FINISHED'}
+        print("\n--- Validate Labels ---")
+        for line in validation.lines():
+            print(line)
+        self.report({'WARNING'}, f"{len(validation.orphan_dots)} unlabeled dots, "
+                                 f"{len(validation.orphan_labels)} labels without a dot, "
+                                 f"{len(validation.duplicates)} duplicates, {len(validation.gaps)} gaps "
+                                 f"(details in the console)")
+        return {'FINISHED'}
+
+class DOT_OT_renumber_labels(bpy.types.Operator):
+    bl_idname = "dot.renumber_labels"
+    bl_label = "Renumber Labels"
+    bl_description = "Renames all dot/label pairs to consecutive numbers, closing gaps and splitting off duplicates"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @profiled_execute
+    def execute(self, context):
+        try:
+            renamed, removed_markers = renumber_label_pairs(context.scene)
+        except Exception as e:
+            self.report({'ERROR'}, f"Error renumbering labels: {str(e)}")
+            return {'CANCELLED'}
+        message = f"Renamed {len(renamed)} objects"
+        if removed_markers:
+            message += f", removed {removed_markers} timeline markers of deleted labels"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_confirm(self, event)
+
+class DOT_OT_select_nearest_label(bpy.types.Operator):
+    bl_idname = "dot.select_nearest_label"
+    bl_label = "Select Nearest Label"
+    bl_description = "Selects the label whose dot is closest to the 3D cursor"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @profiled_execute
+    def execute(self, context):
+        hit = get_label_spatial_index().nearest(context.scene.cursor.location)
+        if hit is None:
+            self.report({'ERROR'}, "No dots in the scene")
+            return {'CANCELLED'}
+        number, distance = hit
+        dot_obj, label_obj = get_label_pair_index().pair(number)
+        objects = [obj for obj in (label_obj, dot_obj) if obj is not None]
+        _select_objects(context, objects, objects[0])
+        self.report({'INFO'}, f"{objects[0].name} is {distance:.3f} from the cursor")
+        return {'FINISHED'}
+
+class DOT_OT_find_overlapping_labels(bpy.types.Operator):
+    bl_idname = "dot.find_overlapping_labels"
+    bl_label = "Find Overlapping Labels"
+    bl_description = "Selects the dots and labels whose dots lie within the radius of another dot"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    radius: bpy.props.FloatProperty(
+        name="Radius",
+        default=0.05,
+        min=0.0,
+        subtype='DISTANCE',
+        description="Dots closer than this count as overlapping"
+    )
+
+    def invoke(self, context, event):
+        self.radius = context.scene.label_overlap_radius
+        return context.window_manager.invoke_props_dialog(self)
+
+    @profiled_execute
+    def execute(self, context):
+        clusters = get_label_spatial_index().clusters(self.radius)
+        if not clusters:
+            self.report({'INFO'}, f"No dots within {self.radius:.3f} of each other")
+            return {'FINISHED'}
+        pair_index = get_label_pair_index()
+        objects = []
+        print("\n--- Find Overlapping Labels ---")
+        for numbers in clusters:
+            pairs = [pair_index.pair(number) for number in numbers]
+            objects.extend(obj for pair in pairs for obj in pair if obj is not None)
+            print(", ".join((label_obj or dot_obj).name for dot_obj, label_obj in pairs))
+        _select_objects(context, objects, objects[0])
+        self.report({'WARNING'}, f"{sum(len(numbers) for numbers in clusters)} labels in {len(clusters)} "
+                                 f"overlapping clusters (listed in the console)")
+        return {'FINISHED'}
+
+class DOT_OT_shift_animation(bpy.types.Operator):
+    bl_idname = "dot.shift_animation"
+    bl_label = "Shift Animation Data"
+    bl_description = "Shift all dot label animation data by specified frames"
+
+    frame_offset: bpy.props.IntProperty(
+        name="Frame Offset",
+        default=0,
+        description="Number of frames to shift animation data (positive = forward, negative = backward)"
+    )
+
+    @profiled_execute
+    def execute(self, context):
+        try:
+            # Get all objects that might have label data
+            objects = [obj for obj in bpy.data.objects if obj.name.startswith("dot-") or obj.name.startswith("label-")]
+            # A dot and its label share one store entry; shift it once
+            shifted = set()
+            
+            for obj in objects:
+                number = label_number(obj)
+                if number in shifted:
+                    continue
+                current_data = get_label_data(obj)
+                if current_data is not None:
+                    # Create a new dictionary to store the updated data, keeping any translations
+                    new_data = dict(current_data)
+                    new_data["description"] = current_data.get("description", "")
+                    new_data["animdata"] = current_data.get("animdata", "")
+                    
+                    # Update the animdata if it exists and is in the correct format
+                    if new_data["animdata"]:
+                        parts = new_data["animdata"].split("-")
+                        if len(parts) == 2:
+                            try:
+                                start_frame = int(parts[0])
+                                end_frame = int(parts[1])
+                                
+                                new_start_frame = start_frame + self.frame_offset
+                                new_end_frame = end_frame + self.frame_offset
+                                
+                                new_data["animdata"] = f"{new_start_frame}-{new_end_frame}"
+                            except ValueError:
+                                # If parsing fails, keep original data
+                                pass # Do nothing, retain original value
+                        else:
+                            # If not in "start-end" format, keep original
+                            pass # Do nothing, retain original value
+                    
+                    # Update the label data with the new data
+                    item = set_label_data([obj], {"animdata": new_data["animdata"]}, number=number)
+                    if item is not None:
+                        shifted.add(item.number)
+                    obj.update_tag()
+            invalidate_label_interval_index()
+            
+            # Force a redraw of the viewport and properties editor
+            for area in context.screen.areas:
+                if area.type == 'VIEW_3D' or area.type == 'PROPERTIES': # Also redraw properties editor
+                    area.tag_redraw()
+            
+            self.report({'INFO'}, f"Shifted animation data by {self.frame_offset} frames for existing labels.")
+            return {'FINISHED'}
+        except Exception as e:
+            self.report({'ERROR'}, f"Error shifting animation data: {str(e)}")
+            return {'CANCELLED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "frame_offset")
+
+class DOT_OT_add_timeline_markers(bpy.types.Operator):
+    bl_idname = "dot.add_timeline_markers"
+    bl_label = "Add Timeline Markers"
+    bl_description = "Adds timeline markers based on label animation data"
+
+    @profiled_execute
+    def execute(self, context):
+        try:
+            scene = context.scene
+            # Clear existing markers related to our labels to avoid duplicates
+            markers_to_remove = []
+            for marker in scene.timeline_markers:
+                if marker.name.endswith("_start") or marker.name.startswith("_end"): # Only remove markers we created
+                    markers_to_remove.append(marker)
+            for marker in markers_to_remove:
+                scene.timeline_markers.remove(marker)
+
+            # Iterate over selected objects instead of all objects
+            for obj in context.selected_objects:
+                if obj.name.startswith("label-"):
+                    data = get_label_data(obj)
+                    if data is not None:
+                        animdata = data.get("animdata", "")
+                        if animdata:
+                            parts = animdata.split("-")
+                            if len(parts) == 2:
+                                try:
+                                    start_frame = int(parts[0])
+                                    end_frame = int(parts[1])
+                                    
+                                    # Get the description for the marker name
+                                    description = data.get("description", "")
+                                    marker_base_name = obj.name
+                                    if description:
+                                        # Replace spaces with underscores for cleaner marker names
+                                        clean_description = description.replace(" ", "_")
+                                        marker_base_name = f"{obj.name}_{clean_description}"
+
+                                    # Add START marker
+                                    start_marker = scene.timeline_markers.new(f"{marker_base_name}_start", frame=start_frame)
+                                    start_marker["dot_label_name"] = obj.name # Store original label name
+                                    
+                                    # Add END marker
+                                    end_marker = scene.timeline_markers.new(f"{marker_base_name}_end", frame=end_frame)
+                                    end_marker["dot_label_name"] = obj.name # Store original label name
+
+                                    self.report({'INFO'}, f"Added markers for {obj.name}: Start {start_frame}, End {end_frame}")
+                                except ValueError:
+                                    self.report({'WARNING'}, f"Could not parse animdata for {obj.name}: {animdata}")
+                else:
+                    self.report({'INFO'}, "Please select 'label-' objects to add timeline markers.")
+
+            self.report({'INFO'}, "Timeline markers added successfully!")
+            return {'FINISHED'}
+        except Exception as e:
+            self.report({'ERROR'}, f"Error adding timeline markers: {str(e)}")
+            return {'CANCELLED'}
+
+class DOT_OT_sync_markers_to_data(bpy.types.Operator):
+    bl_idname = "dot.sync_markers_to_data"
+    bl_label = "Sync Markers to Data"
+    bl_description = "Reads timeline marker positions and updates label animation data"
+
+    @profiled_execute
+    def execute(self, context):
+        try:
+            scene = context.scene
+            updated_labels = {}
+
+            # Collect all relevant markers
+            markers = {}
+            print("\n--- Sync Markers to Data: Starting collection of markers ---")
+            for marker in scene.timeline_markers:
+                if "dot_label_name" in marker and (marker.name.endswith("_start") or marker.name.endswith("_end")):
+                    label_name = marker["dot_label_name"]
+                    print(f"Found marker: {marker.name} at frame {marker.frame}, linked to label: {label_name}")
+                    if label_name not in markers:
+                        markers[label_name] = {"start": None, "end": None}
+                    
+                    if marker.name.endswith("_start"):
+                        markers[label_name]["start"] = marker
+                    elif marker.name.endswith("_end"):
+                        markers[label_name]["end"] = marker
+            print(f"Finished collecting markers. Found {len(markers)} label groups.")
+
+            print("\n--- Sync Markers to Data: Processing label data ---")
+            for label_name, marker_pair in markers.items():
+                obj = bpy.data.objects.get(label_name)
+                print(f"Processing label: {label_name}")
+                if obj:
+                    print(f"  Label object found: {obj.name}")
+                    current_data = get_label_data(obj)
+                    if current_data is not None:
+                        if marker_pair["start"] and marker_pair["end"]:
+                            new_start_frame = int(marker_pair["start"].frame)
+                            new_end_frame = int(marker_pair["end"].frame)
+                            
+                            old_animdata_string = current_data.get("animdata")
+                            new_animdata_string = f"{new_start_frame}-{new_end_frame}"
+                            
+                            print(f"    Current animdata in property: '{old_animdata_string}'")
+                            print(f"    New animdata from markers:  '{new_animdata_string}'")
+
+                            if old_animdata_string != new_animdata_string:
+                                set_label_data([obj], {"animdata": new_animdata_string})
+                                obj.update_tag()
+                                updated_labels[label_name] = True
+                                print(f"    *** UPDATED animdata for {label_name} to: '{new_animdata_string}' ***")
+                            else:
+                                print(f"    Animdata for {label_name} is already up to date. No change needed.")
+                        else:
+                            print(f"    Warning: Missing start or end marker for {label_name}. Cannot sync.")
+                    else:
+                        print(f"    Warning: no label data found for {obj.name}. Skipping.")
+                else:
+                    print(f"  Label object '{label_name}' not found in bpy.data.objects. Skipping.")
+            
+            if updated_labels:
+                invalidate_label_interval_index()
+
+            # Force a redraw of the viewport to show property updates
+            for area in context.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+
+            if updated_labels:
+                self.report({'INFO'}, f"Synced animation data for {len(updated_labels)} labels from markers.")
+            else:
+                self.report({'INFO'}, "No label animation data needed updating from markers.")
+            print("--- Sync Markers to Data: Finished ---")
+            return {'FINISHED'}
+        except Exception as e:
+            self.report({'ERROR'}, f"Error syncing markers to data: {str(e)}")
+            print(f"Error during Sync Markers to Data: {str(e)}") # Also print to console
+            return {'CANCELLED'}
+
+class DOT_OT_export_data(bpy.types.Operator):
+    bl_idname = "dot.export_data"
+    bl_label = "Export Label Data"
+    bl_description = "Exports dot label data to HTML"
+
+    @profiled_execute
+    def execute(self, context):
+        from .exporters import export_label_data
+
+        return export_label_data(self, context)
+
+class DOT_OT_export_glb(bpy.types.Operator):
+    bl_idname = "dot.export_glb"
+    bl_label = "Export GLB"
+    bl_description = "Exports scene to GLB using Aman preset settings"
+
+    @profiled_execute
+    def execute(self, context):
+        try:
+            # Get the blend file path
+            blend_file_path = bpy.data.filepath
+            if not blend_file_path:
+                self.report({'ERROR'}, "Please save your blend file first")
+                return {'CANCELLED'}
+
+            # Set up GLB export path
+            glb_path = os.path.splitext(blend_file_path)[0] + ".glb"
+            
+            # The GLB extras carry a full dot_label_data copy on each dot and label
+            with profiler.span('gltf_export'), materialized_label_data(context.scene):
+                # Execute the export with the exact preset settings
+                bpy.ops.export_scene.gltf('EXEC_DEFAULT',
+                    filepath=glb_path,
+                    export_import_convert_lighting_mode='SPEC',
+                    gltf_export_id='',
+                    export_use_gltfpack=False,
+                    export_gltfpack_tc=True,
+                    export_gltfpack_tq=8,
+                    export_gltfpack_si=1.0,
+                    export_gltfpack_sa=False,
+                    export_gltfpack_slb=False,
+                    export_gltfpack_vp=14,
+                    export_gltfpack_vt=12,
+                    export_gltfpack_vn=8,
+                    export_gltfpack_vc=8,
+                    export_gltfpack_vpi='Integer',
+                    export_gltfpack_noq=True,
+                    export_gltfpack_kn=False,
+                    export_format='GLB',
+                    ui_tab='GENERAL',
+                    export_copyright='',
+                    export_image_format='AUTO',
+                    export_image_add_webp=False,
+                    export_image_webp_fallback=False,
+                    export_texture_dir='',
+                    export_jpeg_quality=75,
+                    export_image_quality=75,
+                    export_keep_originals=False,
+                    export_texcoords=True,
+                    export_normals=True,
+                    export_gn_mesh=False,
+                    export_draco_mesh_compression_enable=False,
+                    export_draco_mesh_compression_level=6,
+                    export_draco_position_quantization=14,
+                    export_draco_normal_quantization=10,
+                    export_draco_texcoord_quantization=12,
+                    export_draco_color_quantization=10,
+                    export_draco_generic_quantization=12,
+                    export_tangents=False,
+                    export_materials='EXPORT',
+                    export_unused_images=False,
+                    export_unused_textures=False,
+                    export_vertex_color='MATERIAL',
+                    export_all_vertex_colors=True,
+                    export_active_vertex_color_when_no_material=True,
+                    export_attributes=False,
+                    use_mesh_edges=False,
+                    use_mesh_vertices=False,
+                    export_cameras=False,
+                    use_selection=False,
+                    use_visible=False,
+                    use_renderable=False,
+                    use_active_collection_with_nested=True,
+                    use_active_collection=False,
+                    use_active_scene=False,
+                    collection='',
+                    at_collection_center=False,
+                    export_extras=True,
+                    export_yup=True,
+                    export_apply=False,
+                    export_shared_accessors=False,
+                    export_animations=True,
+                    export_frame_range=False,
+                    export_frame_step=1,
+                    export_force_sampling=True,
+                    export_sampling_interpolation_fallback='LINEAR',
+                    export_pointer_animation=False,
+                    export_animation_mode='ACTIVE_ACTIONS',
+                    export_nla_strips_merged_animation_name='Animation',
+                    export_def_bones=False,
+                    export_hierarchy_flatten_bones=False,
+                    export_hierarchy_flatten_objs=False,
+                    export_armature_object_remove=False,
+                    export_leaf_bone=False,
+                    export_optimize_animation_size=True,
+                    export_optimize_animation_keep_anim_armature=True,
+                    export_optimize_animation_keep_anim_object=False,
+                    export_optimize_disable_viewport=False,
+                    export_negative_frame='SLIDE',
+                    export_anim_slide_to_zero=False,
+                    export_bake_animation=False,
+                    export_merge_animation='ACTION',
+                    export_anim_single_armature=True,
+                    export_reset_pose_bones=True,
+                    export_current_frame=False,
+                    export_rest_position_armature=True,
+                    export_anim_scene_split_object=True,
+                    export_skins=True,
+                    export_influence_nb=4,
+                    export_all_influences=False,
+                    export_morph=True,
+                    export_morph_normal=True,
+                    export_morph_tangent=False,
+                    export_morph_animation=True,
+                    export_morph_reset_sk_data=True,
+                    export_lights=False,
+                    export_try_sparse_sk=True,
+                    export_try_omit_sparse_sk=False,
+                    export_gpu_instances=False,
+                    export_action_filter=False,
+                    export_convert_animation_pointer=False,
+                    export_nla_strips=True,
+                    export_original_specular=False,
+                    will_save_settings=False,
+                    export_hierarchy_full_collections=False,
+                    export_extra_animations=False,
+                    export_loglevel=-1
+                )
+            
+            self.report({'INFO'}, f"Exported GLB file: {glb_path}")
+            return {'FINISHED'}
+        except Exception as e:
+            self.report({'ERROR'}, f"Error exporting GLB: {str(e)}")
+            print(f"GLB export error details: {str(e)}")
+            return {'CANCELLED'}
+
+class DOT_OT_quick_create_label(bpy.types.Operator):
+    bl_idname = "dot.quick_create_label"
+    bl_label = "Quick Create Label"
+    bl_description = "Quickly creates a new dot label at selected object position"
+    
+    description: bpy.props.StringProperty(
+        name="Description",
+        default="",
+        description="Description for this label",
+        search=_complete_description,
+        search_options={'SUGGESTION'}
+    )
+    animdata: bpy.props.StringProperty(
+        name="Animation Data",
+        default="",
+        description="Animation data in format: start_frame-end_frame"
+    )
+    
+    _current_suggestions = []
+    # Every typo flagged while the dialog was open, with its suggestions
+    _shown_suggestions = {}
+    _last_marker_range = None
+    _last_marker_names = (None, None)
+    
+    def invoke(self, context, event):
+        self._shown_suggestions = {}
+        # Suggest animation data from the last two timeline markers only
+        marker_range, start_name, end_name = get_last_marker_range(context)
+        self._last_marker_range = marker_range
+        self._last_marker_names = (start_name, end_name)
+        if marker_range:
+            self.animdata = marker_range
+        return context.window_manager.invoke_props_dialog(self)
+    
+    @profiled_execute
+    def execute(self, context):
+        try:
+            # Get position and rotation from selected object or 3D cursor
+            if context.selected_objects:
+                obj = context.selected_objects[0]
+                loc = obj.location.copy()
+                rot = obj.rotation_euler.copy()
+            else:
+                loc = context.scene.cursor.location.copy()
+                rot = (0, 0, 0)
+            
+            # Get next label number
+            num = get_next_label_number()
+            label_name = f"label-{str(num).zfill(3)}"
+            dot_name = f"dot-{str(num).zfill(3)}"
+            
+            label_data = None
+            if self.description or self.animdata:
+                label_data = {
+                    "description": self.description,
+                    "animdata": self.animdata
+                }
+            
+            label_mesh, dot_mesh, to_remove = create_label_meshes()
+            create_label_pair(context.collection, label_name, dot_name, label_mesh, dot_mesh, loc, rot, label_data)
+            bpy.data.batch_remove(to_remove)
+            
+            # Add description to suggester
+            if self.description:
+                from .suggester import get_description_suggester
+
+                description_suggester = get_description_suggester()
+                # Flagged typos that are gone from the final text were corrected; remember how
+                description_suggester.learn_corrections(self._shown_suggestions, self.description)
+                description_suggester.add_description(self.description)
+                description_suggester.save_data()
+            
+            invalidate_label_interval_index()
+            return {'FINISHED'}
+        except Exception as e:
+            self.report({'ERROR'}, f"Error creating quick label: {str(e)}")
+            return {'CANCELLED'}
+    
+    def draw(self, context):
+        layout = self.layout
+        # Description field with spell checking
+        box = layout.box()
+        box.label(text="Description:")
+        row = box.row()
+        row.prop(self, "description", text="")
+        if self.description:
+            from .suggester import get_description_suggester
+
+            self._current_suggestions = get_description_suggester().check_description(self.description)
+            for suggestion in self._current_suggestions:
+                self._shown_suggestions[suggestion['word']] = suggestion['suggestions']
+            if self._current_suggestions:
+                box.label(text="Suggestions:")
+                for suggestion in self._current_suggestions:
+                    row = box.row()
+                    row.label(text=f"'{suggestion['word']}' → {', '.join(suggestion['suggestions'])}")
+        # Animation data field with only last marker range suggestion
+        box = layout.box()
+        box.label(text="Animation Data:")
+        row = box.row()
+        row.prop(self, "animdata", text="")
+        if self._last_marker_range:
+            box.label(text="Last Marker Range:")
+            row = box.row()
+            start_name, end_name = self._last_marker_names
+            label_text = f"{start_name} → {end_name}: {self._last_marker_range}" if start_name and end_name else self._last_marker_range
+            row.label(text=label_text)
+            op = row.operator("dot.use_last_marker_range", text="Use")
+            op.range = self._last_marker_range
+
+class DOT_OT_use_last_marker_range(bpy.types.Operator):
+    bl_idname = "dot.use_last_marker_range"
+    bl_label = "Use Last Marker Range"
+    bl_description = "Use the last marker range for animation data"
+    
+    range: bpy.props.StringProperty(
+        name="Range",
+        default="",
+        description="Animation range to use"
+    )
+    
+    @profiled_execute
+    def execute(self, context):
+        for op in context.window_manager.operators:
+            if op.bl_idname == "dot.quick_create_label":
+                op.animdata = self.range
+                context.area.tag_redraw()
+                break
+        return {'FINISHED'}
+
+class DOT_OT_add_word_to_dictionary(bpy.types.Operator):
+    bl_idname = "dot.add_word_to_dictionary"
+    bl_label = "Add Word to Dictionary"
+    bl_description = "Manually add a word or phrase to the description suggester dictionary"
+    
+    new_word: bpy.props.StringProperty(
+        name="Word/Phrase",
+        default="",
+        description="Enter word or phrase to add to the dictionary"
+    )
+
+    @profiled_execute
+    def execute(self, context):
+        if self.new_word:
+            from .suggester import get_description_suggester
+
+            description_suggester = get_description_suggester()
+            description_suggester.add_description(self.new_word)
+            description_suggester.save_data()
+            self.report({'INFO'}, f"'{self.new_word}' added to dictionary.")
+        else:
+            self.report({'WARNING'}, "Please enter a word or phrase.")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "new_word")
+
+class DOT_OT_toggle_performance_monitor(bpy.types.Operator):
+    bl_idname = "dot.toggle_performance_monitor"
+    bl_label = "Toggle Performance Monitor"
+    bl_description = "Toggle performance monitoring display"
+    
+    @profiled_execute
+    def execute(self, context):
+        context.scene.show_performance_stats = not context.scene.show_performance_stats
+        return {'FINISHED'}
+
+class DOT_OT_viewport_benchmark(bpy.types.Operator):
+    bl_idname = "dot.viewport_benchmark"
+    bl_label = "Run Viewport Benchmark"
+    bl_description = "Orbit the 3D view for a few seconds and report measured frame times"
+
+    duration: bpy.props.FloatProperty(
+        name="Duration",
+        default=10.0,
+        min=1.0,
+        max=120.0,
+        description="How long to orbit the view, in seconds"
+    )
+    revolutions: bpy.props.FloatProperty(
+        name="Revolutions",
+        default=1.0,
+        min=0.1,
+        description="Number of full turns around the view center during the benchmark"
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.area is not None and context.area.type == 'VIEW_3D'
+
+    @profiled_execute
+    def execute(self, context):
+        if frame_time_monitor.benchmark_running:
+            self.report({'WARNING'}, "A viewport benchmark is already running")
+            return {'CANCELLED'}
+        # Run from the sidebar, context.region is the UI region; the view is drawn in the main one
+        region = context.region
+        if region is None or region.type != 'WINDOW':
+            region = next((region for region in context.area.regions if region.type == 'WINDOW'), None)
+        if region is None:
+            self.report({'ERROR'}, "The 3D Viewport has no main region to benchmark")
+            return {'CANCELLED'}
+        region_3d = context.region_data or context.space_data.region_3d
+        self._region_3d = region_3d
+        self._start_rotation = region_3d.view_rotation.copy()
+        self._area = context.area
+        self._start_time = time.perf_counter()
+        frame_time_monitor.benchmark_running = True
+        frame_time_monitor.benchmark_region = region.as_pointer()
+        frame_time_monitor.reset()
+        update_profiler_enabled(context)
+        self._timer = context.window_manager.event_timer_add(1.0 / 240.0, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._finish(context)
+            self.report({'WARNING'}, "Viewport benchmark cancelled")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        elapsed = time.perf_counter() - self._start_time
+        if elapsed >= self.duration:
+            result = self._finish(context)
+            if result is None:
+                self.report({'WARNING'}, "No frames were drawn during the benchmark")
+                return {'CANCELLED'}
+            self.report({'INFO'}, f"Viewport benchmark: {result['fps']:.1f} FPS average, "
+                                  f"1% low {result['low_1_percent_fps']:.1f} FPS, p99 {result['p99_ms']:.1f}ms, "
+                                  f"{result['stutters']} stutters over {result['samples']} frames")
+            return {'FINISHED'}
+
+        angle = 2.0 * math.pi * self.revolutions * elapsed / self.duration
+        self._region_3d.view_rotation = Quaternion((0.0, 0.0, 1.0), angle) @ self._start_rotation
+        self._area.tag_redraw()
+        return {'RUNNING_MODAL'}
+
+    def _finish(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        self._region_3d.view_rotation = self._start_rotation
+        self._area.tag_redraw()
+        frame_time_monitor.benchmark_running = False
+        frame_time_monitor.benchmark_region = None
+        update_profiler_enabled(context)
+        frame_time_monitor.last_benchmark = frame_time_monitor.summary()
+        return frame_time_monitor.last_benchmark
+
+class DOT_OT_toggle_trace_recording(bpy.types.Operator):
+    bl_idname = "dot.toggle_trace_recording"
+    bl_label = "Toggle Trace Recording"
+    bl_description = "Start recording profiler spans, or stop and save them as a Chrome trace and CSV summary next to the .blend file"
+
+    @profiled_execute
+    def execute(self, context):
+        if profiler.recorder is None:
+            from .tracing import TraceRecorder
+
+            recorder = TraceRecorder()
+            recorder.start()
+            profiler.recorder = recorder
+            update_profiler_enabled(context)
+            self.report({'INFO'}, "Trace recording started.")
+            return {'FINISHED'}
+
+        recorder = profiler.recorder
+        profiler.recorder = None
+        update_profiler_enabled(context)
+        try:
+            blend_file_path = bpy.data.filepath
+            if blend_file_path:
+                base_path = os.path.splitext(blend_file_path)[0]
+            else:
+                base_path = os.path.join(tempfile.gettempdir(), "autolm")
+                self.report({'WARNING'}, "Blend file is not saved, writing trace to the temp directory")
+            json_path, csv_path = recorder.write(base_path)
+            self.report({'INFO'}, f"Saved {len(recorder.events)} trace events: {json_path}, {csv_path}")
+            return {'FINISHED'}
+        except Exception as e:
+            self.report({'ERROR'}, f"Error saving trace: {str(e)}")
+            return {'CANCELLED'}
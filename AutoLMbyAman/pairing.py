@@ -0,0 +1,301 @@
+"""Maintained index of dot-NNN/label-NNN pairs, with orphan and duplicate detection.
+
+Names are parsed once and kept up to date incrementally: object additions,
+deletions and renames only re-parse the names that changed. Blender's
+.001 duplicate suffixes are recognised, so a copied label shows up as a
+duplicate instead of being ignored.
+"""
+
+import re
+import uuid
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .label_store import LABEL_REF_KEY, get_label_data, prune_label_store, set_label_data
+from .labels import invalidate_label_interval_index
+
+PAIR_NAME_PATTERN = re.compile(r"^(dot|label)-(\d+)(?:\.(\d{3}))?$")
+
+def parse_pair_name(name):
+    """Return (kind, number, duplicate suffix or None) for a dot/label name, or None."""
+    match = PAIR_NAME_PATTERN.match(name)
+    if not match:
+        return None
+    return match.group(1), int(match.group(2)), match.group(3)
+
+class PairValidation:
+    """Problems found in the dot/label numbering."""
+
+    def __init__(self, orphan_dots, orphan_labels, duplicates, gaps):
+        self.orphan_dots = orphan_dots
+        self.orphan_labels = orphan_labels
+        self.duplicates = duplicates
+        self.gaps = gaps
+
+    @property
+    def problem_count(self):
+        return len(self.orphan_dots) + len(self.orphan_labels) + len(self.duplicates) + len(self.gaps)
+
+    def lines(self):
+        lines = []
+        if self.orphan_dots:
+            lines.append(f"Dots without a label: {', '.join(self.orphan_dots)}")
+        if self.orphan_labels:
+            lines.append(f"Labels without a dot: {', '.join(self.orphan_labels)}")
+        if self.duplicates:
+            lines.append(f"Duplicates: {', '.join(self.duplicates)}")
+        if self.gaps:
+            lines.append("Unused numbers: " + ", ".join(
+                str(start) if start == end else f"{start}-{end}" for start, end in self.gaps))
+        return lines
+
+class LabelPairIndex:
+    """{number: {"dot": [names], "label": [names]}} over the dot/label objects.
+
+    The name without a duplicate suffix, preferring the zero-padded one, is
+    listed first and is the primary object of its kind; further names are
+    duplicates. Call ensure() (the accessors do) to apply pending changes
+    before reading.
+    """
+
+    def __init__(self):
+        # Bumped whenever a sync changed the pairs
+        self.revision = 0
+        self.clear()
+
+    def clear(self):
+        """Forget every parsed name, e.g. for a newly loaded file; the next ensure() re-parses them all."""
+        self._parsed = {}
+        self._groups = {}
+        self._object_count = -1
+        self.revision += 1
+        self.dirty = True
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def ensure(self):
+        # The count check catches objects added or removed since the last depsgraph update
+        if self.dirty or len(bpy.data.objects) != self._object_count:
+            self.sync()
+        return self
+
+    def sync(self):
+        """Re-parse only the object names that appeared or disappeared since the last sync."""
+        current = set(bpy.data.objects.keys())
+        known = self._parsed.keys()
+        removed = known - current
+        added = current - known
+        for name in removed:
+            self._remove(name)
+        for name in added:
+            self._add(name)
+        if removed or added:
+            self.revision += 1
+        self._object_count = len(current)
+        self.dirty = False
+
+    def _add(self, name):
+        parsed = parse_pair_name(name)
+        self._parsed[name] = parsed
+        if parsed is None:
+            return
+        kind, number, suffix = parsed
+        names = self._groups.setdefault(number, {"dot": [], "label": []})[kind]
+        # label-001 stays primary over label-1, whichever is parsed first
+        canonical = f"{kind}-{number:03d}"
+        if name == canonical or (suffix is None and not (names and names[0] == canonical)):
+            names.insert(0, name)
+        else:
+            names.append(name)
+
+    def _remove(self, name):
+        parsed = self._parsed.pop(name)
+        if parsed is None:
+            return
+        kind, number, _ = parsed
+        group = self._groups[number]
+        group[kind].remove(name)
+        if not group["dot"] and not group["label"]:
+            del self._groups[number]
+
+    def is_stale(self, depsgraph):
+        """Return whether objects were added, removed or renamed since the last sync, judging by a depsgraph update."""
+        # Additions and deletions change the object count; Python renames show up as unknown names
+        if len(bpy.data.objects) != self._object_count:
+            return True
+        return any(isinstance(update.id, bpy.types.Object) and update.id.name not in self._parsed
+                   for update in depsgraph.updates)
+
+    def _parse(self, obj):
+        self.ensure()
+        if obj.name not in self._parsed:
+            # Renamed since the last update
+            self.sync()
+        return self._parsed.get(obj.name)
+
+    def numbers(self):
+        return sorted(self.ensure()._groups)
+
+    def pair(self, number):
+        """Return the primary (dot, label) objects for a group number; either may be None."""
+        group = self.ensure()._groups.get(number)
+        if group is None:
+            return None, None
+        # A lone .001 copy counts as the primary once the original is gone
+        names = [group[kind][0] if group[kind] else None for kind in ("dot", "label")]
+        objects = [bpy.data.objects.get(name) if name else None for name in names]
+        if any(name and obj is None for name, obj in zip(names, objects)):
+            # A listed object was renamed since the last update
+            self.sync()
+            return self.pair(number)
+        return objects[0], objects[1]
+
+    def number_of(self, obj):
+        """Return obj's group number, or None when it is not a dot or label."""
+        parsed = self._parse(obj)
+        return parsed[1] if parsed else None
+
+    def partner(self, obj):
+        """Return the label of a dot or the dot of a label, or None."""
+        parsed = self._parse(obj)
+        if not parsed:
+            return None
+        dot_obj, label_obj = self.pair(parsed[1])
+        return label_obj if parsed[0] == "dot" else dot_obj
+
+    def pair_groups(self):
+        """Return [(number, suffix, dot name or None, label name or None)] with duplicates as their own pairs.
+
+        A duplicate dot and label are paired when they share number and suffix.
+        """
+        pairs = []
+        for number in self.numbers():
+            group = self._groups[number]
+            by_suffix = {}
+            for kind in ("dot", "label"):
+                for name in group[kind]:
+                    by_suffix.setdefault(self._parsed[name][2], {"dot": None, "label": None})[kind] = name
+            for suffix in sorted(by_suffix, key=lambda s: s or ""):
+                pairs.append((number, suffix, by_suffix[suffix]["dot"], by_suffix[suffix]["label"]))
+        return pairs
+
+    def validate(self):
+        orphan_dots = []
+        orphan_labels = []
+        duplicates = []
+        numbers = self.numbers()
+        for number in numbers:
+            group = self._groups[number]
+            if group["dot"] and not group["label"]:
+                orphan_dots.append(group["dot"][0])
+            if group["label"] and not group["dot"]:
+                orphan_labels.append(group["label"][0])
+            duplicates.extend(group["dot"][1:] + group["label"][1:])
+        gaps = []
+        previous = 0
+        for number in numbers:
+            if number > previous + 1:
+                gaps.append((previous + 1, number - 1))
+            previous = number
+        return PairValidation(orphan_dots, orphan_labels, duplicates, gaps)
+
+label_pair_index = LabelPairIndex()
+
+def get_label_pair_index():
+    """Return the shared LabelPairIndex, brought up to date."""
+    return label_pair_index.ensure()
+
+def renumber_label_pairs(scene=None):
+    """Rename every dot/label pair to consecutive numbers from 1.
+
+    Pairs keep their order, duplicates (.001 copies) become pairs of their
+    own, and each pair's label data and timeline markers follow it.
+    Markers of labels that no longer exist are removed first, or they would
+    attach to whichever pair takes over their name. Returns ({old name: new
+    name}, number of markers removed).
+    """
+    scene = scene or bpy.context.scene
+    stale_markers = [marker for marker in scene.timeline_markers
+                     if "dot_label_name" in marker and bpy.data.objects.get(marker["dot_label_name"]) is None]
+    for marker in stale_markers:
+        scene.timeline_markers.remove(marker)
+
+    plan = []
+    for new_number, (_, _, dot_name, label_name) in enumerate(get_label_pair_index().pair_groups(), start=1):
+        dot_obj = bpy.data.objects.get(dot_name) if dot_name else None
+        label_obj = bpy.data.objects.get(label_name) if label_name else None
+        # Read everything before renaming: the old numbers get reused
+        data = (get_label_data(label_obj, scene) if label_obj else None) or (get_label_data(dot_obj, scene) if dot_obj else None)
+        plan.append((new_number, dot_obj, label_obj, data))
+
+    renamed = {}
+    moves = []
+    for new_number, dot_obj, label_obj, _ in plan:
+        for kind, obj in (("dot", dot_obj), ("label", label_obj)):
+            new_name = f"{kind}-{new_number:03d}"
+            if obj is not None and obj.name != new_name:
+                renamed[obj.name] = new_name
+                moves.append((obj, new_name))
+    # Rename through temporary names so no target name is still taken. The uuid keeps them
+    # clear of the user's own names, which would otherwise get pushed to .001 and renamed.
+    temp_prefix = f"renumber-{uuid.uuid4().hex}-"
+    for position, (obj, _) in enumerate(moves):
+        obj.name = f"{temp_prefix}{position}"
+    for obj, new_name in moves:
+        obj.name = new_name
+
+    for new_number, dot_obj, label_obj, data in plan:
+        objects = [obj for obj in (label_obj, dot_obj) if obj is not None]
+        if data is None:
+            # No data: drop any reference to a number that now belongs to another pair
+            for obj in objects:
+                if LABEL_REF_KEY in obj:
+                    del obj[LABEL_REF_KEY]
+            continue
+        # Write every field so nothing is left over from the item's previous owner
+        set_label_data(objects, {"description": data.get("description", ""), "animdata": data.get("animdata", ""),
+                                 "translations": data.get("translations", {})}, number=new_number, scene=scene)
+    prune_label_store(scene)
+
+    for marker in scene.timeline_markers:
+        old_name = marker.get("dot_label_name")
+        if old_name in renamed:
+            marker["dot_label_name"] = renamed[old_name]
+            if marker.name.startswith(old_name):
+                marker.name = renamed[old_name] + marker.name[len(old_name):]
+
+    invalidate_label_interval_index()
+    label_pair_index.mark_dirty()
+    return renamed, len(stale_markers)
+
+# Owner of the rename subscription; subscriptions are dropped on file load
+_msgbus_owner = object()
+
+def _on_object_renamed():
+    label_pair_index.mark_dirty()
+    # The label timing index is keyed by label name
+    invalidate_label_interval_index()
+
+def subscribe_rename_notifications():
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.Object, "name"),
+        owner=_msgbus_owner,
+        args=(),
+        notify=_on_object_renamed,
+    )
+
+def unsubscribe_rename_notifications():
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+
+@persistent
+def _on_depsgraph_update_pairing(scene, depsgraph):
+    if not label_pair_index.dirty and label_pair_index.is_stale(depsgraph):
+        label_pair_index.mark_dirty()
+
+@persistent
+def _on_load_post_pairing(*args):
+    # A new file: start from scratch and renew the rename subscription
+    label_pair_index.clear()
+    subscribe_rename_notifications()
@@ -0,0 +1,220 @@
+import bpy
+
+from .label_store import get_label_data
+from .labels import get_label_data_revision, get_label_interval_index, peek_label_interval_index
+from .pairing import get_label_pair_index
+from .profiling import frame_time_monitor, overlay_snapshot, profiler
+
+class SceneSummary:
+    """Label counts shown in the panel, computed off the draw path."""
+
+    def __init__(self, label_count=0, dot_count=0, unlabeled_dots=0, orphan_markers=0, duplicates=0, gaps=0):
+        self.label_count = label_count
+        self.dot_count = dot_count
+        self.unlabeled_dots = unlabeled_dots
+        self.orphan_markers = orphan_markers
+        self.duplicates = duplicates
+        self.gaps = gaps
+
+def build_scene_summary(scene):
+    pair_index = get_label_pair_index()
+    validation = pair_index.validate()
+    group_count = len(pair_index.numbers())
+    object_names = set(bpy.data.objects.keys())
+    # Markers created for a label that has since been deleted or renamed
+    orphan_markers = sum(1 for marker in scene.timeline_markers
+                         if "dot_label_name" in marker and marker["dot_label_name"] not in object_names)
+    return SceneSummary(group_count - len(validation.orphan_dots), group_count - len(validation.orphan_labels),
+                        len(validation.orphan_dots), orphan_markers, len(validation.duplicates), len(validation.gaps))
+
+class PanelModel:
+    """Cached text for the label panel so redraws do not rescan the scene.
+
+    The active object's properties are keyed on its pointer and the label
+    data revision; the scene summary and the label interval index are
+    rebuilt on a debounced timer once the revision (or the marker count)
+    has stopped changing.
+    """
+
+    SUMMARY_DELAY = 0.3
+
+    def __init__(self):
+        self.active_key = None
+        self.active_lines = []
+        self.summary = None
+        self.summary_key = None
+        self._pending_key = None
+
+    def active_object_lines(self, obj):
+        """Return the property lines shown for obj, rebuilt only when it or its label data changed."""
+        key = (obj.as_pointer(), obj.name, get_label_data_revision())
+        if key != self.active_key:
+            lines = []
+            data = get_label_data(obj)
+            if data is not None:
+                lines.append(f"Description: {data.get('description', 'No description')}")
+                lines.append(f"Animation Data: {data.get('animdata', 'No animation data')}")
+                translations = data.get("translations")
+                if translations:
+                    lines.extend(f"[{language}] {translations[language]}" for language in sorted(translations.keys()))
+            if obj.data:
+                lines.append(f"Mesh Name: {obj.data.name}")
+            self.active_key = key
+            self.active_lines = lines
+        return self.active_lines
+
+    def scene_summary(self, scene):
+        """Return the cached SceneSummary (None before the first build), scheduling a rebuild when stale."""
+        key = (get_label_data_revision(), len(scene.timeline_markers))
+        if key != self.summary_key and not bpy.app.timers.is_registered(_refresh_scene_summary):
+            self._pending_key = key
+            bpy.app.timers.register(_refresh_scene_summary, first_interval=self.SUMMARY_DELAY)
+        return self.summary
+
+    def refresh_summary(self, scene):
+        """Rebuild the summary if nothing changed since the last check; return the delay until the next check."""
+        key = (get_label_data_revision(), len(scene.timeline_markers))
+        if key != self._pending_key:
+            # Still changing; wait until the edits settle
+            self._pending_key = key
+            return self.SUMMARY_DELAY
+        # Off the draw path: the panel only reads the index
+        get_label_interval_index()
+        self.summary = build_scene_summary(scene)
+        self.summary_key = key
+        return None
+
+panel_model = PanelModel()
+
+def _refresh_scene_summary():
+    scene = bpy.context.scene
+    if not scene:
+        return None
+    delay = panel_model.refresh_summary(scene)
+    if delay is None:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    return delay
+
+class DOT_PT_label_panel(bpy.types.Panel):
+    bl_label = "AutoLMbyAman"
+    bl_idname = "DOT_PT_label_panel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'AutoLMbyAman'
+
+    def draw_with_performance(self, context):
+        with profiler.span('panel_draw'):
+            self.draw_panel(context)
+
+    def draw_panel(self, context):
+        layout = self.layout
+        obj = context.active_object
+
+        # Create label button
+        layout.operator("dot.create_label")
+        
+        # Property management section
+        if obj and (obj.name.startswith("dot-") or obj.name.startswith("label-")):
+            box = layout.box()
+            box.label(text="Properties")
+            
+            # Show current properties and mesh name
+            for text in panel_model.active_object_lines(obj):
+                box.label(text=text)
+            
+            # Edit button
+            box.operator("dot.edit_properties")
+            box.operator("dot.edit_translation")
+            box.operator("dot.select_pair")
+
+        # Scene summary, refreshed in the background after edits
+        summary = panel_model.scene_summary(context.scene)
+        box = layout.box()
+        if summary is None:
+            box.label(text="Scene Summary: updating...")
+        else:
+            box.label(text=f"Labels: {summary.label_count}, Dots: {summary.dot_count}")
+            box.label(text=f"Unlabeled Dots: {summary.unlabeled_dots}",
+                      icon='ERROR' if summary.unlabeled_dots else 'CHECKMARK')
+            box.label(text=f"Orphan Markers: {summary.orphan_markers}",
+                      icon='ERROR' if summary.orphan_markers else 'CHECKMARK')
+            box.label(text=f"Duplicates: {summary.duplicates}, Numbering Gaps: {summary.gaps}",
+                      icon='ERROR' if summary.duplicates or summary.gaps else 'CHECKMARK')
+        row = box.row()
+        row.operator("dot.jump_to_label")
+        row.operator("dot.validate_labels")
+        box.operator("dot.renumber_labels")
+        row = box.row()
+        row.operator("dot.select_nearest_label")
+        row.operator("dot.find_overlapping_labels")
+        box.prop(context.scene, "label_overlap_radius")
+
+        # Labels whose animation range covers the current frame
+        frame = context.scene.frame_current
+        label_index = peek_label_interval_index()
+        box = layout.box()
+        if label_index is None:
+            # Rebuilt by the summary timer scheduled above
+            box.label(text=f"Labels Active at Frame {frame}: updating...")
+        else:
+            active_labels = label_index.stab(frame)
+            box.label(text=f"Labels Active at Frame {frame}: {len(active_labels)}")
+            for interval in active_labels[:10]:
+                box.label(text=f"{interval.key} ({interval.start}-{interval.end}): {interval.payload or 'No description'}")
+            if len(active_labels) > 10:
+                box.label(text=f"... and {len(active_labels) - 10} more")
+            if not active_labels and len(label_index):
+                nearest, distance = label_index.nearest(frame)
+                box.label(text=f"Nearest: {nearest.key} ({nearest.start}-{nearest.end}), {distance} frames away")
+
+        # Animation tools section
+        box = layout.box()
+        box.label(text="Animation Tools")
+        box.operator("dot.shift_animation")
+        box.operator("dot.add_timeline_markers")
+        box.operator("dot.sync_markers_to_data")
+        box.prop(context.scene, "label_visibility_preview")
+        row = box.row()
+        row.prop(context.scene, "show_label_overlay")
+        row.prop(context.scene, "label_overlay_budget")
+
+        # Export section
+        box = layout.box()
+        box.label(text="Export Options")
+        box.operator("dot.export_data", text="Export Label Data (HTML/JSON)")
+        box.prop(context.scene, "report_mode")
+        box.prop(context.scene, "report_minify")
+        box.prop(context.scene, "label_json_format")
+        box.prop(context.scene, "label_json_compression")
+        box.prop(context.scene, "label_languages")
+        box.operator("dot.export_glb", text="Export GLB")
+
+        # Dictionary Management
+        box = layout.box()
+        box.label(text="Dictionary Management")
+        box.operator("dot.add_word_to_dictionary", icon='PLUS')
+
+        # Add performance monitoring section
+        box = layout.box()
+        box.label(text="Performance Monitoring")
+        box.operator("dot.toggle_performance_monitor", 
+                    text="Show Stats" if not context.scene.show_performance_stats else "Hide Stats")
+        box.operator("dot.toggle_trace_recording",
+                    text="Start Trace Recording" if profiler.recorder is None else "Stop and Save Trace",
+                    icon='REC')
+        
+        if context.scene.show_performance_stats:
+            box.label(text=overlay_snapshot.fps_text)
+            for text in overlay_snapshot.frame_lines + overlay_snapshot.panel_lines:
+                box.label(text=text)
+        box.operator("dot.viewport_benchmark", icon='VIEW_CAMERA')
+        if frame_time_monitor.last_benchmark:
+            result = frame_time_monitor.last_benchmark
+            box.label(text=f"Benchmark: {result['fps']:.1f} FPS, 1% low {result['low_1_percent_fps']:.1f}, "
+                           f"{result['stutters']} stutters over {result['samples']} frames")
+
+    def draw(self, context):
+        self.draw_with_performance(context)
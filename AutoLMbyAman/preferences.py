@@ -0,0 +1,49 @@
+import time
+
+import bpy
+
+from .profiling import profiled_execute
+
+class AutoLMbyAmanPreferences(bpy.types.AddonPreferences):
+    bl_idname = __package__
+
+    def draw(self, context):
+        from .updater import check_for_update, get_update_checker
+
+        layout = self.layout
+
+        # Update check section
+        box = layout.box()
+        box.label(text="Update Settings")
+        
+        latest_version, download_url = check_for_update()
+        checker = get_update_checker()
+        if latest_version:
+            version_str = '.'.join(str(v) for v in latest_version)
+            box.label(text=f"New version {version_str} available!")
+            if download_url:
+                box.operator("wm.url_open", text="Download Update").url = download_url
+        elif checker.is_checking:
+            box.label(text="Checking for updates...")
+        elif checker.last_error:
+            box.label(text=f"Update check failed: {checker.last_error}", icon='ERROR')
+            retry_minutes = max(0, int((checker.next_check - time.time()) / 60))
+            box.label(text=f"Retrying in {retry_minutes} min")
+        else:
+            box.label(text="You are running the latest version.")
+        
+        box.operator("autolm.check_for_updates", text="Check for Updates Now")
+
+class AUTOLM_OT_check_for_updates(bpy.types.Operator):
+    bl_idname = "autolm.check_for_updates"
+    bl_label = "Check for Updates"
+    bl_description = "Manually check for new versions of the AutoLMbyAman addon"
+
+    @profiled_execute
+    def execute(self, context):
+        from .updater import check_for_update
+
+        # Bypass the cache and any backoff; the result shows up in Preferences when ready
+        check_for_update(force=True)
+        self.report({'INFO'}, "Checking for updates in the background...")
+        return {'FINISHED'}
@@ -0,0 +1,383 @@
+"""Profiling, frame-time measurement and the viewport performance overlay.
+
+Kept free of heavy imports: every operator's execute is wrapped with
+profiled_execute, so this module loads when the addon is enabled.
+"""
+
+import bisect
+import functools
+import threading
+import time
+from array import array
+from collections import deque
+
+import blf
+import bpy
+from bpy.app.handlers import persistent
+
+class SpanStats:
+    """Timing samples for one profiler span.
+
+    The most recent samples live in a fixed-size ring buffer for percentiles,
+    while count, total, min and max are running aggregates over every sample.
+    """
+    __slots__ = ("samples", "index", "size", "count", "total_ns", "min_ns", "max_ns")
+
+    def __init__(self, size):
+        self.samples = array('q', bytes(8 * size))
+        self.index = 0
+        self.size = size
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+
+    def add(self, duration_ns):
+        self.samples[self.index] = duration_ns
+        self.index = (self.index + 1) % self.size
+        self.count += 1
+        self.total_ns += duration_ns
+        if self.min_ns is None or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    def window(self):
+        """Return the samples currently held in the ring buffer."""
+        if self.count >= self.size:
+            return self.samples.tolist()
+        return self.samples[:self.count].tolist()
+
+    def percentiles(self, *quantiles):
+        """Nearest-rank percentiles (0-100) over the ring buffer, in nanoseconds."""
+        window = sorted(self.window())
+        if not window:
+            return [0] * len(quantiles)
+        last = len(window) - 1
+        return [window[min(last, int(round(q / 100.0 * last)))] for q in quantiles]
+
+class _Span:
+    __slots__ = ("profiler", "name", "path", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        stack = self.profiler._stack()
+        self.path = f"{stack[-1]}/{self.name}" if stack else self.name
+        stack.append(self.path)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = time.perf_counter_ns() - self.start
+        self.profiler._stack().pop()
+        self.profiler.record(self.path, duration)
+        recorder = self.profiler.recorder
+        if recorder is not None:
+            recorder.add(self.name, self.path, self.start, duration)
+        return False
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class Profiler:
+    """Hierarchical wall-clock profiler.
+
+    Spans nest: a span opened inside another is recorded under the path
+    "outer/inner". When the profiler is disabled, span() returns a shared
+    no-op context manager and profile() calls straight through, so
+    instrumentation can stay in place permanently.
+    """
+
+    def __init__(self, max_samples=128):
+        self.enabled = False
+        self.max_samples = max_samples
+        self.spans = {}
+        # TraceRecorder receiving every finished span while a recording is running
+        self.recorder = None
+        self._local = threading.local()
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def span(self, name):
+        """Context manager timing the enclosed block as a child of the current span."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def profile(self, name=None):
+        """Decorator timing every call of a function as a span."""
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, path, duration_ns):
+        stats = self.spans.get(path)
+        if stats is None:
+            stats = self.spans[path] = SpanStats(self.max_samples)
+        stats.add(duration_ns)
+
+    def reset(self):
+        self.spans.clear()
+
+    def get_operation_stats(self):
+        """Return {span path: stats} with times in seconds, sorted by path."""
+        stats = {}
+        for path in sorted(self.spans):
+            span_stats = self.spans[path]
+            p50, p95, p99 = span_stats.percentiles(50, 95, 99)
+            stats[path] = {
+                'count': span_stats.count,
+                'avg': span_stats.total_ns / span_stats.count / 1e9,
+                'min': span_stats.min_ns / 1e9,
+                'max': span_stats.max_ns / 1e9,
+                'p50': p50 / 1e9,
+                'p95': p95 / 1e9,
+                'p99': p99 / 1e9,
+            }
+        return stats
+
+class FrameTimeMonitor:
+    """Viewport frame-time sampling from the POST_PIXEL draw handler.
+
+    Each region keeps its own last draw timestamp, and the interval between
+    two draws of the same region is one frame time. Intervals longer than
+    IDLE_GAP mean the viewport was idle rather than slow and are dropped, so
+    the numbers describe continuous redraws such as playback or navigation.
+    During a benchmark only the orbited region is sampled. The histogram is
+    maintained incrementally over the sample window.
+    """
+    IDLE_GAP = 0.5
+    # Upper bucket edges in milliseconds: 120+, 60+, 30+, 20+, 10+ fps and slower
+    BUCKET_EDGES = (8.3, 16.7, 33.3, 50.0, 100.0, float("inf"))
+    BUCKET_LABELS = ("<8ms", "8-17ms", "17-33ms", "33-50ms", "50-100ms", ">100ms")
+    # A frame counts as a stutter when it takes this many times the recent average
+    STUTTER_FACTOR = 2.5
+    STUTTER_MIN_MS = 33.3
+
+    def __init__(self, max_samples=1000):
+        self.active = False
+        self.benchmark_running = False
+        # While a benchmark runs, only draws of its region (as_pointer()) are sampled
+        self.benchmark_region = None
+        # Summary of the last viewport benchmark run, shown in the panel
+        self.last_benchmark = None
+        self.samples = deque(maxlen=max_samples)
+        self.histogram = [0] * len(self.BUCKET_EDGES)
+        self.total_ms = 0.0
+        self.average_ms = 0.0
+        self.stutters = 0
+        self.sample_count = 0
+        self._last_draw = {}
+
+    def reset(self):
+        self.samples.clear()
+        self.histogram = [0] * len(self.BUCKET_EDGES)
+        self.total_ms = 0.0
+        self.average_ms = 0.0
+        self.stutters = 0
+        self.sample_count = 0
+        self._last_draw.clear()
+
+    def _bucket(self, frame_ms):
+        return bisect.bisect_left(self.BUCKET_EDGES, frame_ms)
+
+    def tick(self, region_key):
+        if self.benchmark_region is not None and region_key != self.benchmark_region:
+            return
+        now = time.perf_counter()
+        last = self._last_draw.get(region_key)
+        self._last_draw[region_key] = now
+        if last is None:
+            return
+        interval = now - last
+        if interval > self.IDLE_GAP:
+            return
+        self.add_sample(interval * 1000.0)
+
+    def add_sample(self, frame_ms):
+        if len(self.samples) == self.samples.maxlen:
+            evicted = self.samples[0]
+            self.histogram[self._bucket(evicted)] -= 1
+            self.total_ms -= evicted
+        self.samples.append(frame_ms)
+        self.histogram[self._bucket(frame_ms)] += 1
+        self.total_ms += frame_ms
+        self.sample_count += 1
+        # Exponential moving average as the stutter reference
+        if self.average_ms and frame_ms > max(self.STUTTER_MIN_MS, self.average_ms * self.STUTTER_FACTOR):
+            self.stutters += 1
+        self.average_ms = frame_ms if not self.average_ms else self.average_ms * 0.9 + frame_ms * 0.1
+
+    def summary(self):
+        """Return frame statistics over the sample window, or None without samples."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        last = len(ordered) - 1
+        mean_ms = self.total_ms / len(ordered)
+        p99_ms = ordered[int(round(0.99 * last))]
+        return {
+            'samples': len(ordered),
+            'fps': 1000.0 / mean_ms if mean_ms else 0.0,
+            'low_1_percent_fps': 1000.0 / p99_ms if p99_ms else 0.0,
+            'mean_ms': mean_ms,
+            'p50_ms': ordered[int(round(0.5 * last))],
+            'p99_ms': p99_ms,
+            'max_ms': ordered[-1],
+            'stutters': self.stutters,
+            'histogram': list(zip(self.BUCKET_LABELS, self.histogram)),
+        }
+
+# Create global profiler and frame time monitor instances
+profiler = Profiler()
+frame_time_monitor = FrameTimeMonitor()
+
+def update_profiler_enabled(context):
+    """Profile while the stats overlay is shown or a trace is being recorded."""
+    profiler.enabled = bool(context.scene.show_performance_stats or profiler.recorder is not None)
+    frame_time_monitor.active = bool(context.scene.show_performance_stats or frame_time_monitor.benchmark_running)
+
+def profiled_execute(execute):
+    """Wrap an operator's execute() in a profiler span named after its bl_idname."""
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        if not profiler.enabled:
+            return execute(self, context)
+        with _Span(profiler, self.bl_idname):
+            return execute(self, context)
+    return wrapper
+
+class OverlaySnapshot:
+    """Pre-formatted performance text shared by the viewport overlay and the panel.
+
+    A timer rebuilds it a few times per second; drawing only walks the cached
+    lines. Span lines are re-formatted only when the span has new samples.
+    """
+    REFRESH_INTERVAL = 0.25
+
+    def __init__(self):
+        self.fps_text = "FPS: -"
+        self.frame_lines = []
+        self.lines = []
+        self.panel_lines = []
+        # span path -> (sample count, overlay text, panel text)
+        self._span_text = {}
+
+    def refresh(self):
+        """Rebuild the snapshot and return True if any text changed."""
+        frame_stats = frame_time_monitor.summary()
+        frame_lines = []
+        if frame_stats:
+            fps_text = (f"FPS: {frame_stats['fps']:.1f} (1% low: {frame_stats['low_1_percent_fps']:.1f}, "
+                        f"stutters: {frame_stats['stutters']})")
+            frame_lines.append(f"Frame time: p50 {frame_stats['p50_ms']:.1f}ms, p99 {frame_stats['p99_ms']:.1f}ms, "
+                               f"max {frame_stats['max_ms']:.1f}ms")
+            total = frame_stats['samples']
+            for label, bucket_count in frame_stats['histogram']:
+                bar = "#" * int(round(20 * bucket_count / total))
+                frame_lines.append(f"{label:>9} {bucket_count:5d} {bar}")
+        else:
+            fps_text = "FPS: - (no continuous redraws yet)"
+        lines = []
+        panel_lines = []
+        for path in sorted(profiler.spans):
+            span_stats = profiler.spans[path]
+            cached = self._span_text.get(path)
+            if cached is None or cached[0] != span_stats.count:
+                p50, p95, p99 = span_stats.percentiles(50, 95, 99)
+                avg_ms = span_stats.total_ns / span_stats.count / 1e6
+                text = (f"{path}: {avg_ms:.1f}ms (p50: {p50/1e6:.1f}ms, p95: {p95/1e6:.1f}ms, "
+                        f"p99: {p99/1e6:.1f}ms, max: {span_stats.max_ns/1e6:.1f}ms, n={span_stats.count})")
+                panel_text = f"{path}: {avg_ms:.1f}ms (p95 {p95/1e6:.1f}ms, n={span_stats.count})"
+                cached = self._span_text[path] = (span_stats.count, text, panel_text)
+            lines.append(cached[1])
+            panel_lines.append(cached[2])
+
+        changed = fps_text != self.fps_text or frame_lines != self.frame_lines or lines != self.lines
+        self.fps_text = fps_text
+        self.frame_lines = frame_lines
+        self.lines = lines
+        self.panel_lines = panel_lines
+        return changed
+
+overlay_snapshot = OverlaySnapshot()
+
+def _refresh_overlay_snapshot():
+    scene = bpy.context.scene
+    if not scene or not scene.show_performance_stats:
+        return None  # Unregister the timer
+    if overlay_snapshot.refresh():
+        # Only wake the viewports when there is something new to show
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    return OverlaySnapshot.REFRESH_INTERVAL
+
+def start_overlay_refresh():
+    if not bpy.app.timers.is_registered(_refresh_overlay_snapshot):
+        bpy.app.timers.register(_refresh_overlay_snapshot, first_interval=0.0, persistent=True)
+
+def _update_show_performance_stats(self, context):
+    update_profiler_enabled(context)
+    if self.show_performance_stats:
+        start_overlay_refresh()
+    if context.area:
+        context.area.tag_redraw()
+
+def draw_performance_stats():
+    context = bpy.context
+    if frame_time_monitor.active and context.region:
+        frame_time_monitor.tick(context.region.as_pointer())
+    if not context.scene.show_performance_stats:
+        return
+
+    # Get the region
+    region = context.region
+    if not region:
+        return
+
+    # Set up the font
+    font_id = 0
+    blf.size(font_id, 12)
+    blf.color(font_id, 1.0, 1.0, 1.0, 1.0)
+
+    # Draw the cached snapshot; formatting happens in the refresh timer
+    y_pos = region.height - 20
+    blf.position(font_id, 10, y_pos, 0)
+    blf.draw(font_id, overlay_snapshot.fps_text)
+    for text in overlay_snapshot.frame_lines + overlay_snapshot.lines:
+        y_pos -= 20
+        blf.position(font_id, 10, y_pos, 0)
+        blf.draw(font_id, text)
+
+@persistent
+def _on_load_post_performance(*args):
+    context = bpy.context
+    if context.scene:
+        update_profiler_enabled(context)
+        if context.scene.show_performance_stats:
+            start_overlay_refresh()
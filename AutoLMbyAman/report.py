@@ -0,0 +1,838 @@
+"""HTML report templates used by the label data export.
+
+Templates are written in str.format() syntax (literal braces doubled) and
+parsed once into literal parts and fields. Repeated fragments render with
+one call per row and are assembled with a single join. Field values are
+inserted as-is: callers escape user text, in bulk, with escape_all().
+"""
+
+import html
+import re
+from string import Formatter
+
+# Styles shared by both report pages; literal braces are doubled like the templates they go in
+REPORT_CSS = """
+        body {{
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+        }}
+        .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            background-color: white;
+            padding: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }}
+        .script-header {{
+            background-color: #2c3e50;
+            color: white;
+            padding: 15px;
+            margin: -20px -20px 20px -20px;
+            border-radius: 8px 8px 0 0;
+            position: relative;
+        }}
+        .script-header h1 {{
+            margin: 0;
+            padding: 0;
+            border: none;
+            font-size: 18px;
+            font-weight: normal;
+            display: inline-block;
+            color: white;
+        }}
+        .script-header p {{
+            margin: 5px 0 0 0;
+            opacity: 0.8;
+            font-size: 14px;
+        }}
+        .script-header .version {{
+            color: #27ae60;
+            font-weight: bold;
+        }}
+        .script-header .timestamp {{
+            font-style: italic;
+            font-size: 12px;
+            margin-top: 5px;
+        }}
+        .script-header .developer {{
+            position: absolute;
+            right: 15px;
+            top: 15px;
+            font-size: 14px;
+            font-style: italic;
+            color: white;
+        }}
+        .script-header:hover .developer {{
+            opacity: 1;
+        }}
+        h1, h2, h3 {{
+            color: #333;
+            border-bottom: 2px solid #eee;
+            padding-bottom: 10px;
+        }}
+        .section {{
+            margin: 20px 0;
+            padding: 20px;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+            background-color: #fff;
+        }}
+        .label-group {{
+            margin: 15px 0;
+            padding: 15px;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+            background-color: #fff;
+        }}
+        .label-number {{
+            font-size: 1.2em;
+            color: #2c3e50;
+            margin-bottom: 10px;
+        }}
+        .label-details {{
+            margin-left: 20px;
+        }}
+        .label-item {{
+            margin: 10px 0;
+            padding: 10px;
+            background-color: #f8f9fa;
+            border-radius: 4px;
+        }}
+        .label-name {{
+            font-weight: bold;
+            color: #2c3e50;
+        }}
+        .mesh-name {{
+            color: #666;
+            font-style: italic;
+        }}
+        .description {{
+            color: #34495e;
+            margin-top: 5px;
+        }}
+        .anim-data {{
+            color: #27ae60;
+            margin-top: 5px;
+        }}
+        .no-data {{
+            color: #95a5a6;
+            font-style: italic;
+        }}
+        .metadata-table {{
+            width: 100%;
+            border-collapse: collapse;
+            margin: 15px 0;
+        }}
+        .metadata-table th, .metadata-table td {{
+            padding: 8px;
+            border: 1px solid #ddd;
+            text-align: left;
+        }}
+        .metadata-table th {{
+            background-color: #f8f9fa;
+            font-weight: bold;
+        }}
+        .report-item {{
+            margin: 10px 0;
+            padding: 10px;
+            border-radius: 4px;
+        }}
+        .status-ok {{
+            color: #27ae60;
+        }}
+        .status-warning {{
+            color: #f39c12;
+        }}
+        .status-error {{
+            color: #e74c3c;
+        }}
+        .tab {{
+            overflow: hidden;
+            border: 1px solid #ccc;
+            background-color: #f1f1f1;
+            border-radius: 4px 4px 0 0;
+        }}
+        .tab button {{
+            background-color: inherit;
+            float: left;
+            border: none;
+            outline: none;
+            cursor: pointer;
+            padding: 14px 16px;
+            transition: 0.3s;
+            font-size: 16px;
+        }}
+        .tab button:hover {{
+            background-color: #ddd;
+        }}
+        .tab button.active {{
+            background-color: #ccc;
+        }}
+        .tabcontent {{
+            display: none;
+            padding: 6px 12px;
+            border: 1px solid #ccc;
+            border-top: none;
+            border-radius: 0 0 4px 4px;
+        }}
+        .animation-info {{
+            margin: 10px 0;
+            padding: 10px;
+            background-color: #f8f9fa;
+            border-radius: 4px;
+        }}
+        .animation-details {{
+            margin-left: 20px;
+            padding: 5px;
+            border-left: 3px solid #27ae60;
+        }}
+        .keyframe-list {{
+            margin-left: 20px;
+            color: #666;
+        }}
+        .animation-type {{
+            font-weight: bold;
+            color: #2c3e50;
+        }}
+        .animation-duration {{
+            color: #27ae60;
+            font-weight: bold;
+        }}
+"""
+
+# Page template; literal braces in the CSS and script are doubled
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Dot Label Data Export</title>
+    <style>""" + REPORT_CSS + """    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="script-header">
+            <h1>{script_name}</h1>
+            <span class="developer">Concept Designer: {script_author}</span>
+            <p>Version: <span class="version">{script_version}</span></p>
+            <p class="timestamp">Generated on: {timestamp}</p>
+        </div>
+        
+        <div class="tab">
+            <button class="tablinks active" onclick="openTab(event, 'Labels')">Labels Information</button>
+            <button class="tablinks" onclick="openTab(event, 'Metadata')">GLB Metadata</button>
+            <button class="tablinks" onclick="openTab(event, 'Animation')">Animation Details</button>
+            <button class="tablinks" onclick="openTab(event, 'Reports')">Reports</button>
+        </div>
+
+        <div id="Labels" class="tabcontent" style="display: block;">
+            <div class="label-groups">
+                {label_groups}
+            </div>
+        </div>
+
+        <div id="Metadata" class="tabcontent">
+            <div class="section">
+                <h2>GLB Metadata</h2>
+                <table class="metadata-table">
+                    <tr>
+                        <th>Property</th>
+                        <th>Value</th>
+                    </tr>
+                    <tr>
+                        <td>Total Triangles</td>
+                        <td class="status-ok">{total_triangles}</td>
+                    </tr>
+                    <tr>
+                        <td>Objects</td>
+                        <td>{object_count}</td>
+                    </tr>
+                    <tr>
+                        <td>Materials</td>
+                        <td>{material_count}</td>
+                    </tr>
+                    <tr>
+                        <td>GLB File Size</td>
+                        <td class="{glb_size_status_class}">{glb_size} MB ({glb_size_status})</td>
+                    </tr>
+                </table>
+                
+                <h3>Object Names</h3>
+                <ul>
+                    {object_list}
+                </ul>
+                
+                <h3>Material Names</h3>
+                <ul>
+                    {material_list}
+                </ul>
+            </div>
+        </div>
+
+        <div id="Animation" class="tabcontent">
+            <div class="section">
+                <h2>Animation Details</h2>
+                <div class="animation-info">
+                    <h3>Scene Animation Summary</h3>
+                    <p>Total Animated Objects: {animated_objects_count}</p>
+                    <p>Total Animation Actions: {total_actions}</p>
+                    <p>Scene Frame Range: {scene_frame_start} - {scene_frame_end}</p>
+                </div>
+
+                <div class="animation-info">
+                    <h3>Shared Actions</h3>
+                    {shared_actions}
+                </div>
+                
+                <div class="animation-details">
+                    {animation_details}
+                </div>
+            </div>
+        </div>
+
+        <div id="Reports" class="tabcontent">
+            <div class="section">
+                <h2>Reports</h2>
+                <div class="report-item">
+                    <h3>Triangle Count</h3>
+                    <p class="{triangle_status_class}">Total Triangles: {total_triangles} ({triangle_status})</p>
+                </div>
+                <div class="report-item">
+                    <h3>File Size</h3>
+                    <p class="{glb_size_status_class}">GLB File Size: {glb_size} MB ({glb_size_status})</p>
+                </div>
+                <div class="report-item">
+                    <h3>Naming Conventions</h3>
+                    <p class="{naming_status_class}">Object Naming: {naming_status}</p>
+                    <p class="{material_naming_status_class}">Material Naming: {material_naming_status}</p>
+                </div>
+                <div class="report-item">
+                    <h3>Label Timing</h3>
+                    <p class="{timing_status_class}">Label Ranges: {timing_status}</p>
+                    {timing_report}
+                </div>
+                <div class="report-item">
+                    <h3>Label Placement</h3>
+                    <p class="{placement_status_class}">Overlapping Dots: {placement_status}</p>
+                    {placement_report}
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <script>
+    function openTab(evt, tabName) {{
+        var i, tabcontent, tablinks;
+        tabcontent = document.getElementsByClassName("tabcontent");
+        for (i = 0; i < tabcontent.length; i++) {{
+            tabcontent[i].style.display = "none";
+        }}
+        tablinks = document.getElementsByClassName("tablinks");
+        for (i = 0; i < tablinks.length; i++) {{
+            tablinks[i].className = tablinks[i].className.replace(" active", "");
+        }}
+        document.getElementById(tabName).style.display = "block";
+        evt.currentTarget.className += " active";
+    }}
+    </script>
+</body>
+</html>"""
+
+
+# Shell page for the paged report mode. The data is loaded from a separate
+# script file through a <script> tag: browsers block fetch() and XHR for
+# file:// pages, but still load scripts next to the page. Only the rows in
+# view are turned into DOM nodes, so the page stays responsive however large
+# the scene is.
+PAGED_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Dot Label Data Export</title>
+    <style>""" + REPORT_CSS + """        .container {{
+            max-width: 1400px;
+        }}
+        .toolbar {{
+            display: flex;
+            gap: 8px;
+            align-items: center;
+            margin: 10px 0;
+        }}
+        .toolbar input {{
+            flex: 1;
+            padding: 6px;
+        }}
+        .vt-header, .vt-row {{
+            display: grid;
+            gap: 8px;
+            padding: 0 8px;
+            align-items: center;
+        }}
+        .vt-header {{
+            font-weight: bold;
+            background-color: #f8f9fa;
+            border: 1px solid #ddd;
+            height: 32px;
+        }}
+        .vt-viewport {{
+            height: 600px;
+            overflow-y: auto;
+            position: relative;
+            border: 1px solid #ddd;
+            border-top: none;
+        }}
+        .vt-row {{
+            position: absolute;
+            left: 0;
+            right: 0;
+            border-bottom: 1px solid #eee;
+        }}
+        .vt-row span {{
+            overflow: hidden;
+            white-space: nowrap;
+            text-overflow: ellipsis;
+        }}
+        .vt-row:nth-child(even) {{
+            background-color: #fafafa;
+        }}
+        #load-error {{
+            display: none;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="script-header">
+            <h1>{script_name}</h1>
+            <span class="developer">Concept Designer: {script_author}</span>
+            <p>Version: <span class="version">{script_version}</span></p>
+            <p class="timestamp">Generated on: {timestamp}</p>
+        </div>
+
+        <p id="load-error" class="status-error">Could not load the report data from {data_file}. Keep that file in the same folder as this page.</p>
+
+        <div class="tab">
+            <button class="tablinks active" onclick="openTab(event, 'Labels')">Labels Information</button>
+            <button class="tablinks" onclick="openTab(event, 'Metadata')">GLB Metadata</button>
+            <button class="tablinks" onclick="openTab(event, 'Animation')">Animation Details</button>
+            <button class="tablinks" onclick="openTab(event, 'Reports')">Reports</button>
+        </div>
+
+        <div id="Labels" class="tabcontent" style="display: block;">
+            <div id="labels-table"></div>
+        </div>
+
+        <div id="Metadata" class="tabcontent">
+            <h2>GLB Metadata</h2>
+            <table class="metadata-table" id="metadata-summary"></table>
+            <h3>Object Names</h3>
+            <div id="objects-table"></div>
+            <h3>Material Names</h3>
+            <div id="materials-table"></div>
+        </div>
+
+        <div id="Animation" class="tabcontent">
+            <h2>Animation Details</h2>
+            <table class="metadata-table" id="animation-summary"></table>
+            <h3>Shared Actions</h3>
+            <div id="shared-actions-table"></div>
+            <h3>Animated Objects</h3>
+            <div id="animation-table"></div>
+        </div>
+
+        <div id="Reports" class="tabcontent">
+            <h2>Reports</h2>
+            <div id="reports"></div>
+        </div>
+    </div>
+
+    <script>
+    function openTab(evt, tabName) {{
+        var i, tabcontent, tablinks;
+        tabcontent = document.getElementsByClassName("tabcontent");
+        for (i = 0; i < tabcontent.length; i++) {{
+            tabcontent[i].style.display = "none";
+        }}
+        tablinks = document.getElementsByClassName("tablinks");
+        for (i = 0; i < tablinks.length; i++) {{
+            tablinks[i].className = tablinks[i].className.replace(" active", "");
+        }}
+        document.getElementById(tabName).style.display = "block";
+        evt.currentTarget.className += " active";
+        // Tables measure their viewport, which is zero-sized while the tab is hidden
+        window.dispatchEvent(new Event("resize"));
+    }}
+    </script>
+    <script src="{data_src}" charset="utf-8"></script>
+    <script>
+    (function () {{
+        "use strict";
+        var ROW_HEIGHT = 28;
+        var OVERSCAN = 10;
+
+        function el(tag, className, text) {{
+            var node = document.createElement(tag);
+            if (className) {{
+                node.className = className;
+            }}
+            if (text !== undefined) {{
+                node.textContent = text;
+            }}
+            return node;
+        }}
+
+        // Table that only creates DOM nodes for the rows in view, paged and searchable
+        function VirtualTable(root, columns, rows, pageSizes) {{
+            this.columns = columns;
+            this.rows = rows;
+            this.matches = null;
+            this.haystack = null;
+            this.page = 0;
+            this.pageSize = pageSizes[0];
+            this.scheduled = false;
+            var template = columns.map(function (column) {{ return column.width || "1fr"; }}).join(" ");
+
+            var toolbar = el("div", "toolbar");
+            this.search = el("input");
+            this.search.placeholder = "Search " + rows.length + " rows...";
+            this.count = el("span");
+            this.prev = el("button", "", "Previous");
+            this.pageLabel = el("span");
+            this.next = el("button", "", "Next");
+            this.sizeSelect = el("select");
+            pageSizes.forEach(function (size) {{
+                var option = el("option", "", size ? size + " per page" : "All rows");
+                option.value = size;
+                this.sizeSelect.appendChild(option);
+            }}, this);
+            [this.search, this.count, this.prev, this.pageLabel, this.next, this.sizeSelect].forEach(function (node) {{
+                toolbar.appendChild(node);
+            }});
+
+            var header = el("div", "vt-header");
+            header.style.gridTemplateColumns = template;
+            columns.forEach(function (column) {{ header.appendChild(el("span", "", column.title)); }});
+
+            this.viewport = el("div", "vt-viewport");
+            this.spacer = el("div");
+            this.body = el("div");
+            this.viewport.appendChild(this.spacer);
+            this.viewport.appendChild(this.body);
+            this.template = template;
+
+            root.appendChild(toolbar);
+            root.appendChild(header);
+            root.appendChild(this.viewport);
+
+            var table = this;
+            var searchTimer = null;
+            this.search.addEventListener("input", function () {{
+                clearTimeout(searchTimer);
+                searchTimer = setTimeout(function () {{ table.filter(table.search.value); }}, 150);
+            }});
+            this.prev.addEventListener("click", function () {{ table.setPage(table.page - 1); }});
+            this.next.addEventListener("click", function () {{ table.setPage(table.page + 1); }});
+            this.sizeSelect.addEventListener("change", function () {{
+                table.pageSize = parseInt(table.sizeSelect.value, 10);
+                table.setPage(0);
+            }});
+            this.viewport.addEventListener("scroll", function () {{ table.schedule(); }});
+            window.addEventListener("resize", function () {{ table.schedule(); }});
+            this.setPage(0);
+        }}
+
+        VirtualTable.prototype.text = function (row, index) {{
+            var column = this.columns[index];
+            return column.format ? column.format(row) : String(row[column.key]);
+        }};
+
+        VirtualTable.prototype.filter = function (query) {{
+            query = query.trim().toLowerCase();
+            if (!query) {{
+                this.matches = null;
+            }} else {{
+                if (!this.haystack) {{
+                    // Built on the first search only, so large reports open without the cost
+                    var table = this;
+                    this.haystack = this.rows.map(function (row) {{
+                        return table.columns.map(function (_, index) {{ return table.text(row, index); }})
+                            .join("\u0001").toLowerCase();
+                    }});
+                }}
+                var matches = [];
+                for (var i = 0; i < this.haystack.length; i++) {{
+                    if (this.haystack[i].indexOf(query) !== -1) {{
+                        matches.push(i);
+                    }}
+                }}
+                this.matches = matches;
+            }}
+            this.setPage(0);
+        }};
+
+        VirtualTable.prototype.total = function () {{
+            return this.matches ? this.matches.length : this.rows.length;
+        }};
+
+        VirtualTable.prototype.pageCount = function () {{
+            return this.pageSize ? Math.max(1, Math.ceil(this.total() / this.pageSize)) : 1;
+        }};
+
+        VirtualTable.prototype.setPage = function (page) {{
+            this.page = Math.max(0, Math.min(page, this.pageCount() - 1));
+            var total = this.total();
+            this.start = this.pageSize ? this.page * this.pageSize : 0;
+            this.end = this.pageSize ? Math.min(total, this.start + this.pageSize) : total;
+            this.count.textContent = total + (this.matches ? " matching rows" : " rows");
+            this.pageLabel.textContent = "Page " + (this.page + 1) + " of " + this.pageCount();
+            this.prev.disabled = this.page === 0;
+            this.next.disabled = this.page >= this.pageCount() - 1;
+            this.spacer.style.height = (this.end - this.start) * ROW_HEIGHT + "px";
+            this.viewport.scrollTop = 0;
+            this.render();
+        }};
+
+        VirtualTable.prototype.schedule = function () {{
+            if (this.scheduled) {{
+                return;
+            }}
+            this.scheduled = true;
+            var table = this;
+            window.requestAnimationFrame(function () {{
+                table.scheduled = false;
+                table.render();
+            }});
+        }};
+
+        VirtualTable.prototype.render = function () {{
+            var count = this.end - this.start;
+            var first = Math.max(0, Math.floor(this.viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+            var visible = Math.ceil(this.viewport.clientHeight / ROW_HEIGHT) + 2 * OVERSCAN;
+            var last = Math.min(count, first + visible);
+            var fragment = document.createDocumentFragment();
+            for (var i = first; i < last; i++) {{
+                var position = this.start + i;
+                var row = this.rows[this.matches ? this.matches[position] : position];
+                var line = el("div", "vt-row");
+                line.style.top = i * ROW_HEIGHT + "px";
+                line.style.height = ROW_HEIGHT + "px";
+                line.style.gridTemplateColumns = this.template;
+                for (var c = 0; c < this.columns.length; c++) {{
+                    var text = this.text(row, c);
+                    var cell = el("span", this.columns[c].className ? this.columns[c].className(row) : "", text);
+                    cell.title = text;
+                    line.appendChild(cell);
+                }}
+                fragment.appendChild(line);
+            }}
+            this.body.textContent = "";
+            this.body.appendChild(fragment);
+        }};
+
+        function fillSummary(table, items) {{
+            items.forEach(function (item) {{
+                var line = el("tr");
+                line.appendChild(el("td", "", item[0]));
+                line.appendChild(el("td", item[2] || "", String(item[1])));
+                table.appendChild(line);
+            }});
+        }}
+
+        var data = window.AUTOLM_REPORT;
+        if (!data) {{
+            document.getElementById("load-error").style.display = "block";
+            return;
+        }}
+        var summary = data.summary;
+        var pageSizes = [1000, 5000, 0];
+
+        new VirtualTable(document.getElementById("labels-table"), [
+            {{title: "Group", key: 0, width: "70px"}},
+            {{title: "Label", format: function (row) {{ return row[1] === null ? "-" : row[1]; }}}},
+            {{title: "Mesh", format: function (row) {{ return row[2] === null ? "-" : row[2]; }}}},
+            {{title: "Description", width: "3fr", format: function (row) {{ return row[3] === null ? "-" : row[3]; }}}},
+            {{title: "Animation Data", format: function (row) {{ return row[4] === null ? "-" : row[4]; }}}},
+            {{title: "Dot", format: function (row) {{ return row[5] === null ? "-" : row[5]; }}}},
+            {{title: "Dot Keyframes", width: "2fr", format: function (row) {{
+                return row[5] === null ? "-" : (row[6] ? row[6].join(", ") : "No animation");
+            }}}}
+        ], data.labels, pageSizes);
+
+        fillSummary(document.getElementById("metadata-summary"), [
+            ["Total Triangles", summary.total_triangles, summary.triangle_status_class],
+            ["Objects", summary.object_count],
+            ["Materials", summary.material_count],
+            ["GLB File Size", summary.glb_size + " MB (" + summary.glb_size_status + ")", summary.glb_size_status_class]
+        ]);
+        new VirtualTable(document.getElementById("objects-table"), [{{title: "Name", key: 0}}],
+                         data.objects.map(function (name) {{ return [name]; }}), pageSizes);
+        new VirtualTable(document.getElementById("materials-table"), [{{title: "Name", key: 0}}],
+                         data.materials.map(function (name) {{ return [name]; }}), pageSizes);
+
+        fillSummary(document.getElementById("animation-summary"), [
+            ["Total Animated Objects", summary.animated_objects_count],
+            ["Total Animation Actions", summary.total_actions],
+            ["Scene Frame Range", summary.scene_frame_start + " - " + summary.scene_frame_end]
+        ]);
+        new VirtualTable(document.getElementById("shared-actions-table"), [
+            {{title: "Action", key: 0}},
+            {{title: "Users", key: 1, width: "80px"}},
+            {{title: "Objects", key: 2, width: "4fr"}}
+        ], data.shared_actions, pageSizes);
+        new VirtualTable(document.getElementById("animation-table"), [
+            {{title: "Object", key: 0}},
+            {{title: "Action", format: function (row) {{
+                return row[1] + (row[2] ? " (shared with " + row[2] + " other objects)" : "");
+            }}}},
+            {{title: "Animation Types", format: function (row) {{ return row[3].join(", "); }}}},
+            {{title: "Duration", width: "90px", format: function (row) {{ return row[6] + " frames"; }}}},
+            {{title: "Frame Range", width: "110px", format: function (row) {{ return row[4] + " - " + row[5]; }}}},
+            {{title: "Keyframes", key: 7, width: "3fr"}}
+        ], data.animation, pageSizes);
+
+        var reports = document.getElementById("reports");
+        [
+            ["Triangle Count", "Total Triangles: " + summary.total_triangles + " (" + summary.triangle_status + ")",
+             summary.triangle_status_class],
+            ["File Size", "GLB File Size: " + summary.glb_size + " MB (" + summary.glb_size_status + ")",
+             summary.glb_size_status_class],
+            ["Object Naming", "Object Naming: " + summary.naming_status, summary.naming_status_class],
+            ["Material Naming", "Material Naming: " + summary.material_naming_status,
+             summary.material_naming_status_class],
+            ["Label Timing", "Label Ranges: " + summary.timing_status, summary.timing_status_class]
+        ].forEach(function (item) {{
+            reports.appendChild(el("h3", "", item[0]));
+            reports.appendChild(el("p", item[2], item[1]));
+        }});
+        var timing = el("ul");
+        data.timing_items.forEach(function (item) {{
+            timing.appendChild(el("li", item[0], item[1]));
+        }});
+        reports.appendChild(timing);
+        reports.appendChild(el("h3", "", "Label Placement"));
+        reports.appendChild(el("p", summary.placement_status_class, "Overlapping Dots: " + summary.placement_status));
+        var placement = el("ul");
+        data.placement_items.forEach(function (item) {{
+            placement.appendChild(el("li", item[0], item[1]));
+        }});
+        reports.appendChild(placement);
+    }})();
+    </script>
+</body>
+</html>"""
+
+LABEL_GROUP_TEMPLATE = """
+                <div class="label-group">
+                    <div class="label-number">Label Group {number}</div>
+                    <div class="label-details">{items}
+                    </div>
+                </div>"""
+
+LABEL_ITEM_TEMPLATE = """
+                        <div class="label-item">
+                            <div class="label-name">Label: {name}</div>
+                            <div class="mesh-name">Mesh: {mesh_name}</div>
+                            <div class="description">Description: {description}</div>
+                            <div class="anim-data">Animation Data: {animdata}</div>
+                        </div>"""
+
+DOT_ITEM_TEMPLATE = """
+                        <div class="label-item">
+                            <div class="label-name">Dot: {name}</div>
+                            <div class="anim-data">Animation: {animation}</div>
+                        </div>"""
+
+ANIMATION_ITEM_TEMPLATE = """
+                            <div class="animation-info">
+                                <h4>{name}</h4>
+                                <p>Action: {action}{sharing}</p>
+                                <p class="animation-type">Animation Types: {data_paths}</p>
+                                <p class="animation-duration">Duration: {duration} frames</p>
+                                <p>Frame Range: {first_frame} - {last_frame}</p>
+                                <div class="keyframe-list">
+                                    <p>Keyframes at: {keyframes}</p>
+                                </div>
+                            </div>
+                        """
+
+# Indentation and the line breaks between tags; the report has no <pre> or
+# whitespace-sensitive script, so dropping them does not change the page
+_MINIFY_INDENT = re.compile(r"\n[ \t]+")
+_MINIFY_BETWEEN_TAGS = re.compile(r">\n+<")
+_MINIFY_BLANK_LINES = re.compile(r"\n{2,}")
+
+def minify_html(text):
+    """Strip indentation and blank lines from template literal text."""
+    text = _MINIFY_INDENT.sub("\n", text)
+    text = _MINIFY_BETWEEN_TAGS.sub("><", text)
+    return _MINIFY_BLANK_LINES.sub("\n", text)
+
+_ESCAPED_CHARS = "&<>\"'"
+
+def escape_all(values, chunk_size=4096):
+    """HTML-escape an iterable of strings, one pass per chunk of their concatenation.
+
+    Blender names and string properties cannot contain NUL, so it is safe to
+    use as the separator. Chunks without any special character are returned
+    as-is, which is the common case for label text.
+    """
+    values = list(values)
+    escaped = []
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size]
+        joined = "\0".join(chunk)
+        if any(char in joined for char in _ESCAPED_CHARS):
+            escaped += html.escape(joined).split("\0")
+        else:
+            escaped += chunk
+    return escaped
+
+class Template:
+    """A str.format() style template, parsed once into literal parts and field slots.
+
+    A render fills the field slots of a copy of the parts and joins them, so
+    nothing is parsed again. Values are inserted as given: callers pass
+    them already escaped.
+    """
+    __slots__ = ("parts", "fields")
+
+    def __init__(self, source, minify=False):
+        self.parts = []
+        # (position in parts, field name) for every field
+        self.fields = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(source):
+            if literal:
+                self.parts.append(minify_html(literal) if minify else literal)
+            if field_name is None:
+                continue
+            if format_spec or conversion or not field_name.isidentifier():
+                raise ValueError(f"Unsupported template field '{field_name}'")
+            self.fields.append((len(self.parts), field_name))
+            self.parts.append("")
+
+    def render(self, **values):
+        """Fill every field by name; missing fields raise KeyError."""
+        parts = self.parts.copy()
+        for position, field_name in self.fields:
+            parts[position] = str(values[field_name])
+        return "".join(parts)
+
+class ReportTemplates:
+    """The page template and its repeated fragments, parsed together."""
+
+    def __init__(self, minify=False):
+        self.page = Template(HTML_TEMPLATE, minify)
+        self.paged_page = Template(PAGED_HTML_TEMPLATE, minify)
+        self.label_group = Template(LABEL_GROUP_TEMPLATE, minify)
+        self.label_item = Template(LABEL_ITEM_TEMPLATE, minify)
+        self.dot_item = Template(DOT_ITEM_TEMPLATE, minify)
+        self.animation_item = Template(ANIMATION_ITEM_TEMPLATE, minify)
+
+_report_templates = {}
+
+def get_report_templates(minify=False):
+    """Return the templates, parsing them on first use for each minify setting."""
+    templates = _report_templates.get(minify)
+    if templates is None:
+        templates = _report_templates[minify] = ReportTemplates(minify)
+    return templates
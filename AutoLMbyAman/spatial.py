@@ -0,0 +1,127 @@
+"""KD-tree over dot locations for nearest-label and overlap queries.
+
+The tree is rebuilt only when a dot moves or the set of dot/label pairs
+changes; queries in between run against the balanced tree.
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+from mathutils.kdtree import KDTree
+
+from .pairing import get_label_pair_index
+
+class LabelSpatialIndex:
+    """Dot locations in world space, keyed by group number."""
+
+    def __init__(self):
+        # Bumped on every rebuild
+        self.revision = 0
+        self.clear()
+
+    def clear(self):
+        """Drop the tree, e.g. for a newly loaded file; the revision keeps counting."""
+        self.tree = None
+        self.numbers = []
+        self.dot_names = set()
+        self.positions = []
+        # Clusters of the last radius asked for, until the tree is rebuilt
+        self._clusters = None
+        self._pair_revision = None
+        self.dirty = True
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def ensure(self):
+        pair_index = get_label_pair_index()
+        if self.dirty or self._pair_revision != pair_index.revision:
+            self.rebuild(pair_index)
+        return self
+
+    def rebuild(self, pair_index):
+        numbers = []
+        names = []
+        positions = []
+        for number in pair_index.numbers():
+            dot_obj = pair_index.pair(number)[0]
+            if dot_obj is not None:
+                numbers.append(number)
+                names.append(dot_obj.name)
+                positions.append(dot_obj.matrix_world.translation.copy())
+        tree = KDTree(len(positions))
+        for position, co in enumerate(positions):
+            tree.insert(co, position)
+        tree.balance()
+        self.tree = tree
+        self.numbers = numbers
+        self.dot_names = set(names)
+        self.positions = positions
+        self._clusters = None
+        self._pair_revision = pair_index.revision
+        self.revision += 1
+        self.dirty = False
+
+    def __len__(self):
+        return len(self.positions)
+
+    def nearest(self, co):
+        """Return (group number, distance) of the dot closest to co, or None without dots."""
+        if not self.positions:
+            return None
+        _, position, distance = self.tree.find(co)
+        return self.numbers[position], distance
+
+    def overlapping_pairs(self, radius):
+        """Return [(number, number, distance)] for every two dots closer than radius."""
+        pairs = []
+        for position, co in enumerate(self.positions):
+            for _, other, distance in self.tree.find_range(co, radius):
+                # Each pair is found from both ends; keep it once
+                if other > position:
+                    pairs.append((self.numbers[position], self.numbers[other], distance))
+        return pairs
+
+    def clusters(self, radius):
+        """Group dots connected by overlaps (union-find); return lists of group numbers, largest first."""
+        if self._clusters is not None and self._clusters[0] == radius:
+            return self._clusters[1]
+        parent = {}
+
+        def find(number):
+            root = parent.setdefault(number, number)
+            while root != parent[root]:
+                parent[root] = parent[parent[root]]
+                root = parent[root]
+            return root
+
+        for first, second, _ in self.overlapping_pairs(radius):
+            first_root = find(first)
+            second_root = find(second)
+            if first_root != second_root:
+                parent[second_root] = first_root
+        clusters = {}
+        for number in parent:
+            clusters.setdefault(find(number), []).append(number)
+        clusters = sorted((sorted(numbers) for numbers in clusters.values()), key=lambda numbers: (-len(numbers), numbers[0]))
+        self._clusters = (radius, clusters)
+        return clusters
+
+label_spatial_index = LabelSpatialIndex()
+
+def get_label_spatial_index():
+    """Return the shared LabelSpatialIndex, rebuilt if dots moved or pairs changed."""
+    return label_spatial_index.ensure()
+
+@persistent
+def _on_depsgraph_update_spatial(scene, depsgraph):
+    if label_spatial_index.dirty or label_spatial_index.tree is None:
+        return
+    for update in depsgraph.updates:
+        if (isinstance(update.id, bpy.types.Object) and update.is_updated_transform
+                and update.id.name in label_spatial_index.dot_names):
+            label_spatial_index.mark_dirty()
+            return
+
+@persistent
+def _on_load_post_spatial(*args):
+    label_spatial_index.clear()
@@ -0,0 +1,452 @@
+"""Spelling suggestions for label descriptions, loaded on first use.
+
+Candidates are known words within a small weighted edit distance of the
+typo (a slip onto a neighbouring key costs less than any other
+substitution). They are ranked by that distance together with how often
+the word is used and how often it follows the previous word. Typos the
+user corrected before skip the search: the corrections picked for them
+(common_mistakes) are suggested straight away.
+
+Descriptions are split by tokenize(): Unicode NFKC-normalized, casefolded
+words with punctuation stripped, so "Cell," and "cell" are one word. Short
+descriptions and word pairs that keep recurring are also kept as phrases
+("mitochondrial matrix"); a prefix tree over words and phrases completes
+the description field while typing.
+"""
+
+import json
+import math
+import os
+import re
+import unicodedata
+from collections import Counter, defaultdict
+
+# Letters and digits, keeping inner apostrophes and hyphens ("cell's", "x-ray")
+TOKEN_PATTERN = re.compile(r"[^\W_]+(?:['\u2019-][^\W_]+)*")
+
+# Saved data before this version split on whitespace only and is re-tokenized on load
+VOCABULARY_VERSION = 2
+
+KEYBOARD_ROWS = ("qwertyuiop", "asdfghjkl", "zxcvbnm")
+
+def _keyboard_neighbors():
+    """Return {key: keys touching it} for a staggered QWERTY layout."""
+    positions = {key: (row, column) for row, keys in enumerate(KEYBOARD_ROWS) for column, key in enumerate(keys)}
+    neighbors = {}
+    for key, (row, column) in positions.items():
+        # Each row sits half a key to the right of the one above
+        around = [(row, column - 1), (row, column + 1),
+                  (row - 1, column), (row - 1, column + 1),
+                  (row + 1, column - 1), (row + 1, column)]
+        neighbors[key] = frozenset(KEYBOARD_ROWS[r][c] for r, c in around
+                                   if 0 <= r < len(KEYBOARD_ROWS) and 0 <= c < len(KEYBOARD_ROWS[r]))
+    return neighbors
+
+KEY_NEIGHBORS = _keyboard_neighbors()
+
+# Edit costs; insertions and deletions cost 1
+ADJACENT_KEY_COST = 0.5
+TRANSPOSITION_COST = 0.75
+
+# Accepted corrections kept per typo; older ones are forgotten first
+MAX_CORRECTIONS_PER_TYPO = 20
+
+# Ranking weights
+DISTANCE_WEIGHT = 2.0
+FREQUENCY_WEIGHT = 0.5
+CONTEXT_WEIGHT = 1.0
+CORRECTION_WEIGHT = 1.5
+
+# A description of up to this many words counts as a phrase; so does a word pair seen this often
+MAX_PHRASE_WORDS = 3
+PHRASE_MIN_COUNT = 2
+AUTOCOMPLETE_LIMIT = 8
+
+def normalize_word(word):
+    return unicodedata.normalize("NFKC", word).casefold().replace("\u2019", "'")
+
+def tokenize(text):
+    """Return the normalized words of text, without punctuation."""
+    return TOKEN_PATTERN.findall(normalize_word(text))
+
+def max_edit_cost(word):
+    """Return the largest edit cost still suggested for a word of this length."""
+    if len(word) <= 4:
+        return 1.0
+    if len(word) <= 8:
+        return 2.0
+    return 3.0
+
+def substitution_cost(typed, intended):
+    return ADJACENT_KEY_COST if intended in KEY_NEIGHBORS.get(typed, ()) else 1.0
+
+def bounded_edit_distance(source, target, max_cost):
+    """Weighted edit distance (with adjacent transpositions) from source to target, or None if above max_cost.
+
+    Only the diagonal band reachable within max_cost is computed, and the
+    scan stops once two rows in a row exceed it: a transposition reads the
+    row before the previous one, so a single row over the bound is not
+    enough.
+    """
+    if abs(len(source) - len(target)) > max_cost:
+        return None
+    inf = math.inf
+    band = int(max_cost)
+    length = len(target)
+    before_previous = None
+    previous = [float(j) if j <= band else inf for j in range(length + 1)]
+    previous_min = 0.0
+    for i in range(1, len(source) + 1):
+        current = [inf] * (length + 1)
+        if i <= band:
+            current[0] = float(i)
+        row_min = current[0]
+        typed = source[i - 1]
+        for j in range(max(1, i - band), min(length, i + band) + 1):
+            intended = target[j - 1]
+            if typed == intended:
+                cost = previous[j - 1]
+            else:
+                cost = previous[j - 1] + substitution_cost(typed, intended)
+                if previous[j] + 1.0 < cost:
+                    cost = previous[j] + 1.0
+                if current[j - 1] + 1.0 < cost:
+                    cost = current[j - 1] + 1.0
+                if (i > 1 and j > 1 and typed == target[j - 2] and source[i - 2] == intended
+                        and before_previous[j - 2] + TRANSPOSITION_COST < cost):
+                    cost = before_previous[j - 2] + TRANSPOSITION_COST
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_cost and previous_min > max_cost:
+            return None
+        before_previous, previous, previous_min = previous, current, row_min
+    return previous[length] if previous[length] <= max_cost else None
+
+class _TrieNode:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children = {}
+        # [(-count, term)] of the most frequent terms below this node, best first
+        self.top = []
+
+class PhraseTrie:
+    """Prefix tree over words and phrases; every node keeps its most frequent completions.
+
+    A lookup walks one node per prefix character and reads the list stored
+    there, so it does not depend on the vocabulary size.
+    """
+
+    def __init__(self, counts=(), limit=AUTOCOMPLETE_LIMIT):
+        self.root = _TrieNode()
+        self.limit = limit
+        # Inserted best first, a term only has to fill free places
+        for term, count in sorted(counts, key=lambda item: (-item[1], item[0])):
+            entry = (-count, term)
+            node = self.root
+            for char in term:
+                node = node.children.get(char) or node.children.setdefault(char, _TrieNode())
+                if len(node.top) < limit:
+                    node.top.append(entry)
+
+    def set_count(self, term, count):
+        """Add term or raise its count; counts only grow."""
+        entry = (-count, term)
+        node = self.root
+        for char in term:
+            node = node.children.get(char) or node.children.setdefault(char, _TrieNode())
+            top = node.top
+            for position, (_, known) in enumerate(top):
+                if known == term:
+                    top[position] = entry
+                    break
+            else:
+                if len(top) >= self.limit and entry >= top[-1]:
+                    continue
+                top.append(entry)
+            top.sort()
+            del top[self.limit:]
+
+    def complete(self, prefix, limit=None):
+        """Return the most frequent terms starting with prefix, best first."""
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [term for _, term in node.top[:limit]]
+
+class DescriptionSuggester:
+    def __init__(self):
+        self.word_frequencies = defaultdict(int)
+        self.common_mistakes = defaultdict(list)
+        # "previous next" -> how often next followed previous in a description
+        self.bigram_frequencies = defaultdict(int)
+        # Short descriptions kept whole, e.g. "golgi apparatus"
+        self.phrase_frequencies = defaultdict(int)
+        # Known words grouped by length, and the autocomplete trie, built on first lookup
+        self._words_by_length = None
+        self._phrase_trie = None
+        # (word, previous word) -> ranked suggestions; the quick create dialog asks again on every redraw
+        self._suggestion_cache = {}
+        self.load_data()
+        
+        # Add a default set of science-related words
+        self.add_default_science_words()
+    
+    def add_default_science_words(self):
+        """Load default science-related words from a JSON file."""
+        try:
+            script_dir = os.path.dirname(__file__)
+            science_words_path = os.path.join(script_dir, "wordlist.json")
+            if os.path.exists(science_words_path):
+                with open(science_words_path, 'r', encoding='utf-8') as f:
+                    science_words = json.load(f)
+                for word in science_words:
+                    self.add_description(word)
+                print(f"Loaded {len(science_words)} default science words from {science_words_path}")
+            else:
+                print(f"Warning: {science_words_path} not found. No default science words loaded.")
+        except Exception as e:
+            print(f"Error loading default science words: {e}")
+    
+    def load_data(self):
+        """Load saved word frequencies and common mistakes"""
+        try:
+            if os.path.exists("description_data.json"):
+                with open("description_data.json", 'r') as f:
+                    data = json.load(f)
+                    self.word_frequencies = defaultdict(int, data.get('frequencies', {}))
+                    self.common_mistakes = defaultdict(list, data.get('mistakes', {}))
+                    self.bigram_frequencies = defaultdict(int, data.get('bigrams', {}))
+                    self.phrase_frequencies = defaultdict(int, data.get('phrases', {}))
+                    if data.get('version', 1) < VOCABULARY_VERSION:
+                        self._retokenize_vocabulary()
+                    self._words_by_length = None
+                    self._phrase_trie = None
+                    self._suggestion_cache.clear()
+        except Exception as e:
+            print(f"Error loading description data: {e}")
+
+    def _retokenize_vocabulary(self):
+        """Merge entries saved before tokenization ("Cell", "cell,") into their normalized words."""
+        word_frequencies = defaultdict(int)
+        for word, count in self.word_frequencies.items():
+            for token in tokenize(word):
+                word_frequencies[token] += count
+        bigram_frequencies = defaultdict(int)
+        for bigram, count in self.bigram_frequencies.items():
+            tokens = tokenize(bigram)
+            for previous_word, word in zip(tokens, tokens[1:]):
+                bigram_frequencies[f"{previous_word} {word}"] += count
+        phrase_frequencies = defaultdict(int)
+        for phrase, count in self.phrase_frequencies.items():
+            phrase_frequencies[" ".join(tokenize(phrase))] += count
+        common_mistakes = defaultdict(list)
+        for typo, corrections in self.common_mistakes.items():
+            tokens = tokenize(typo)
+            if len(tokens) == 1:
+                common_mistakes[tokens[0]].extend(
+                    " ".join(tokenize(correction)) for correction in corrections if tokenize(correction))
+        self.word_frequencies = word_frequencies
+        self.bigram_frequencies = bigram_frequencies
+        self.phrase_frequencies = phrase_frequencies
+        self.common_mistakes = common_mistakes
+    
+    def save_data(self):
+        """Save word frequencies, common mistakes and word pairs"""
+        try:
+            data = {
+                'frequencies': dict(self.word_frequencies),
+                'mistakes': dict(self.common_mistakes),
+                'bigrams': dict(self.bigram_frequencies),
+                'phrases': dict(self.phrase_frequencies),
+                'version': VOCABULARY_VERSION
+            }
+            with open("description_data.json", 'w') as f:
+                json.dump(data, f)
+        except Exception as e:
+            print(f"Error saving description data: {e}")
+    
+    def add_description(self, description):
+        """Add a new description to learn from"""
+        words = tokenize(description)
+        for word in words:
+            if word not in self.word_frequencies and self._words_by_length is not None:
+                self._words_by_length[len(word)].append(word)
+            self.word_frequencies[word] += 1
+        bigrams = [f"{previous_word} {word}" for previous_word, word in zip(words, words[1:])]
+        for bigram in bigrams:
+            self.bigram_frequencies[bigram] += 1
+        phrases = list(bigrams)
+        if 2 <= len(words) <= MAX_PHRASE_WORDS:
+            phrase = " ".join(words)
+            self.phrase_frequencies[phrase] += 1
+            if len(words) > 2:
+                phrases.append(phrase)
+        if self._phrase_trie is not None:
+            for word in words:
+                self._phrase_trie.set_count(word, self.word_frequencies[word])
+            for phrase in phrases:
+                count = self.phrase_count(phrase)
+                if count:
+                    self._phrase_trie.set_count(phrase, count)
+        self._suggestion_cache.clear()
+
+    def phrase_count(self, phrase):
+        """Return how often phrase was used, or 0 while it is not a phrase yet."""
+        count = self.phrase_frequencies.get(phrase, 0)
+        bigram_count = self.bigram_frequencies.get(phrase, 0)
+        if count or bigram_count >= PHRASE_MIN_COUNT:
+            return max(count, bigram_count)
+        return 0
+
+    def autocomplete(self, prefix, limit=AUTOCOMPLETE_LIMIT):
+        """Return the most used words and phrases starting with the normalized prefix."""
+        if self._phrase_trie is None:
+            counts = list(self.word_frequencies.items())
+            for phrase in set(self.phrase_frequencies) | set(self.bigram_frequencies):
+                count = self.phrase_count(phrase)
+                if count:
+                    counts.append((phrase, count))
+            self._phrase_trie = PhraseTrie(counts)
+        return self._phrase_trie.complete(prefix, limit)
+
+    def complete_description(self, text, limit=AUTOCOMPLETE_LIMIT):
+        """Return text followed by the rest of known words or phrases its last words begin, longest match first.
+
+        After a space, phrases starting with the words before it are offered.
+        """
+        matches = list(TOKEN_PATTERN.finditer(text))
+        if not matches:
+            return []
+        rest = text[matches[-1].end():]
+        if rest and not rest.isspace():
+            return []
+        completions = []
+        for count in range(min(MAX_PHRASE_WORDS, len(matches)), 0, -1):
+            tail = matches[-count:]
+            # Only words separated by plain spaces make up a phrase
+            if any(not text[first.end():second.start()].isspace() for first, second in zip(tail, tail[1:])):
+                continue
+            prefix = " ".join(normalize_word(match.group()) for match in tail) + (" " if rest else "")
+            for term in self.autocomplete(prefix, limit):
+                # Keep what was typed as it is and add the rest of the term
+                completion = text + term[len(prefix):]
+                if term != prefix and completion not in completions:
+                    completions.append(completion)
+        return completions[:limit]
+    
+    def _candidates(self, word, max_cost):
+        if self._words_by_length is None:
+            self._words_by_length = defaultdict(list)
+            for known_word in self.word_frequencies:
+                self._words_by_length[len(known_word)].append(known_word)
+        # Words more than max_cost letters longer or shorter cannot be close enough
+        spread = int(max_cost)
+        for length in range(max(1, len(word) - spread), len(word) + spread + 1):
+            yield from self._words_by_length.get(length, ())
+
+    def score(self, word, candidate, cost, previous_word=None):
+        """Return how strongly candidate is suggested for word; higher is better."""
+        score = FREQUENCY_WEIGHT * math.log1p(self.word_frequencies.get(candidate, 0)) - DISTANCE_WEIGHT * cost
+        if previous_word:
+            score += CONTEXT_WEIGHT * math.log1p(self.bigram_frequencies.get(f"{previous_word} {candidate}", 0))
+        corrections = self.common_mistakes.get(word)
+        if corrections:
+            score += CORRECTION_WEIGHT * corrections.count(candidate)
+        return score
+
+    def record_correction(self, typo, correction):
+        """Remember that typo was corrected to correction"""
+        corrections = self.common_mistakes[normalize_word(typo)]
+        corrections.append(normalize_word(correction))
+        del corrections[:-MAX_CORRECTIONS_PER_TYPO]
+        self._suggestion_cache.clear()
+
+    def learn_corrections(self, shown_suggestions, description):
+        """Record the corrections made to typos that were flagged while the description was edited.
+
+        shown_suggestions maps each flagged typo to the words suggested for
+        it. A typo missing from the final description was corrected: to the
+        suggestion it now contains, or else to its closest new word. Returns
+        the (typo, correction) pairs recorded.
+        """
+        present = set(tokenize(description))
+        learned = []
+        for typo, suggestions in shown_suggestions.items():
+            if typo in present:
+                continue
+            correction = next((suggestion for suggestion in suggestions if suggestion in present), None)
+            if correction is None:
+                # Fixed by hand rather than from the list
+                max_cost = max_edit_cost(typo)
+                reachable = [(cost, word) for word in present
+                             if (cost := bounded_edit_distance(typo, word, max_cost)) is not None]
+                if reachable:
+                    correction = min(reachable)[1]
+            if correction is not None:
+                self.record_correction(typo, correction)
+                learned.append((typo, correction))
+        return learned
+
+    def find_similar_words(self, word, previous_word=None):
+        """Find known words close to word; return [(word, score)], best first"""
+        word = normalize_word(word)
+        cached = self._suggestion_cache.get((word, previous_word))
+        if cached is not None:
+            return cached
+        corrections = self.common_mistakes.get(word)
+        if corrections:
+            # A typo corrected before gets its learned corrections, without a fuzzy search
+            similar_words = [(correction, self.score(word, correction, 0.0, previous_word))
+                             for correction in Counter(reversed(corrections))]
+            similar_words.sort(key=lambda x: x[1], reverse=True)
+            self._suggestion_cache[(word, previous_word)] = similar_words
+            return similar_words
+        max_cost = max_edit_cost(word)
+        similar_words = []
+        for known_word in self._candidates(word, max_cost):
+            cost = bounded_edit_distance(word, known_word, max_cost)
+            if cost is not None:
+                similar_words.append((known_word, self.score(word, known_word, cost, previous_word)))
+        similar_words.sort(key=lambda x: x[1], reverse=True)
+        self._suggestion_cache[(word, previous_word)] = similar_words
+        return similar_words
+    
+    def check_description(self, description):
+        """Check description and return suggestions"""
+        words = tokenize(description)
+        suggestions = []
+        # The previous word as meant, for the bigram context
+        previous_word = None
+
+        for word in words:
+            # Skip very short words and numbers
+            if len(word) <= 2 or any(char.isdigit() for char in word):
+                previous_word = word
+                continue
+                
+            # If word is not in our known words
+            if word not in self.word_frequencies:
+                similar_words = self.find_similar_words(word, previous_word)
+                if similar_words:
+                    suggestions.append({
+                        'word': word,
+                        'suggestions': [w[0] for w in similar_words[:3]]  # Top 3 suggestions
+                    })
+                    previous_word = similar_words[0][0]
+                    continue
+            previous_word = word
+        
+        return suggestions
+
+_description_suggester = None
+
+def get_description_suggester():
+    """Return the shared DescriptionSuggester, loading its word data on first use."""
+    global _description_suggester
+    if _description_suggester is None:
+        _description_suggester = DescriptionSuggester()
+    return _description_suggester
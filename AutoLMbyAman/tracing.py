@@ -0,0 +1,99 @@
+"""Span recording for offline analysis, loaded when a trace recording starts."""
+
+import csv
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+import bpy
+
+from . import bl_info
+
+class TraceRecorder:
+    """Collects individual profiler spans for offline analysis.
+
+    Recordings are written as Chrome Trace Event JSON, which chrome://tracing,
+    Perfetto and speedscope all open, plus a CSV summary per span path.
+    """
+
+    def __init__(self, max_events=500000):
+        self.max_events = max_events
+        self.events = []
+        self.dropped = 0
+        self.origin_ns = 0
+        self.started_at = None
+
+    def add(self, name, path, start_ns, duration_ns):
+        if len(self.events) >= self.max_events:
+            self.dropped += 1
+            return
+        self.events.append((name, path, start_ns, duration_ns, threading.get_ident()))
+
+    def start(self):
+        self.events = []
+        self.dropped = 0
+        self.origin_ns = time.perf_counter_ns()
+        self.started_at = time.strftime("%Y%m%d_%H%M%S")
+
+    def to_chrome_trace(self):
+        pid = os.getpid()
+        thread_ids = {}
+        trace_events = []
+        for name, path, start_ns, duration_ns, thread in self.events:
+            tid = thread_ids.setdefault(thread, len(thread_ids) + 1)
+            trace_events.append({
+                "name": name,
+                "cat": "autolm",
+                "ph": "X",
+                "ts": (start_ns - self.origin_ns) / 1000.0,
+                "dur": duration_ns / 1000.0,
+                "pid": pid,
+                "tid": tid,
+                "args": {"path": path},
+            })
+        main_thread = threading.main_thread().ident
+        for thread, tid in thread_ids.items():
+            thread_name = "Blender main" if thread == main_thread else f"Worker {tid}"
+            trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                                 "args": {"name": thread_name}})
+        return {
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "addon": bl_info["name"],
+                "version": ".".join(str(v) for v in bl_info["version"]),
+                "blender": ".".join(str(v) for v in bpy.app.version),
+                "dropped_events": self.dropped,
+            },
+        }
+
+    def summary_rows(self):
+        """Return one (path, count, total, avg, min, max, p50, p95) row per span path, times in ms."""
+        durations = defaultdict(list)
+        for _, path, _, duration_ns, _ in self.events:
+            durations[path].append(duration_ns / 1e6)
+        rows = []
+        for path in sorted(durations):
+            values = sorted(durations[path])
+            last = len(values) - 1
+            rows.append((
+                path, len(values), sum(values), sum(values) / len(values), values[0], values[-1],
+                values[int(round(0.5 * last))], values[int(round(0.95 * last))],
+            ))
+        return rows
+
+    def write(self, base_path):
+        """Write <base>_trace_<timestamp>.json and .csv, returning both paths."""
+        stem = f"{base_path}_trace_{self.started_at}"
+        json_path = stem + ".json"
+        csv_path = stem + ".csv"
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, separators=(',', ':'))
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["span", "count", "total_ms", "avg_ms", "min_ms", "max_ms", "p50_ms", "p95_ms"])
+            for path, count, *times in self.summary_rows():
+                writer.writerow([path, count] + [f"{t:.3f}" for t in times])
+        return json_path, csv_path
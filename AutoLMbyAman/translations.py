@@ -0,0 +1,144 @@
+"""Per-label translations and a local translation memory shared across blend files.
+
+A label's own translations live in its label data (see label_store) as
+{language: text}. Every translation is also recorded in a SQLite
+translation memory keyed by a hash of the source description, so a
+description that repeats across labels or files is translated once.
+"""
+
+import hashlib
+import os
+import sqlite3
+import unicodedata
+
+import bpy
+
+# Language of the description itself
+SOURCE_LANGUAGE = "en"
+
+# Stay well below SQLite's limit on bound parameters per statement
+LOOKUP_CHUNK_SIZE = 500
+
+def source_hash(text):
+    """Return the translation memory key of a source description."""
+    normalized = unicodedata.normalize("NFC", text.strip())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+def parse_languages(text):
+    """Split a comma or space separated language list, keeping order and dropping duplicates."""
+    languages = []
+    for language in text.replace(",", " ").split():
+        if language not in languages:
+            languages.append(language)
+    return languages or [SOURCE_LANGUAGE]
+
+def get_label_translations(data):
+    """Return the {language: text} translations of a label data dict."""
+    translations = data.get("translations")
+    return dict(translations) if translations else {}
+
+class TranslationMemory:
+    """SQLite store of (source hash, language) -> translated text."""
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = None
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "source_hash TEXT NOT NULL, lang TEXT NOT NULL, source TEXT NOT NULL, text TEXT NOT NULL, "
+                "PRIMARY KEY (source_hash, lang)) WITHOUT ROWID")
+        return self._connection
+
+    def lookup_many(self, sources, languages):
+        """Return {(source, language): text} for every stored translation, in a few chunked queries."""
+        if not sources or not languages:
+            return {}
+        sources_by_hash = {}
+        for source in sources:
+            sources_by_hash.setdefault(source_hash(source), []).append(source)
+        hashes = list(sources_by_hash)
+        languages = list(languages)
+        found = {}
+        chunk_size = max(1, LOOKUP_CHUNK_SIZE - len(languages))
+        language_marks = ",".join("?" * len(languages))
+        for start in range(0, len(hashes), chunk_size):
+            chunk = hashes[start:start + chunk_size]
+            rows = self.connection.execute(
+                f"SELECT source_hash, lang, text FROM translations "
+                f"WHERE lang IN ({language_marks}) AND source_hash IN ({','.join('?' * len(chunk))})",
+                languages + chunk)
+            for hash_value, language, text in rows:
+                for source in sources_by_hash[hash_value]:
+                    found[(source, language)] = text
+        return found
+
+    def store_many(self, items):
+        """Record (source, language, text) triples in one transaction; later entries win."""
+        rows = [(source_hash(source), language, source, text) for source, language, text in items if source and text]
+        if rows:
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO translations (source_hash, lang, source, text) VALUES (?, ?, ?, ?)",
+                    rows)
+        return len(rows)
+
+    def forget(self, source, language):
+        """Remove the stored translation of source into language; return whether there was one."""
+        with self.connection:
+            cursor = self.connection.execute(
+                "DELETE FROM translations WHERE source_hash = ? AND lang = ?", (source_hash(source), language))
+        return cursor.rowcount > 0
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+_translation_memory = None
+
+def get_translation_memory():
+    """Return the shared TranslationMemory in the addon's config directory."""
+    global _translation_memory
+    if _translation_memory is None:
+        config_dir = bpy.utils.user_resource('CONFIG', path=__package__, create=True)
+        _translation_memory = TranslationMemory(os.path.join(config_dir, "translation_memory.sqlite"))
+    return _translation_memory
+
+def close_translation_memory():
+    global _translation_memory
+    if _translation_memory is not None:
+        _translation_memory.close()
+        _translation_memory = None
+
+def resolve_label_translations(label_groups, languages):
+    """Return {(description, language): text} from the translation memory for the export languages.
+
+    Only descriptions missing a translation on the label itself are looked
+    up, all in one bulk query. Translations stored on the labels are
+    recorded in the memory along the way.
+    """
+    languages = [language for language in languages if language != SOURCE_LANGUAGE]
+    if not languages:
+        return {}
+    learned = []
+    missing = set()
+    for group in label_groups.values():
+        data = group.get("data")
+        if not group.get("label") or data is None:
+            continue
+        description = data.get("description", "")
+        translations = get_label_translations(data)
+        learned.extend((description, language, text) for language, text in translations.items())
+        if description and any(language not in translations for language in languages):
+            missing.add(description)
+
+    memory = get_translation_memory()
+    memory.store_many(learned)
+    return memory.lookup_many(missing, languages)
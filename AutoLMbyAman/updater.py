@@ -0,0 +1,213 @@
+"""Background update checks against bl_info['update_url'].
+
+Loaded on first use (the Preferences draw or the check operator), so the
+network modules are not imported when the addon is enabled.
+"""
+
+import json
+import os
+import threading
+import time
+import urllib.request
+from urllib.error import URLError, HTTPError
+
+import bpy
+
+from . import bl_info
+
+# Update check timing
+UPDATE_CHECK_INTERVAL = 3600  # Check for updates once per hour
+UPDATE_RETRY_BASE = 60  # First retry one minute after a failed check
+UPDATE_RETRY_MAX = 24 * 3600  # Back off to at most one retry per day
+
+def parse_version(value):
+    """Return a version list such as [1, 2, 0] as a tuple; raise ValueError for anything else."""
+    if (not isinstance(value, (list, tuple)) or not value
+            or not all(isinstance(part, int) and not isinstance(part, bool) for part in value)):
+        raise ValueError(f"Invalid version {value!r}")
+    return tuple(value)
+
+def parse_download_url(value):
+    """Return a manifest download URL; raise ValueError when it is not a string."""
+    if not isinstance(value, str):
+        raise ValueError(f"Invalid download URL {value!r}")
+    return value
+
+class UpdateChecker:
+    """Checks update_url for a newer version on a background thread.
+
+    The last result, ETag/Last-Modified validators and retry schedule are
+    persisted to a small JSON cache file, so restarts do not re-download the
+    manifest. Failed checks are cached too and retried with exponential
+    backoff. Nothing here touches bpy, so it can be exercised against a local
+    HTTP server.
+    """
+
+    def __init__(self, url, current_version, cache_path, interval=UPDATE_CHECK_INTERVAL,
+                 retry_base=UPDATE_RETRY_BASE, retry_max=UPDATE_RETRY_MAX, timeout=5,
+                 opener=urllib.request.urlopen):
+        self.url = url
+        self.current_version = tuple(current_version)
+        self.cache_path = cache_path
+        self.interval = interval
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.timeout = timeout
+        self.opener = opener
+        self.latest_version = None
+        self.download_url = ""
+        self.etag = None
+        self.last_modified = None
+        self.last_check = 0.0
+        self.next_check = 0.0
+        self.failures = 0
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self.load()
+
+    @property
+    def is_checking(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def load(self):
+        """Restore state from the cache file, ignoring a missing or corrupt file."""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("Update cache is not a JSON object")
+            if data.get('url') != self.url:
+                return
+            # Checked like a downloaded manifest, before anything is restored
+            latest_version = data.get('latest_version')
+            latest_version = parse_version(latest_version) if latest_version is not None else None
+            download_url = parse_download_url(data.get('download_url', ""))
+            self.latest_version = latest_version
+            self.download_url = download_url
+            self.etag = data.get('etag')
+            self.last_modified = data.get('last_modified')
+            self.last_check = data.get('last_check', 0.0)
+            self.next_check = data.get('next_check', 0.0)
+            self.failures = data.get('failures', 0)
+            self.last_error = data.get('last_error')
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Error loading update cache: {e}")
+
+    def save(self):
+        if not self.cache_path:
+            return
+        data = {
+            'url': self.url,
+            'latest_version': list(self.latest_version) if self.latest_version else None,
+            'download_url': self.download_url,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'last_check': self.last_check,
+            'next_check': self.next_check,
+            'failures': self.failures,
+            'last_error': self.last_error,
+        }
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            temp_path = self.cache_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Error saving update cache: {e}")
+
+    def update_available(self):
+        """Return (latest_version, download_url) if a newer version is known, else (None, None)."""
+        with self._lock:
+            if self.latest_version and self.latest_version > self.current_version:
+                return self.latest_version, self.download_url
+        return None, None
+
+    def start_check(self, force=False):
+        """Start a background check if one is due. Never blocks; returns True if a check started."""
+        if not self.url or self.is_checking:
+            return False
+        if not force and time.time() < self.next_check:
+            return False
+        self._thread = threading.Thread(target=self.check_now, name="AutoLMbyAman update check", daemon=True)
+        self._thread.start()
+        return True
+
+    def check_now(self):
+        """Fetch the version manifest synchronously. Called on the background thread."""
+        request = urllib.request.Request(self.url, headers={'User-Agent': f"{bl_info['name']}-updater"})
+        with self._lock:
+            if self.etag:
+                request.add_header('If-None-Match', self.etag)
+            if self.last_modified:
+                request.add_header('If-Modified-Since', self.last_modified)
+        now = time.time()
+        try:
+            with self.opener(request, timeout=self.timeout) as response:
+                data = json.loads(response.read())
+                headers = response.headers
+            # Valid JSON that is not a proper manifest fails like a decode error
+            if not isinstance(data, dict):
+                raise ValueError("Version manifest is not a JSON object")
+            latest_version = parse_version(data.get('version'))
+            download_url = parse_download_url(data.get('download_url', ''))
+            with self._lock:
+                self.latest_version = latest_version
+                self.download_url = download_url
+                self.etag = headers.get('ETag')
+                self.last_modified = headers.get('Last-Modified')
+                self._record_success(now)
+        except HTTPError as e:
+            with self._lock:
+                if e.code == 304:
+                    # Manifest unchanged since the cached copy
+                    self._record_success(now)
+                else:
+                    self._record_failure(now, f"HTTP {e.code}")
+        except (URLError, OSError, ValueError) as e:
+            with self._lock:
+                self._record_failure(now, str(e))
+        self.save()
+
+    def _record_success(self, now):
+        self.last_check = now
+        self.failures = 0
+        self.last_error = None
+        self.next_check = now + self.interval
+
+    def _record_failure(self, now, error):
+        self.last_check = now
+        self.failures += 1
+        self.last_error = error
+        self.next_check = now + min(self.retry_max, self.retry_base * 2 ** (self.failures - 1))
+
+_update_checker = None
+
+def get_update_checker():
+    """Return the shared UpdateChecker, creating it (and reading its cache) on first use."""
+    global _update_checker
+    if _update_checker is None:
+        config_dir = bpy.utils.user_resource('CONFIG', path=__package__, create=True)
+        _update_checker = UpdateChecker(
+            bl_info.get('update_url'), bl_info['version'], os.path.join(config_dir, "update_cache.json"))
+    return _update_checker
+
+def _poll_update_check():
+    """Timer callback that redraws Preferences once a background check finishes."""
+    if get_update_checker().is_checking:
+        return 0.5
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'PREFERENCES':
+                area.tag_redraw()
+    return None
+
+def check_for_update(force=False):
+    """Return the cached (latest_version, download_url), starting a background check when due."""
+    checker = get_update_checker()
+    if checker.start_check(force=force) and not bpy.app.timers.is_registered(_poll_update_check):
+        bpy.app.timers.register(_poll_update_check, first_interval=0.5)
+    return checker.update_available()
@@ -0,0 +1,90 @@
+"""Brute-force check of the suggester's bounded edit distance.
+
+Compares suggester.bounded_edit_distance with a plain full-matrix
+computation of the same weighted distance on random word pairs, and
+exits with status 1 on the first disagreement:
+
+    python benchmarks/check_edit_distance.py --pairs 200000
+
+Words are drawn from a few neighbouring keys, so adjacent-key
+substitutions and transpositions come up often.
+"""
+
+import argparse
+import os
+import random
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+import fake_bpy  # noqa: E402
+
+fake_bpy.install()
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from AutoLMbyAman.suggester import (  # noqa: E402
+    TRANSPOSITION_COST,
+    bounded_edit_distance,
+    max_edit_cost,
+    substitution_cost,
+)
+
+
+def full_edit_distance(source, target):
+    """The same weighted distance, over the whole matrix and without any cut-off."""
+    rows = [[0.0] * (len(target) + 1) for _ in range(len(source) + 1)]
+    for i in range(len(source) + 1):
+        rows[i][0] = float(i)
+    for j in range(len(target) + 1):
+        rows[0][j] = float(j)
+    for i in range(1, len(source) + 1):
+        for j in range(1, len(target) + 1):
+            if source[i - 1] == target[j - 1]:
+                cost = rows[i - 1][j - 1]
+            else:
+                cost = rows[i - 1][j - 1] + substitution_cost(source[i - 1], target[j - 1])
+            cost = min(cost, rows[i - 1][j] + 1.0, rows[i][j - 1] + 1.0)
+            if i > 1 and j > 1 and source[i - 1] == target[j - 2] and source[i - 2] == target[j - 1]:
+                cost = min(cost, rows[i - 2][j - 2] + TRANSPOSITION_COST)
+            rows[i][j] = cost
+    return rows[len(source)][len(target)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=200000, help="random word pairs to compare")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--alphabet", default="qwavfxs", help="letters the words are made of")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    for _ in range(args.pairs):
+        source = "".join(rng.choice(args.alphabet) for _ in range(rng.randint(1, 10)))
+        target = list(source)
+        # A few random edits, so most pairs are near the bound
+        for _ in range(rng.randint(0, 4)):
+            position = rng.randrange(len(target) + 1)
+            edit = rng.randrange(4)
+            if edit == 0 or not target:
+                target.insert(position, rng.choice(args.alphabet))
+            elif edit == 1 and position < len(target):
+                del target[position]
+            elif edit == 2 and position < len(target):
+                target[position] = rng.choice(args.alphabet)
+            elif position + 1 < len(target):
+                target[position], target[position + 1] = target[position + 1], target[position]
+        target = "".join(target)
+        max_cost = max_edit_cost(source)
+        expected = full_edit_distance(source, target)
+        expected = expected if expected <= max_cost else None
+        result = bounded_edit_distance(source, target, max_cost)
+        if result != expected:
+            print(f"{source!r} -> {target!r} (max {max_cost}): got {result}, expected {expected}")
+            return 1
+    print(f"{args.pairs} pairs agree")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Check that label translations survive, and clearing them sticks, across exports.
+
+Sets a translation on one label with the Edit Translation operator,
+exports, clears it again and exports once more, against the fake bpy
+modules in fake_bpy.py. Exits with status 1 when an export does not match:
+
+    python benchmarks/check_translations.py
+"""
+
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+import fake_bpy  # noqa: E402
+
+bpy = fake_bpy.install()
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import scenes  # noqa: E402
+
+LANGUAGE = "de"
+TRANSLATION = "Zellkern"
+
+
+def run_operator(operator_class, **properties):
+    operator = operator_class(**properties)
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = operator.execute(bpy.context)
+    if result != {'FINISHED'}:
+        raise RuntimeError(f"{operator_class.__name__} returned {result}: {operator.reports}")
+
+
+def exported_translations(addon, workdir):
+    """Export the scene and return the LANGUAGE texts of the first label, in the JSON file."""
+    run_operator(addon.operators.DOT_OT_export_data)
+    path, = glob.glob(os.path.join(workdir, "*_dot_labels.json"))
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    return [text["text"] for text in entries[0]["text"] if text["lang"] == LANGUAGE]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        # The translation memory and the suggester write into the working directory
+        previous_cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                import AutoLMbyAman as addon
+                fake_bpy.reset_data()
+                addon.register()
+                scenes.build_scene(3, 0, 2)
+                addon.label_store.migrate_label_data(bpy.context.scene)
+            bpy.data.filepath = os.path.join(workdir, "check.blend")
+            bpy.context.scene.label_languages = f"en {LANGUAGE}"
+            bpy.context.active_object = bpy.data.objects["label-001"]
+
+            checks = []
+            run_operator(addon.operators.DOT_OT_edit_translation, language=LANGUAGE, text=TRANSLATION)
+            checks.append(("set", exported_translations(addon, workdir), [TRANSLATION]))
+            run_operator(addon.operators.DOT_OT_edit_translation, language=LANGUAGE, text="")
+            checks.append(("cleared", exported_translations(addon, workdir), []))
+            # The memory is consulted again on every export; clearing must stay cleared
+            checks.append(("exported again", exported_translations(addon, workdir), []))
+        finally:
+            addon.translations.close_translation_memory()
+            os.chdir(previous_cwd)
+
+    failed = False
+    for name, found, expected in checks:
+        if found != expected:
+            print(f"{name}: exported {found!r}, expected {expected!r}")
+            failed = True
+    if failed:
+        return 1
+    print("translations export as edited")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""Check the update checker against a local HTTP stub.
+
+Serves version manifests from a server on 127.0.0.1 and runs
+UpdateChecker.check_now() against it: a fresh manifest (200), an unchanged
+one (304), server errors (500) with the retry backoff, malformed manifests
+and a corrupt cache file. Exits with status 1 when any check fails:
+
+    python benchmarks/check_updater.py
+"""
+
+import http.server
+import json
+import os
+import sys
+import tempfile
+import threading
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+import fake_bpy  # noqa: E402
+
+fake_bpy.install()
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from AutoLMbyAman.updater import UpdateChecker  # noqa: E402
+
+CURRENT_VERSION = (1, 0, 0)
+RETRY_BASE = 10
+RETRY_MAX = 25
+ETAG = '"manifest-1"'
+
+
+class ManifestHandler(http.server.BaseHTTPRequestHandler):
+    """Answers each GET with the next queued (status, body) and records the request headers."""
+
+    responses = []
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(dict(self.headers))
+        status, body = self.responses.pop(0)
+        self.send_response(status)
+        if status == 200:
+            self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def manifest(version, download_url="https://example.invalid/addon.zip"):
+    return json.dumps({"version": version, "download_url": download_url}).encode("utf-8")
+
+
+class Checks:
+    def __init__(self):
+        self.failures = []
+
+    def expect(self, name, found, expected):
+        if found != expected:
+            self.failures.append(f"{name}: got {found!r}, expected {expected!r}")
+
+
+def run_checks(url, workdir):
+    checks = Checks()
+    cache_path = os.path.join(workdir, "update_cache.json")
+
+    def new_checker():
+        return UpdateChecker(url, CURRENT_VERSION, cache_path, retry_base=RETRY_BASE, retry_max=RETRY_MAX)
+
+    def serve(status, body=b""):
+        ManifestHandler.responses.append((status, body))
+        checker.check_now()
+        return ManifestHandler.requests[-1]
+
+    checker = new_checker()
+    serve(200, manifest([1, 2, 0]))
+    checks.expect("200 version", checker.latest_version, (1, 2, 0))
+    checks.expect("200 update available", checker.update_available()[0], (1, 2, 0))
+    checks.expect("200 failures", checker.failures, 0)
+    checks.expect("200 next check", checker.next_check - checker.last_check, checker.interval)
+
+    request = serve(304)
+    checks.expect("304 sends the ETag", request.get("If-None-Match"), ETAG)
+    checks.expect("304 keeps the version", checker.latest_version, (1, 2, 0))
+    checks.expect("304 failures", checker.failures, 0)
+
+    # Backoff doubles from RETRY_BASE up to RETRY_MAX
+    for failures, delay in ((1, 10), (2, 20), (3, 25)):
+        serve(500)
+        checks.expect(f"500 #{failures} failures", checker.failures, failures)
+        checks.expect(f"500 #{failures} error", checker.last_error, "HTTP 500")
+        checks.expect(f"500 #{failures} retry delay", checker.next_check - checker.last_check, delay)
+    checks.expect("500 keeps the version", checker.latest_version, (1, 2, 0))
+
+    serve(200, manifest([1, 3, 0]))
+    checks.expect("recovered failures", checker.failures, 0)
+    checks.expect("recovered version", checker.latest_version, (1, 3, 0))
+
+    # Each malformed manifest is a failed check and leaves the last good result alone
+    malformed = {
+        "not JSON": b"<html>",
+        "a list": b"[1, 2, 0]",
+        "no version": json.dumps({"download_url": "x"}).encode("utf-8"),
+        "int version": manifest(2),
+        "string version": manifest("1.4.0"),
+        "empty version": manifest([]),
+        "float in version": manifest([1, 4.5]),
+        "non-string URL": manifest([1, 4, 0], download_url=5),
+    }
+    for name, body in malformed.items():
+        failures = checker.failures
+        serve(200, body)
+        checks.expect(f"{name} failures", checker.failures, failures + 1)
+        checks.expect(f"{name} version", checker.latest_version, (1, 3, 0))
+        checks.expect(f"{name} update available", checker.update_available()[0], (1, 3, 0))
+
+    # A restart restores the last good result from the cache
+    checks.expect("cache version", new_checker().latest_version, (1, 3, 0))
+    with open(cache_path, encoding="utf-8") as f:
+        cache = json.load(f)
+    cache["latest_version"] = "1.3.0"
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    restarted = new_checker()
+    checks.expect("corrupt cache version", restarted.latest_version, None)
+    checks.expect("corrupt cache update available", restarted.update_available(), (None, None))
+    return checks.failures
+
+
+def main():
+    server = http.server.HTTPServer(("127.0.0.1", 0), ManifestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            failures = run_checks(f"http://127.0.0.1:{server.server_port}/manifest.json", workdir)
+    finally:
+        server.shutdown()
+        server.server_close()
+    for failure in failures:
+        print(failure)
+    if failures:
+        return 1
+    print("update checks behave as expected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,688 @@
+"""Lightweight stand-ins for bpy, mathutils, blf and bpy_extras.
+
+Only the parts of the Blender API that AutoLMbyAman touches are modelled,
+closely enough to run operators headless on synthetic scenes. Nothing here
+tries to be a faithful Blender emulation.
+"""
+
+import bisect
+import math
+import sys
+import types
+from itertools import count
+
+_pointers = count(1)
+
+
+# ---------------------------------------------------------------------------
+# mathutils
+# ---------------------------------------------------------------------------
+
+class Vector:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, values=(0.0, 0.0, 0.0)):
+        self.x, self.y, self.z = (float(v) for v in values)
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, i):
+        return (self.x, self.y, self.z)[i]
+
+    def __sub__(self, other):
+        return Vector((self.x - other[0], self.y - other[1], self.z - other[2]))
+
+    def __add__(self, other):
+        return Vector((self.x + other[0], self.y + other[1], self.z + other[2]))
+
+    @property
+    def length(self):
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def copy(self):
+        return Vector(self)
+
+    def __repr__(self):
+        return f"Vector(({self.x}, {self.y}, {self.z}))"
+
+
+class Matrix:
+    def __init__(self, rows=None):
+        self.rows = rows or [[1.0 if i == j else 0.0 for j in range(4)] for i in range(4)]
+
+    @property
+    def translation(self):
+        return Vector((self.rows[0][3], self.rows[1][3], self.rows[2][3]))
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class Quaternion:
+    def __init__(self, axis=(1.0, 0.0, 0.0, 0.0), angle=None):
+        self.axis = tuple(axis)
+        self.angle = angle
+
+    def copy(self):
+        return Quaternion(self.axis, self.angle)
+
+    def __matmul__(self, other):
+        return Quaternion(self.axis, (self.angle or 0.0) + (other.angle or 0.0))
+
+
+class KDTree:
+    """KD-tree substitute with the mathutils.kdtree API.
+
+    Range queries scan a window of the points sorted by x, so they scale
+    roughly like the real tree for spread-out points.
+    """
+
+    def __init__(self, size):
+        self._points = []
+        self._xs = []
+
+    def insert(self, co, index):
+        self._points.append((Vector(co), index))
+
+    def balance(self):
+        self._points.sort(key=lambda point: point[0].x)
+        self._xs = [point.x for point, _ in self._points]
+
+    def find(self, co):
+        best = None
+        for point, index in self._points:
+            distance = (point - co).length
+            if best is None or distance < best[2]:
+                best = (point, index, distance)
+        return best if best else (None, None, None)
+
+    def find_n(self, co, n):
+        found = sorted(((p, i, (p - co).length) for p, i in self._points), key=lambda hit: hit[2])
+        return found[:n]
+
+    def find_range(self, co, radius):
+        start = bisect.bisect_left(self._xs, co[0] - radius)
+        end = bisect.bisect_right(self._xs, co[0] + radius)
+        return [(p, i, d) for p, i in self._points[start:end] if (d := (p - co).length) <= radius]
+
+
+# ---------------------------------------------------------------------------
+# bpy data model
+# ---------------------------------------------------------------------------
+
+def _install_type_properties(owner, name, prop):
+    """Emulate bpy.types.X.prop = bpy.props.Y(...) for scene/object properties."""
+    if isinstance(prop, _PropertyDeferred):
+        if prop.function == "CollectionProperty":
+            default = lambda: PropCollection(prop.keywords["type"])
+        elif prop.function == "PointerProperty":
+            default = lambda: prop.keywords["type"]()
+        else:
+            default = prop.default
+        attr = "_prop_" + name
+
+        def getter(self):
+            if attr not in self.__dict__:
+                self.__dict__[attr] = default()
+            return self.__dict__[attr]
+
+        def setter(self, value):
+            self.__dict__[attr] = value
+            update = prop.keywords.get("update")
+            if update is not None:
+                update(self, bpy_context)
+
+        type.__setattr__(owner, name, property(getter, setter))
+    else:
+        type.__setattr__(owner, name, prop)
+
+
+class _RNAMeta(type):
+    def __setattr__(cls, name, value):
+        _install_type_properties(cls, name, value)
+
+    def __delattr__(cls, name):
+        type.__delattr__(cls, name)
+
+
+class IDPropertyMixin:
+    """Dict-like custom property access shared by IDs and markers."""
+
+    def _props(self):
+        props = self.__dict__.get("_id_props")
+        if props is None:
+            props = {}
+            self.__dict__["_id_props"] = props
+        return props
+
+    def __contains__(self, key):
+        return key in self._props()
+
+    def __getitem__(self, key):
+        return self._props()[key]
+
+    def __setitem__(self, key, value):
+        if isinstance(value, dict):
+            value = dict(value)
+        self._props()[key] = value
+
+    def __delitem__(self, key):
+        del self._props()[key]
+
+    def keys(self):
+        return self._props().keys()
+
+    def get(self, key, default=None):
+        return self._props().get(key, default)
+
+    def pop(self, key, default=None):
+        return self._props().pop(key, default)
+
+
+class ID(IDPropertyMixin, metaclass=_RNAMeta):
+    def __init__(self, name):
+        self._name = name
+        self._collection = None
+        self._pointer = next(_pointers)
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        if self._collection is not None:
+            self._collection._rename(self, value)
+        else:
+            self._name = value
+
+    @property
+    def name_full(self):
+        return self._name
+
+    @property
+    def original(self):
+        return self
+
+    def as_pointer(self):
+        return self._pointer
+
+    def update_tag(self, refresh=None):
+        pass
+
+    def copy(self):
+        raise NotImplementedError
+
+
+class DataCollection:
+    """bpy.data.<collection> with Blender-style .001 name deduplication."""
+
+    def __init__(self, factory=None):
+        self._items = {}
+        self._factory = factory
+
+    def _unique_name(self, name):
+        if name not in self._items:
+            return name
+        base = name
+        if len(name) > 4 and name[-4] == "." and name[-3:].isdigit():
+            base = name[:-4]
+        for i in count(1):
+            candidate = f"{base}.{i:03d}"
+            if candidate not in self._items:
+                return candidate
+
+    def _add(self, item):
+        item._name = self._unique_name(item._name)
+        item._collection = self
+        self._items[item._name] = item
+        return item
+
+    def _rename(self, item, new_name):
+        if new_name == item._name:
+            return
+        del self._items[item._name]
+        item._name = self._unique_name(new_name)
+        self._items[item._name] = item
+
+    def new(self, name, *args):
+        return self._add(self._factory(name, *args))
+
+    def remove(self, item, do_unlink=True):
+        self._items.pop(item._name, None)
+        item._collection = None
+        for scene in _scenes:
+            scene.collection.objects._discard(item)
+
+    def get(self, name, default=None):
+        return self._items.get(name, default)
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self._items.values())[key]
+        return self._items[key]
+
+    def __contains__(self, name):
+        return name in self._items
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+    def keys(self):
+        return self._items.keys()
+
+    def values(self):
+        return list(self._items.values())
+
+
+class Polygon:
+    __slots__ = ("vertices",)
+
+    def __init__(self, vertices):
+        self.vertices = vertices
+
+
+class Mesh(ID):
+    def __init__(self, name, polygons=None):
+        super().__init__(name)
+        self.polygons = polygons if polygons is not None else [Polygon((0, 1, 2, 3))] * 6
+        self.materials = []
+
+    def copy(self):
+        mesh = Mesh(self._name, list(self.polygons))
+        return bpy_data.meshes._add(mesh)
+
+
+class Material(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.use_nodes = False
+        self.blend_method = "OPAQUE"
+        self.use_backface_culling = True
+        self.node_tree = types.SimpleNamespace(nodes={})
+
+
+class KeyframePoints(list):
+    def foreach_get(self, attr, buffer):
+        assert attr == "co"
+        flat = buffer.reshape(-1)
+        for i, (x, y) in enumerate(self):
+            flat[2 * i] = x
+            flat[2 * i + 1] = y
+
+
+class FCurve:
+    def __init__(self, data_path, index, frames):
+        self.data_path = data_path
+        self.array_index = index
+        self.keyframe_points = KeyframePoints((float(f), 1.0) for f in frames)
+
+
+class Action(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.fcurves = []
+
+
+class AnimData:
+    def __init__(self, action=None):
+        self.action = action
+
+
+class MaterialSlot:
+    def __init__(self, material):
+        self.material = material
+
+
+class Object(ID):
+    def __init__(self, name, data=None):
+        super().__init__(name)
+        self.data = data
+        self.type = "MESH" if isinstance(data, Mesh) else "EMPTY"
+        self.location = Vector()
+        self.rotation_euler = Vector()
+        self.scale = Vector((1.0, 1.0, 1.0))
+        self.animation_data = None
+        self.show_name = False
+        self.show_wire = False
+        self.show_all_edges = False
+        self.display_type = "TEXTURED"
+        self.parent = None
+        self._hidden = False
+        self._selected = False
+
+    @property
+    def material_slots(self):
+        if self.data is None:
+            return []
+        return [MaterialSlot(m) for m in self.data.materials]
+
+    @property
+    def matrix_world(self):
+        m = Matrix()
+        m.rows[0][3], m.rows[1][3], m.rows[2][3] = self.location
+        return m
+
+    def hide_get(self):
+        return self._hidden
+
+    def hide_set(self, state):
+        self._hidden = bool(state)
+
+    def visible_get(self, view_layer=None):
+        return not self._hidden
+
+    def select_get(self):
+        return self._selected
+
+    def select_set(self, state):
+        self._selected = bool(state)
+
+    def animation_data_create(self):
+        if self.animation_data is None:
+            self.animation_data = AnimData()
+        return self.animation_data
+
+
+class TimelineMarker(IDPropertyMixin):
+    def __init__(self, name, frame):
+        self.name = name
+        self.frame = frame
+        self.select = False
+
+
+class TimelineMarkers(list):
+    def new(self, name, frame=0):
+        marker = TimelineMarker(name, frame)
+        self.append(marker)
+        return marker
+
+    def remove(self, marker):
+        list.remove(self, marker)
+
+    def clear(self):
+        del self[:]
+
+
+class CollectionObjects:
+    def __init__(self):
+        self._objects = {}
+
+    def link(self, obj):
+        self._objects[id(obj)] = obj
+
+    def unlink(self, obj):
+        self._discard(obj)
+
+    def _discard(self, obj):
+        self._objects.pop(id(obj), None)
+
+    def __iter__(self):
+        return iter(list(self._objects.values()))
+
+    def __len__(self):
+        return len(self._objects)
+
+
+class Collection(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.objects = CollectionObjects()
+
+
+class Scene(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.frame_current = 1
+        self.frame_start = 1
+        self.frame_end = 250
+        self.timeline_markers = TimelineMarkers()
+        self.cursor = types.SimpleNamespace(location=Vector())
+        self.collection = Collection("Scene Collection")
+
+    def frame_set(self, frame):
+        self.frame_current = frame
+        for handler in list(bpy_app_handlers.frame_change_post):
+            handler(self, None)
+
+
+_scenes = []
+
+
+class KeyMapItems(list):
+    def new(self, idname, type, value, **modifiers):
+        item = types.SimpleNamespace(idname=idname, type=type, value=value, **modifiers)
+        self.append(item)
+        return item
+
+
+class KeyMaps(dict):
+    def new(self, name, space_type="EMPTY", region_type="WINDOW"):
+        keymap = self.get(name)
+        if keymap is None:
+            keymap = self[name] = types.SimpleNamespace(name=name, keymap_items=KeyMapItems())
+        return keymap
+
+
+class WindowManager:
+    def __init__(self):
+        self.operators = []
+        self.windows = []
+        self.keyconfigs = types.SimpleNamespace(addon=types.SimpleNamespace(keymaps=KeyMaps()))
+
+    def invoke_props_dialog(self, operator, width=300):
+        return {'RUNNING_MODAL'}
+
+
+class BlendData:
+    def __init__(self):
+        self.filepath = ""
+        self.objects = DataCollection(Object)
+        self.meshes = DataCollection(Mesh)
+        self.materials = DataCollection(Material)
+        self.actions = DataCollection(Action)
+        self.scenes = DataCollection(Scene)
+        self.collections = DataCollection(Collection)
+
+    def batch_remove(self, ids):
+        for item in list(ids):
+            if isinstance(item, Object):
+                self.objects.remove(item)
+            elif isinstance(item, Mesh):
+                self.meshes.remove(item)
+
+
+bpy_data = BlendData()
+
+
+# ---------------------------------------------------------------------------
+# Properties and registration
+# ---------------------------------------------------------------------------
+
+class _PropertyDeferred:
+    def __init__(self, kind, keywords):
+        self.function = kind
+        self.keywords = keywords
+
+    def default(self):
+        if "default" in self.keywords:
+            return self.keywords["default"]
+        return {"StringProperty": "", "IntProperty": 0, "FloatProperty": 0.0,
+                "BoolProperty": False}.get(self.function)
+
+
+def _make_property(kind):
+    def factory(**keywords):
+        return _PropertyDeferred(kind, keywords)
+    factory.__name__ = kind
+    return factory
+
+
+class _StructBase:
+    """Base for Operator/Panel/PropertyGroup: annotations become plain attributes."""
+
+    def __init__(self, **values):
+        for klass in reversed(type(self).__mro__):
+            for name, prop in getattr(klass, "__annotations__", {}).items():
+                if isinstance(prop, _PropertyDeferred):
+                    if prop.function == "CollectionProperty":
+                        setattr(self, name, PropCollection(prop.keywords["type"]))
+                    elif prop.function == "PointerProperty":
+                        setattr(self, name, prop.keywords["type"]())
+                    else:
+                        setattr(self, name, prop.default())
+        for name, value in values.items():
+            setattr(self, name, value)
+        self.reports = []
+
+    def report(self, kind, message):
+        self.reports.append((set(kind), message))
+
+
+class PropCollection(list):
+    def __init__(self, item_type):
+        super().__init__()
+        self._item_type = item_type
+
+    def add(self):
+        item = self._item_type()
+        self.append(item)
+        return item
+
+    def remove(self, index):
+        del self[index]
+
+    def clear(self):
+        del self[:]
+
+    def get(self, name, default=None):
+        for item in self:
+            if getattr(item, "name", None) == name:
+                return item
+        return default
+
+
+def _rna_type(name, base=object):
+    return _RNAMeta(name, (base,), {})
+
+
+# ---------------------------------------------------------------------------
+# Module assembly
+# ---------------------------------------------------------------------------
+
+bpy_context = types.SimpleNamespace()
+bpy_app_handlers = types.ModuleType("bpy.app.handlers")
+bpy_app_handlers.__dict__.update(
+    frame_change_post=[], frame_change_pre=[], depsgraph_update_post=[], load_post=[],
+    save_pre=[], save_post=[], undo_post=[], redo_post=[], persistent=lambda f: f,
+)
+
+
+class _Timers:
+    def __init__(self):
+        self.registered = []
+
+    def register(self, function, first_interval=0.0, persistent=False):
+        self.registered.append(function)
+
+    def unregister(self, function):
+        if function in self.registered:
+            self.registered.remove(function)
+
+    def is_registered(self, function):
+        return function in self.registered
+
+
+def _new_module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+
+def install():
+    """Install the fake modules into sys.modules and return the bpy module."""
+    if "bpy" in sys.modules and getattr(sys.modules["bpy"], "__fake__", False):
+        return sys.modules["bpy"]
+
+    bpy_types = _new_module(
+        "bpy.types",
+        Operator=_rna_type("Operator", _StructBase),
+        Panel=_rna_type("Panel", _StructBase),
+        Menu=_rna_type("Menu", _StructBase),
+        UIList=_rna_type("UIList", _StructBase),
+        AddonPreferences=_rna_type("AddonPreferences", _StructBase),
+        PropertyGroup=_rna_type("PropertyGroup", _StructBase),
+        SpaceView3D=_rna_type("SpaceView3D"),
+        Scene=Scene,
+        Object=Object,
+        Action=Action,
+        Mesh=Mesh,
+        Material=Material,
+        WindowManager=_rna_type("WindowManager"),
+    )
+    bpy_types.SpaceView3D.draw_handler_add = staticmethod(lambda *args: object())
+    bpy_types.SpaceView3D.draw_handler_remove = staticmethod(lambda *args: None)
+
+    property_names = ("StringProperty", "IntProperty", "FloatProperty", "BoolProperty",
+                      "EnumProperty", "CollectionProperty", "PointerProperty",
+                      "FloatVectorProperty", "IntVectorProperty")
+    bpy_props = _new_module("bpy.props", **{name: _make_property(name) for name in property_names})
+
+    handlers = sys.modules["bpy.app.handlers"] = bpy_app_handlers
+    timers = _Timers()
+    timers_module = _new_module("bpy.app.timers", register=timers.register,
+                                unregister=timers.unregister, is_registered=timers.is_registered,
+                                registered=timers.registered)
+    app = _new_module("bpy.app", version=(4, 2, 0), handlers=handlers, timers=timers_module,
+                      background=True)
+
+    utils = _new_module("bpy.utils", register_class=lambda cls: None,
+                        unregister_class=lambda cls: None,
+                        user_resource=lambda kind, path="", create=False: path)
+    msgbus = _new_module("bpy.msgbus", subscribe_rna=lambda **kw: None,
+                         clear_by_owner=lambda owner: None)
+
+    bpy = _new_module("bpy", types=bpy_types, props=bpy_props, app=app, utils=utils,
+                      msgbus=msgbus, data=bpy_data, context=bpy_context,
+                      ops=types.SimpleNamespace(), __fake__=True)
+
+    kdtree = _new_module("mathutils.kdtree", KDTree=KDTree)
+    _new_module("mathutils", Vector=Vector, Matrix=Matrix, Quaternion=Quaternion, kdtree=kdtree)
+
+    noop = lambda *args, **kwargs: None
+    _new_module("blf", size=noop, color=noop, position=noop, draw=noop, enable=noop,
+                disable=noop, shadow=noop, shadow_offset=noop,
+                dimensions=lambda font_id, text: (7.0 * len(text), 12.0), SHADOW=1)
+
+    view3d_utils = _new_module("bpy_extras.view3d_utils",
+                               location_3d_to_region_2d=lambda region, rv3d, co, default=None: default)
+    _new_module("bpy_extras", view3d_utils=view3d_utils)
+    return bpy
+
+
+def reset_data():
+    """Discard all synthetic data, keeping the installed modules."""
+    fresh = BlendData()
+    bpy_data.__dict__.update(fresh.__dict__)
+    _scenes.clear()
+    scene = bpy_data.scenes.new("Scene")
+    _scenes.append(scene)
+    bpy_context.__dict__.clear()
+    bpy_context.scene = scene
+    bpy_context.collection = scene.collection
+    bpy_context.selected_objects = []
+    bpy_context.active_object = None
+    bpy_context.object = None
+    bpy_context.window_manager = WindowManager()
+    bpy_context.screen = types.SimpleNamespace(areas=[])
+    bpy_context.area = None
+    bpy_context.region = None
+    return scene
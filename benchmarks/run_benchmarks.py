@@ -0,0 +1,254 @@
+"""Headless performance benchmarks for AutoLMbyAman.
+
+Runs the addon against the fake bpy modules in fake_bpy.py on synthetic
+scenes, so no Blender installation is needed:
+
+    python benchmarks/run_benchmarks.py --labels 2000 --markers 500 --keyframes 50
+    python benchmarks/run_benchmarks.py --output results.json --baseline benchmarks/baseline.json
+
+Each benchmark reports the best and median wall time over --repeat runs and
+the peak traced allocation of one extra run. With --baseline, medians and
+peaks are compared against the stored results and the script exits with
+status 1 when any benchmark is slower (or larger) than the baseline by more
+than --tolerance. --update-baseline rewrites the baseline from this run;
+baselines are machine specific, so regenerate them on the machine that
+runs the comparison.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+import fake_bpy  # noqa: E402
+
+bpy = fake_bpy.install()
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import scenes  # noqa: E402
+
+TYPO_DESCRIPTIONS = (
+    "mitochondira in the cel membrane",
+    "golgi aparatus and ribosme",
+    "endoplasmic reticulm near the nucleas",
+    "chloroplst inside the cell wal",
+    "lysosme vesicle protien",
+)
+
+
+class Benchmark:
+    """One timed scenario: setup() builds state outside the timing, run() is measured."""
+
+    def __init__(self, name, setup, run):
+        self.name = name
+        self.setup = setup
+        self.run = run
+
+
+def build_benchmarks(addon, args):
+    context = bpy.context
+
+    def scene_setup():
+        scenes.build_scene(args.labels, args.markers, args.keyframes)
+        # The synthetic scenes store label data the old way; move it to the store as loading a file would
+        addon.label_store.migrate_label_data(bpy.context.scene)
+        bpy.data.filepath = os.path.join(args.workdir, "benchmark.blend")
+
+    def suggester_setup():
+        scene_setup()
+        suggester = addon.suggester.DescriptionSuggester()
+        for obj in bpy.data.objects:
+            data = addon.label_store.get_label_data(obj)
+            if data is not None:
+                suggester.add_description(data["description"])
+        return suggester
+
+    def run_check_description(suggester):
+        # Every repeat checks cold; otherwise all runs after the first only time suggestion cache hits
+        suggester._suggestion_cache.clear()
+        for description in TYPO_DESCRIPTIONS:
+            suggester.check_description(description)
+
+    def run_operator(operator_class, **properties):
+        def run(_):
+            operator = operator_class(**properties)
+            result = operator.execute(context)
+            if result != {'FINISHED'}:
+                raise RuntimeError(f"{operator_class.__name__} returned {result}: {operator.reports}")
+        return run
+
+    return [
+        Benchmark("check_description", suggester_setup, run_check_description),
+        Benchmark("export_data", scene_setup, run_operator(addon.operators.DOT_OT_export_data)),
+        Benchmark("get_next_label_number", scene_setup, lambda _: addon.labels.get_next_label_number()),
+        Benchmark("sync_markers_to_data", scene_setup, run_operator(addon.operators.DOT_OT_sync_markers_to_data)),
+        Benchmark("shift_animation", scene_setup, run_operator(addon.operators.DOT_OT_shift_animation, frame_offset=5)),
+    ]
+
+
+def measure(benchmark, repeat):
+    times = []
+    # The operators print progress per object; keep it out of the terminal but inside the timing
+    with contextlib.redirect_stdout(io.StringIO()):
+        state = benchmark.setup()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            benchmark.run(state)
+            times.append(time.perf_counter() - start)
+
+        state = benchmark.setup()
+        tracemalloc.start()
+        benchmark.run(state)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "peak_kib": peak / 1024.0,
+    }
+
+
+ENABLE_SNIPPET = """
+import sys, time
+sys.path.insert(0, {bench_dir!r})
+import fake_bpy
+fake_bpy.install()
+fake_bpy.reset_data()
+sys.path.insert(0, {repo_dir!r})
+start = time.perf_counter()
+import AutoLMbyAman
+AutoLMbyAman.register()
+elapsed = time.perf_counter() - start
+try:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+except ImportError:
+    peak = 0
+print(elapsed, peak)
+"""
+
+
+def measure_addon_enable(repeat):
+    """Time a cold import + register() of the addon, each run in a fresh interpreter.
+
+    The peak is the child's maximum resident set size, interpreter included.
+    """
+    snippet = ENABLE_SNIPPET.format(bench_dir=BENCH_DIR, repo_dir=os.path.dirname(BENCH_DIR))
+    times = []
+    peak = 0
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", snippet], check=True, capture_output=True,
+                                text=True, cwd=tempfile.gettempdir()).stdout
+        elapsed, run_peak = output.strip().splitlines()[-1].split()
+        times.append(float(elapsed))
+        peak = max(peak, int(run_peak))
+    return {
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "peak_kib": peak / 1024.0,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of human-readable regressions against the baseline results."""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get("results", {}).get(name)
+        if not reference:
+            continue
+        for key in ("median_s", "peak_kib"):
+            if reference.get(key) and result[key] > reference[key] * (1.0 + tolerance):
+                regressions.append(
+                    f"{name}.{key}: {result[key]:.4g} vs baseline {reference[key]:.4g} "
+                    f"(+{(result[key] / reference[key] - 1.0) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--labels", type=int, default=1000, help="label/dot pairs in the synthetic scene")
+    parser.add_argument("--markers", type=int, default=250, help="labels that get linked timeline markers")
+    parser.add_argument("--keyframes", type=int, default=20, help="scale keyframes per animated dot")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument("--only", action="append", help="run only the named benchmark (repeatable)")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--baseline", help="compare against this JSON results file")
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite --baseline with these results")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        args.workdir = workdir
+        # The suggester reads and writes description_data.json in the working directory
+        previous_cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                import AutoLMbyAman as addon
+                # Loaded on first use by the addon itself
+                import AutoLMbyAman.suggester  # noqa: F401
+                # Install the scene properties the operators read, as enabling the addon would
+                fake_bpy.reset_data()
+                addon.register()
+            results = {}
+            if not args.only or "addon_enable" in args.only:
+                results["addon_enable"] = measure_addon_enable(max(args.repeat, 5))
+            for benchmark in build_benchmarks(addon, args):
+                if args.only and benchmark.name not in args.only:
+                    continue
+                results[benchmark.name] = measure(benchmark, args.repeat)
+            for name, result in results.items():
+                print(f"{name:<24} median {result['median_s'] * 1000:9.2f} ms   "
+                      f"min {result['min_s'] * 1000:9.2f} ms   peak {result['peak_kib']:10.1f} KiB")
+        finally:
+            os.chdir(previous_cwd)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "labels": args.labels,
+            "markers": args.markers,
+            "keyframes": args.keyframes,
+            "repeat": args.repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline and args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+    elif args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if any(baseline["meta"].get(key) != report["meta"][key] for key in ("labels", "markers", "keyframes")):
+            print("Warning: baseline was recorded with different scene sizes")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("Performance regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
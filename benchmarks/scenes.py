@@ -0,0 +1,75 @@
+"""Synthetic scenes for the benchmark harness.
+
+Builds label/dot pairs the way DOT_OT_create_label does, plus linked
+timeline markers and scale keyframes, directly on the fake bpy data model.
+"""
+
+import random
+
+import fake_bpy
+
+
+DESCRIPTION_WORDS = (
+    "cell", "nucleus", "membrane", "mitochondria", "ribosome", "cytoplasm", "vacuole",
+    "chloroplast", "golgi", "apparatus", "reticulum", "endoplasmic", "lysosome", "wall",
+    "matrix", "protein", "enzyme", "organelle", "vesicle", "cilia", "flagellum",
+)
+
+
+def build_scene(labels, markers, keyframes, shared_actions=8, seed=1):
+    """Populate a fresh fake scene.
+
+    labels: number of label/dot pairs
+    markers: number of labels that also get linked _start/_end timeline markers
+    keyframes: scale keyframes per animated dot
+    shared_actions: every other dot uses one of this many shared actions
+    """
+    rng = random.Random(seed)
+    scene = fake_bpy.reset_data()
+    data = fake_bpy.bpy_data
+    material = data.materials.new("mat-labelmat")
+
+    actions = []
+    for i in range(max(1, shared_actions)):
+        actions.append(_make_action(data, f"SharedScale.{i:03d}", rng, keyframes))
+
+    for i in range(1, labels + 1):
+        start = rng.randint(0, 2000)
+        end = start + rng.randint(10, 200)
+        description = " ".join(rng.choice(DESCRIPTION_WORDS) for _ in range(rng.randint(1, 4)))
+        label_data = {"description": description, "animdata": f"{start}-{end}"}
+
+        label = data.objects.new(f"label-{i:03d}", data.meshes.new("Cube.label.mesh"))
+        label.data.materials.append(material)
+        label.location = fake_bpy.Vector((rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(0, 5)))
+        label.show_name = True
+        label["dot_label_data"] = label_data
+
+        dot = data.objects.new(f"dot-{i:03d}", data.meshes.new("Icosphere.dot.mesh"))
+        dot.data.materials.append(material)
+        dot.location = label.location.copy()
+        dot.show_name = True
+        dot["dot_label_data"] = label_data
+        if i % 2:
+            dot.animation_data = fake_bpy.AnimData(actions[i % len(actions)])
+        elif keyframes:
+            dot.animation_data = fake_bpy.AnimData(_make_action(data, f"Scale.{i:03d}", rng, keyframes))
+
+        scene.collection.objects.link(label)
+        scene.collection.objects.link(dot)
+
+        if i <= markers:
+            start_marker = scene.timeline_markers.new(f"{label.name}_start", frame=start + rng.randint(-5, 5))
+            start_marker["dot_label_name"] = label.name
+            end_marker = scene.timeline_markers.new(f"{label.name}_end", frame=end + rng.randint(-5, 5))
+            end_marker["dot_label_name"] = label.name
+
+    return scene
+
+
+def _make_action(data, name, rng, keyframes):
+    action = data.actions.new(name)
+    start = rng.randint(0, 1000)
+    frames = [start + 2 * k for k in range(keyframes)]
+    action.fcurves = [fake_bpy.FCurve("scale", axis, frames) for axis in range(3)]
+    return action